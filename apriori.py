@@ -1,13 +1,90 @@
-from typing import Set
+import logging
+import random
+from collections.abc import Sequence
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import chain, combinations, islice
+from math import comb
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
+from classes.apriori_statistics import AprioriStatistics
 from classes.dataset import Dataset
+from classes.dataset_profile import DatasetProfile
+from classes.item import Item
 from classes.itemset import Itemset
+from classes.itemset_count_table import ItemsetCountTable
 from classes.itemsets_with_occurrence_counts import ItemsetsWithOccurrenceCounts
-from itertools import combinations  
+from classes.transaction import Transaction
+from classes.apriori_tid_index import AprioriTidIndex
+from classes.candidate_hash_tree import CandidateHashTree
+from classes.bloom_filter import BloomFilter
+from classes.candidate_distribution_pool import CandidateDistributionPool
+from classes.candidate_prefix_trie import CandidatePrefixTrie
+from classes.count_distribution_pool import CountDistributionPool
+from classes.tid_set_index import TIDSetIndex
+from classes.transaction_bitmap_index import TransactionBitmapIndex
+from classes.vertical_index import VerticalIndex
+
+logger = logging.getLogger(__name__)
 
 
 class Apriori:
-    def __init__(self, min_support: int = 2):
+    # The supported methods to count the occurrences of itemsets
+    COUNTING_METHODS = (
+        "scan",
+        "tid_set",
+        "bitmap",
+        "hash_tree",
+        "prefix_trie",
+        "apriori_tid",
+        "apriori_hybrid",
+        "subsets",
+        "auto",
+    )
+
+    # The counting methods that scan the (horizontal) transactions on every level
+    HORIZONTAL_COUNTING_METHODS = ("scan", "hash_tree", "prefix_trie", "subsets", "auto")
+
+    # The ways the work is split between the worker processes
+    PARALLEL_MODES = ("count_distribution", "candidate_distribution")
+
+    # The counting methods that use a vertical index of the dataset
+    VERTICAL_COUNTING_METHODS = ("tid_set", "bitmap")
+
+    # The counting methods that carry state from one level to the next (the covers of the itemset prefixes or the
+    # candidate-ID sets), so level 2 is not counted in the pair matrix for them
+    LEVEL_STATE_COUNTING_METHODS = ("tid_set", "bitmap", "apriori_tid", "apriori_hybrid")
+
+    # The estimated size (in bytes) of a candidate ID and of a candidate-ID set of a transaction
+    CANDIDATE_ID_SIZE = 64
+    CANDIDATE_ID_SET_SIZE = 216
+
+    # The estimated size (in bytes) of a candidate itemset, its occurrence count and its share of the counting structures
+    CANDIDATE_SIZE = 1024
+
+    # The estimated relative costs of the strategies of the "auto" counting method:
+    # checking one candidate against one transaction, enumerating one k-subset of a transaction
+    # and filtering one transaction item
+    SCAN_CHECK_COST = 2.0
+    SUBSET_ENUMERATION_COST = 1.3
+    ITEM_FILTER_COST = 0.5
+
+    def __init__(
+        self,
+        min_support: int = 2,
+        counting_method: str = "scan",
+        hash_tree_leaf_size: int = 8,
+        hash_tree_fan_out: int = 8,
+        pcy_bucket_count: int = 0,
+        pair_matrix_memory_limit: int = 64 * 1024 * 1024,
+        trim_dataset: bool = False,
+        apriori_tid_memory_limit: int = 256 * 1024 * 1024,
+        workers: int = 1,
+        parallel_mode: str = "count_distribution",
+        candidate_memory_limit: int = 0,
+        subset_filter_bits: int = 0,
+        keep_negative_border: bool = False,
+    ):
         """
         Initialize the Apriori algorithm with the a minimum (absolute) support.
 
@@ -15,13 +92,141 @@ class Apriori:
         min_support (int): The minimum (absolute) support. This parameter defines the minimum number
                            of occurrences an itemset must have to be considered frequent. Must be a positive integer.
                            Default value is 2.
+        counting_method (str): The method used to count the occurrences of the candidate itemsets.
+                               "scan" checks every candidate against every transaction.
+                               "tid_set" intersects the transaction-ID sets of the items (vertical counting).
+                               "bitmap" ANDs packed transaction bitmaps of the items (vertical counting).
+                               "hash_tree" pushes every transaction once through a hash tree of the candidates.
+                               "prefix_trie" walks every transaction once through a prefix trie of the candidates.
+                               "apriori_tid" replaces the transactions with the IDs of the contained candidates
+                               after the first scan and counts the next levels on these candidate-ID sets.
+                               "apriori_hybrid" counts with "prefix_trie" until the candidate-ID sets are expected
+                               to fit into apriori_tid_memory_limit and switches to "apriori_tid" afterwards.
+                               "subsets" enumerates the k-subsets of every transaction and looks them up.
+                               "auto" estimates the cost of "scan" and "subsets" on every level and picks the cheaper one.
+                               Default value is "scan".
+        hash_tree_leaf_size (int): The number of candidates a leaf of the hash tree can hold before it is split.
+                                   Must be a positive integer. Default value is 8.
+        hash_tree_fan_out (int): The number of children of an interior node of the hash tree.
+                                 Must be an integer greater than 1. Default value is 8.
+        pcy_bucket_count (int): The number of hash buckets for the PCY filter of the pair candidates.
+                                While the 1-itemsets are generated, every pair of every transaction is hashed
+                                into a bucket, and pair candidates in infrequent buckets are not counted.
+                                Must be a non-negative integer, 0 disables the filter. Default value is 0.
+        pair_matrix_memory_limit (int): The maximum size (in bytes) of the triangular matrix that counts all pairs of
+                                        frequent 1-itemsets. If the matrix fits (and the PCY filter is disabled), the
+                                        2-itemsets are counted in the matrix instead of as individual candidates.
+                                        The counting methods that carry state from one level to the next ("tid_set",
+                                        "bitmap", "apriori_tid" and "apriori_hybrid") count level 2 themselves.
+                                        Must be a non-negative integer, 0 disables the matrix. Default value is 64 MiB.
+        trim_dataset (bool): Whether the dataset should be shrunk after every level. Items that are not part of a
+                             frequent itemset of the level and transactions too short for a candidate of the next
+                             level are dropped. Only used by the horizontal counting methods. Default value is False.
+        apriori_tid_memory_limit (int): The memory (in bytes) the candidate-ID sets of the "apriori_hybrid" method
+                                        may use. Must be a non-negative integer. Default value is 256 MiB.
+        workers (int): The number of worker processes. Must be a positive integer. Default value is 1.
+        parallel_mode (str): How the work is split between more than one worker.
+                             "count_distribution" gives every worker a shard of the dataset on which it counts all
+                             candidates with the counting method, and the partial counts are summed. The pair matrix
+                             and the trimming of the dataset are not used then.
+                             "candidate_distribution" partitions the frequent 2-itemsets by their first item, and every
+                             worker generates and counts the longer candidates of its partition on the whole dataset.
+                             Default value is "count_distribution".
+        candidate_memory_limit (int): The memory (in bytes) the candidates of a level may use. If the limit is set,
+                                      the candidates are generated lazily in batches that fit into it, and every batch
+                                      is counted and pruned before the next one is generated (one more scan per batch).
+                                      Must be a non-negative integer, 0 disables the limit. Default value is 0.
+        subset_filter_bits (int): The number of bits per frequent itemset of a Bloom filter that replaces the set of
+                                  frequent itemsets in the subset check of the candidate generation. Only the subsets
+                                  that pass the filter are looked up exactly (by binary search in the sorted itemsets).
+                                  Must be a non-negative integer, 0 uses an exact set. Default value is 0.
+        keep_negative_border (bool): Whether the occurrence counts of the counted infrequent itemsets (the negative
+                                     border) should be kept in the infrequent_itemset_counts attribute, so that update
+                                     only has to rescan the fitted transactions for itemsets that were not counted.
+                                     The pair matrix then also keeps all pairs that occur. Default value is False.
         """
         # Ensure that the minimum support is a positive integer
         if not isinstance(min_support, int) or min_support < 1:
             raise ValueError("The minimum support must be a positive integer.")
 
+        # Ensure that the counting method is known
+        if counting_method not in self.COUNTING_METHODS:
+            raise ValueError(
+                f"The counting method must be one of: {', '.join(self.COUNTING_METHODS)}."
+            )
+
+        # Ensure that the hash tree can be built
+        if not isinstance(hash_tree_leaf_size, int) or hash_tree_leaf_size < 1:
+            raise ValueError("The leaf size of the hash tree must be a positive integer.")
+        if not isinstance(hash_tree_fan_out, int) or hash_tree_fan_out < 2:
+            raise ValueError("The fan-out of the hash tree must be an integer greater than 1.")
+
+        # Ensure that the number of PCY buckets is valid
+        if not isinstance(pcy_bucket_count, int) or pcy_bucket_count < 0:
+            raise ValueError("The number of PCY buckets must be a non-negative integer.")
+
+        # Ensure that the memory limit of the pair matrix is valid
+        if not isinstance(pair_matrix_memory_limit, int) or pair_matrix_memory_limit < 0:
+            raise ValueError("The memory limit of the pair matrix must be a non-negative integer.")
+
+        # Ensure that the memory limit of the candidate-ID sets is valid
+        if not isinstance(apriori_tid_memory_limit, int) or apriori_tid_memory_limit < 0:
+            raise ValueError("The memory limit of the candidate-ID sets must be a non-negative integer.")
+
+        # Ensure that the memory limit of the candidates is valid
+        if not isinstance(candidate_memory_limit, int) or candidate_memory_limit < 0:
+            raise ValueError("The memory limit of the candidates must be a non-negative integer.")
+
+        # Ensure that the size of the subset filter is valid
+        if not isinstance(subset_filter_bits, int) or subset_filter_bits < 0:
+            raise ValueError("The number of bits of the subset filter must be a non-negative integer.")
+
+        # Ensure that the number of workers is valid
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("The number of workers must be a positive integer.")
+
+        # Ensure that the parallel mode is known
+        if parallel_mode not in self.PARALLEL_MODES:
+            raise ValueError(
+                f"The parallel mode must be one of: {', '.join(self.PARALLEL_MODES)}."
+            )
+
         self.min_support = min_support
+        self.counting_method = counting_method
+        self.hash_tree_leaf_size = hash_tree_leaf_size
+        self.hash_tree_fan_out = hash_tree_fan_out
+        self.pcy_bucket_count = pcy_bucket_count
+        self.pair_matrix_memory_limit = pair_matrix_memory_limit
+        self.trim_dataset = trim_dataset
+        self.apriori_tid_memory_limit = apriori_tid_memory_limit
+        self.workers = workers
+        self.parallel_mode = parallel_mode
+        self.candidate_memory_limit = candidate_memory_limit
+        self.subset_filter_bits = subset_filter_bits
+        self.keep_negative_border = keep_negative_border
         self.frequent_itemsets = set()
+        self.frequent_itemset_counts = ItemsetsWithOccurrenceCounts(set())
+        self.infrequent_itemset_counts = ItemsetsWithOccurrenceCounts(set())
+        self.statistics = AprioriStatistics()
+
+        # The transactions that were fitted (and updated) so far and whether every itemset of the negative border
+        # of the frequent itemsets that occurs in them is kept in infrequent_itemset_counts
+        self._fitted_transactions: Optional[List[Iterable[Transaction]]] = None
+        self._negative_border_complete = False
+
+        # The vertical index of the dataset that is currently fitted (only used by the vertical counting methods)
+        self._vertical_index = None
+
+        # The AprioriTid representation of the dataset that is currently fitted and whether the hybrid method uses it
+        self._apriori_tid_index = None
+        self._use_apriori_tid = False
+
+        # The profile of the dataset that is currently fitted (only used by the "auto" method)
+        self._dataset_profile = None
+        self._profiled_dataset = None
+
+        # The worker processes holding the shards of the dataset that is currently fitted (only used with workers)
+        self._count_distribution_pool = None
 
     def _generate_one_itemsets(self, dataset: Dataset) -> Set[Itemset]:
         """
@@ -39,6 +244,167 @@ class Apriori:
                 result.add(Itemset(frozenset({item})))
         return result
 
+    def _generate_one_itemsets_and_hash_pairs(
+        self, dataset: Dataset
+    ) -> Tuple[Set[Itemset], bytearray]:
+        """
+        Generate all 1-itemsets for the given dataset and hash all pairs of every transaction into buckets (PCY).
+
+        Parameters:
+        dataset (Dataset): The dataset for which the 1-itemsets should be generated.
+
+        Returns:
+        Tuple[Set[Itemset], bytearray]: A set containing all 1-itemsets that are contained in the dataset
+                                        and a bitmap with a set bit for every frequent bucket.
+        """
+        result = set()
+        bucket_counts = array("l", [0]) * self.pcy_bucket_count
+        for transaction in dataset.transactions:
+            item_hashes = []
+            for item in transaction.items:
+                result.add(Itemset(frozenset({item})))
+                item_hashes.append(hash(item))
+
+            # Hash every pair of the transaction into its bucket
+            for first_index in range(len(item_hashes)):
+                for second_index in range(first_index + 1, len(item_hashes)):
+                    bucket_counts[
+                        self._get_pair_bucket(
+                            item_hashes[first_index], item_hashes[second_index]
+                        )
+                    ] += 1
+
+        # Set the bit of every bucket that reaches the minimum support
+        frequent_buckets = bytearray((self.pcy_bucket_count + 7) // 8)
+        for bucket, count in enumerate(bucket_counts):
+            if count >= self.min_support:
+                frequent_buckets[bucket >> 3] |= 1 << (bucket & 7)
+        return result, frequent_buckets
+
+    def _get_pair_bucket(self, item_hash: int, other_item_hash: int) -> int:
+        """
+        Get the PCY bucket of a pair of items. The bucket does not depend on the order of the items.
+
+        Parameters:
+        item_hash (int): The hash of the first item.
+        other_item_hash (int): The hash of the second item.
+
+        Returns:
+        int: The bucket of the pair.
+        """
+        return (item_hash + other_item_hash) % self.pcy_bucket_count
+
+    def _prune_pair_candidates_with_frequent_buckets(
+        self, candidates: Set[Itemset], frequent_buckets: bytearray
+    ) -> Set[Itemset]:
+        """
+        Prune the pair candidates that are hashed into an infrequent bucket (PCY).
+        A pair in an infrequent bucket occurs in fewer transactions than the bucket count, so it cannot be frequent.
+
+        Parameters:
+        candidates (Set[Itemset]): The pair candidates.
+        frequent_buckets (bytearray): A bitmap with a set bit for every frequent bucket.
+
+        Returns:
+        Set[Itemset]: The pair candidates in frequent buckets.
+        """
+        result = set()
+        for candidate in candidates:
+            first_item, second_item = candidate.items
+            bucket = self._get_pair_bucket(hash(first_item), hash(second_item))
+            if frequent_buckets[bucket >> 3] & (1 << (bucket & 7)):
+                result.add(candidate)
+
+        # Report the number of pruned pair candidates
+        self.statistics.pruned_pair_candidates += len(candidates) - len(result)
+        logger.info(
+            "PCY filter pruned %d of %d pair candidates.",
+            len(candidates) - len(result),
+            len(candidates),
+        )
+        return result
+
+    def _get_pair_matrix_size(self, item_count: int) -> int:
+        """
+        Get the size (in bytes) of the triangular matrix that counts all pairs of the given number of items.
+
+        Parameters:
+        item_count (int): The number of (frequent) items.
+
+        Returns:
+        int: The size of the triangular pair matrix in bytes.
+        """
+        return item_count * (item_count - 1) // 2 * array("I").itemsize
+
+    def _fits_pair_matrix(self, item_count: int) -> bool:
+        """
+        Check whether the triangular matrix for all pairs of the given number of items fits into the memory limit.
+        Counting methods that carry state from one level to the next do not use the matrix, as the state of the
+        pairs would be missing on level 3.
+
+        Parameters:
+        item_count (int): The number of (frequent) items.
+
+        Returns:
+        bool: True if the matrix can be used, is not empty and fits into the memory limit, False otherwise
+        """
+        if self.counting_method in self.LEVEL_STATE_COUNTING_METHODS:
+            return False
+        return 0 < self._get_pair_matrix_size(item_count) <= self.pair_matrix_memory_limit
+
+    def _count_frequent_pairs_with_triangular_matrix(
+        self, dataset: Dataset, frequent_one_itemsets: Set[Itemset]
+    ) -> ItemsetsWithOccurrenceCounts:
+        """
+        Count all pairs of the given frequent 1-itemsets with a single scan in an upper-triangular count matrix.
+        The pairs are not materialized as candidate itemsets, only the frequent pairs are read off the matrix.
+
+        Parameters:
+        dataset (Dataset): The dataset for which the pair occurrences should be counted.
+        frequent_one_itemsets (Set[Itemset]): The frequent 1-itemsets.
+
+        Returns:
+        ItemsetsWithOccurrenceCounts: A dictionary containing the frequent 2-itemsets (and all occurring 2-itemsets if
+                                      the negative border is kept) as keys and their occurrence counts as values.
+        """
+        # Rank the frequent items by their name
+        items = sorted(
+            (next(iter(itemset.items)) for itemset in frequent_one_itemsets),
+            key=lambda item: item.name,
+        )
+        item_ranks = {item: rank for rank, item in enumerate(items)}
+        item_count = len(items)
+
+        # The pair (i, j) with i < j is stored at row_offsets[i] + j - i - 1
+        row_offsets = [
+            rank * (2 * item_count - rank - 1) // 2 for rank in range(item_count)
+        ]
+        pair_counts = array("I", [0]) * (item_count * (item_count - 1) // 2)
+
+        # Count all pairs of frequent items of every transaction
+        for transaction in dataset.transactions:
+            ranks = sorted(
+                item_ranks[item] for item in transaction.items if item in item_ranks
+            )
+            for first_index, first_rank in enumerate(ranks):
+                offset = row_offsets[first_rank] - first_rank - 1
+                for second_rank in ranks[first_index + 1 :]:
+                    pair_counts[offset + second_rank] += 1
+
+        # Read the frequent pairs (and the occurring infrequent pairs if the negative border is kept) off the matrix
+        result = ItemsetsWithOccurrenceCounts(set())
+        min_count = 1 if self.keep_negative_border else self.min_support
+        for index in [
+            index for index, count in enumerate(pair_counts) if count >= min_count
+        ]:
+            first_rank = bisect_right(row_offsets, index) - 1
+            second_rank = index - row_offsets[first_rank] + first_rank + 1
+            result.set_occurrence_count(
+                Itemset(frozenset({items[first_rank], items[second_rank]})),
+                pair_counts[index],
+            )
+        return result
+
     def _count_occurrences_of_itemsets(
         self, dataset: Dataset, itemsets: Set[Itemset]
     ) -> ItemsetsWithOccurrenceCounts:
@@ -50,16 +416,339 @@ class Apriori:
         itemsets (Set[Itemset]): The itemsets for which the occurrences should be counted.
                                 The itemsets do not need to be present in the dataset.
 
+        Returns:
+        ItemsetsWithOccurrenceCounts: A dictionary containing the itemsets as keys and their occurrence counts as values.
+        """
+        # Let the workers count on their shards with the counting method
+        if self._count_distribution_pool is not None:
+            self.statistics.counting_methods.append(self.counting_method)
+            return self._count_distribution_pool.count_occurrences_of_itemsets(itemsets)
+
+        # Select the method to count with and report it
+        counting_method = self._select_counting_method(dataset, itemsets)
+        self.statistics.counting_methods.append(counting_method)
+
+        if counting_method in self.VERTICAL_COUNTING_METHODS:
+            # Count with a vertical index
+            result = self._get_vertical_index(dataset).count_occurrences_of_itemsets(itemsets)
+        elif counting_method == "hash_tree":
+            # Count with hash trees
+            result = self._count_occurrences_with_hash_trees(dataset, itemsets)
+        elif counting_method == "prefix_trie":
+            # Count with a prefix trie
+            result = CandidatePrefixTrie(itemsets).count_occurrences_in_dataset(dataset)
+        elif counting_method == "apriori_tid":
+            # Count on the candidate-ID sets of the transactions
+            result = self._get_apriori_tid_index(dataset).count_occurrences_of_itemsets(itemsets)
+        elif counting_method == "subsets":
+            # Look up the subsets of every transaction
+            result = self._count_occurrences_by_enumerating_subsets(dataset, itemsets)
+        else:
+            # Check every itemset against every transaction
+            result = ItemsetsWithOccurrenceCounts(itemsets)
+            for itemset in itemsets:
+                count = 0
+                for transaction in dataset.transactions:
+                    if itemset.items.issubset(transaction.items):
+                        count += 1
+                result.set_occurrence_count(itemset, count)
+
+        # Switch to AprioriTid once the candidate-ID sets of the next level are expected to fit into memory
+        if self.counting_method == "apriori_hybrid" and counting_method != "apriori_tid":
+            estimated_size = self._estimate_candidate_id_sets_size(result, len(dataset.transactions))
+            if estimated_size <= self.apriori_tid_memory_limit:
+                logger.info(
+                    "Switching to AprioriTid: the candidate-ID sets need about %d bytes.",
+                    estimated_size,
+                )
+                self._use_apriori_tid = True
+        return result
+
+    def _select_counting_method(self, dataset: Dataset, itemsets: Set[Itemset]) -> str:
+        """
+        Select the method to count the occurrences of the current itemsets with.
+
+        Parameters:
+        dataset (Dataset): The dataset for which the itemset occurrences should be counted.
+        itemsets (Set[Itemset]): The itemsets for which the occurrences should be counted.
+
+        Returns:
+        str: The selected counting method.
+        """
+        # The hybrid method counts with a prefix trie until it switches to AprioriTid
+        if self.counting_method == "apriori_hybrid":
+            return "apriori_tid" if self._use_apriori_tid else "prefix_trie"
+
+        # The adaptive method picks the cheaper strategy for the current level
+        if self.counting_method == "auto":
+            scan_cost, subsets_cost = self._estimate_counting_costs(dataset, itemsets)
+            counting_method = "scan" if scan_cost <= subsets_cost else "subsets"
+            logger.info(
+                "Counting %d candidates with %s (estimated costs: scan %.3g, subsets %.3g).",
+                len(itemsets),
+                counting_method,
+                scan_cost,
+                subsets_cost,
+            )
+            return counting_method
+        return self.counting_method
+
+    def _estimate_counting_costs(
+        self, dataset: Dataset, itemsets: Set[Itemset]
+    ) -> Tuple[float, float]:
+        """
+        Estimate the costs of counting the given itemsets by scanning and by enumerating subsets.
+
+        Scanning checks every candidate against every transaction.
+        Enumerating filters every transaction to the candidate items and looks up all of its k-subsets.
+        A transaction of length l keeps every item with the probability d (the density of the candidate items),
+        so it has C(l, k) * d^k k-subsets on average.
+
+        Parameters:
+        dataset (Dataset): The dataset for which the itemset occurrences should be counted.
+        itemsets (Set[Itemset]): The itemsets for which the occurrences should be counted.
+
+        Returns:
+        Tuple[float, float]: The estimated costs of scanning and of enumerating subsets.
+        """
+        profile = self._get_dataset_profile(dataset)
+        scan_cost = self.SCAN_CHECK_COST * len(itemsets) * len(dataset.transactions)
+
+        # The share of item occurrences that belong to candidate items
+        item_occurrence_count = profile.get_item_occurrence_count()
+        candidate_items = {item for itemset in itemsets for item in itemset.items}
+        density = (
+            sum(profile.item_counts.get(item, 0) for item in candidate_items)
+            / item_occurrence_count
+            if item_occurrence_count
+            else 0.0
+        )
+
+        subsets_cost = self.ITEM_FILTER_COST * item_occurrence_count
+        for length in {len(itemset.items) for itemset in itemsets}:
+            subsets_cost += (
+                self.SUBSET_ENUMERATION_COST
+                * density**length
+                * sum(
+                    comb(transaction_length, length) * count
+                    for transaction_length, count in profile.transaction_length_counts.items()
+                )
+            )
+        return scan_cost, subsets_cost
+
+    def _get_dataset_profile(self, dataset: Dataset) -> DatasetProfile:
+        """
+        Get the profile of the given dataset. The profile is only computed once per dataset.
+
+        Parameters:
+        dataset (Dataset): The dataset for which the profile should be returned.
+
+        Returns:
+        DatasetProfile: The profile of the dataset.
+        """
+        if self._profiled_dataset is not dataset:
+            self._dataset_profile = DatasetProfile.from_dataset(dataset)
+            self._profiled_dataset = dataset
+        return self._dataset_profile
+
+    def _count_occurrences_by_enumerating_subsets(
+        self, dataset: Dataset, itemsets: Set[Itemset]
+    ) -> ItemsetsWithOccurrenceCounts:
+        """
+        Count the occurrences of the given itemsets by looking up every k-subset of every transaction.
+
+        Parameters:
+        dataset (Dataset): The dataset for which the itemset occurrences should be counted.
+        itemsets (Set[Itemset]): The itemsets for which the occurrences should be counted.
+
+        Returns:
+        ItemsetsWithOccurrenceCounts: A dictionary containing the itemsets as keys and their occurrence counts as values.
+        """
+        # Number the itemsets and index their IDs by their items
+        count_table = ItemsetCountTable(itemsets)
+        itemset_ids = {itemset.items: itemset_id for itemset_id, itemset in enumerate(count_table.itemsets)}
+        candidate_items = {item for itemset in itemsets for item in itemset.items}
+        lengths = {len(itemset.items) for itemset in itemsets}
+
+        for transaction in dataset.transactions:
+            # Items that are not part of any candidate are irrelevant
+            items = [item for item in transaction.items.items if item in candidate_items]
+            for length in lengths:
+                # Count the subsets that are candidates
+                contained_items = itemset_ids.keys() & map(frozenset, combinations(items, length))
+                count_table.add_occurrences(map(itemset_ids.__getitem__, contained_items))
+
+        return count_table.to_itemsets_with_occurrence_counts()
+
+    def _estimate_candidate_id_sets_size(
+        self, itemsets_with_occurrence_counts: ItemsetsWithOccurrenceCounts, transaction_count: int
+    ) -> int:
+        """
+        Estimate the size of the candidate-ID sets of the next level (as proposed for Apriori-Hybrid).
+        Every occurrence of a candidate of the current level is expected to lead to one candidate ID.
+
+        Parameters:
+        itemsets_with_occurrence_counts (ItemsetsWithOccurrenceCounts): The counted itemsets of the current level.
+        transaction_count (int): The number of transactions.
+
+        Returns:
+        int: The estimated size of the candidate-ID sets in bytes.
+        """
+        entry_count = sum(itemsets_with_occurrence_counts.values())
+        return (
+            entry_count * self.CANDIDATE_ID_SIZE
+            + transaction_count * self.CANDIDATE_ID_SET_SIZE
+        )
+
+    def _get_apriori_tid_index(self, dataset: Dataset) -> AprioriTidIndex:
+        """
+        Get the AprioriTid representation of the given dataset. The dataset is only scanned once.
+
+        Parameters:
+        dataset (Dataset): The dataset for which the representation should be returned.
+
+        Returns:
+        AprioriTidIndex: The AprioriTid representation of the dataset.
+        """
+        if self._apriori_tid_index is None or self._apriori_tid_index.dataset is not dataset:
+            self._apriori_tid_index = AprioriTidIndex(dataset, self.min_support)
+        return self._apriori_tid_index
+
+    def _count_occurrences_with_hash_trees(
+        self, dataset: Dataset, itemsets: Set[Itemset]
+    ) -> ItemsetsWithOccurrenceCounts:
+        """
+        Count the occurrences of the given itemsets by pushing every transaction through a hash tree of the itemsets.
+        A hash tree only holds itemsets of the same length, so one tree is built per itemset length.
+
+        Parameters:
+        dataset (Dataset): The dataset for which the itemset occurrences should be counted.
+        itemsets (Set[Itemset]): The itemsets for which the occurrences should be counted.
+
         Returns:
         ItemsetsWithOccurrenceCounts: A dictionary containing the itemsets as keys and their occurrence counts as values.
         """
         result = ItemsetsWithOccurrenceCounts(itemsets)
+
+        # Group the itemsets by their length
+        itemsets_by_length = dict()
         for itemset in itemsets:
-            count = 0
-            for transaction in dataset.transactions:
-                if itemset.items.issubset(transaction.items):
-                    count += 1
-            result.set_occurrence_count(itemset, count)
+            itemsets_by_length.setdefault(len(itemset.items), set()).add(itemset)
+
+        for length, itemsets_of_length in itemsets_by_length.items():
+            # The empty itemset is contained in every transaction
+            if length == 0:
+                for itemset in itemsets_of_length:
+                    result.set_occurrence_count(itemset, len(dataset.transactions))
+                continue
+
+            hash_tree = CandidateHashTree(
+                itemsets_of_length, self.hash_tree_leaf_size, self.hash_tree_fan_out
+            )
+            result.update(hash_tree.count_occurrences_in_dataset(dataset))
+        return result
+
+    def _get_vertical_index(self, dataset: Dataset) -> VerticalIndex:
+        """
+        Get the vertical index of the given dataset. The index is only built once per dataset.
+
+        Parameters:
+        dataset (Dataset): The dataset for which the index should be returned.
+
+        Returns:
+        VerticalIndex: The vertical index of the dataset (matching the counting method).
+        """
+        if self._vertical_index is None or self._vertical_index.dataset is not dataset:
+            if self.counting_method == "bitmap":
+                self._vertical_index = TransactionBitmapIndex(dataset, self.min_support)
+            else:
+                self._vertical_index = TIDSetIndex(dataset, self.min_support)
+        return self._vertical_index
+
+    def _trim_dataset(
+        self,
+        dataset: Dataset,
+        frequent_itemsets: Set[Itemset],
+        next_length: int,
+    ) -> Dataset:
+        """
+        Shrink the dataset to what is needed to count the candidates of the next level.
+        Items that are not part of any of the given frequent itemsets cannot be part of a candidate, and
+        transactions with fewer remaining items than the next length cannot contain a candidate.
+        If the dataset was profiled, the profile is trimmed along with it, so the "auto" counting method
+        profiles the dataset only once per fit.
+
+        Parameters:
+        dataset (Dataset): The dataset of the current level.
+        frequent_itemsets (Set[Itemset]): The frequent itemsets of the current level.
+        next_length (int): The length of the candidates of the next level.
+
+        Returns:
+        Dataset: The dataset for the next level. Its transactions are kept in a tuple, because transactions
+                 that become equal by trimming still have to be counted separately.
+        """
+        surviving_items = {item for itemset in frequent_itemsets for item in itemset.items}
+
+        # The profile of the dataset (if one was computed) is carried over instead of profiling every level again
+        update_profile = self._profiled_dataset is dataset
+        transaction_length_counts = dict()
+
+        transactions = []
+        for transaction in dataset.transactions:
+            # Transactions that are too short even before trimming are skipped without being inspected
+            length = len(transaction.items.items)
+            if length < next_length:
+                continue
+
+            items = transaction.items.items & surviving_items
+            if len(items) < next_length:
+                continue
+
+            # Only rewrite the transactions that lost items
+            if len(items) < length:
+                transaction = Transaction(transaction.id, Itemset(frozenset(items)))
+            transactions.append(transaction)
+            if update_profile:
+                transaction_length_counts[len(items)] = transaction_length_counts.get(len(items), 0) + 1
+
+        trimmed_dataset = Dataset(tuple(transactions))
+        if update_profile:
+            self._dataset_profile = self._dataset_profile.trim(surviving_items, transaction_length_counts)
+            self._profiled_dataset = trimmed_dataset
+        return trimmed_dataset
+
+    def _keep_infrequent_itemset_counts(
+        self,
+        itemsets_with_occurrence_counts: ItemsetsWithOccurrenceCounts,
+    ):
+        """
+        Keep the occurrence counts of the given itemsets that occur, but are below the minimum support.
+        Itemsets that do not occur at all are not kept (their count is known to be 0).
+
+        Parameters:
+        itemsets_with_occurrence_counts (ItemsetsWithOccurrenceCounts): A dictionary containing the itemsets as keys and their occurrence counts as values.
+        """
+        for itemset, count in itemsets_with_occurrence_counts.items():
+            if 0 < count < self.min_support:
+                self.infrequent_itemset_counts.set_occurrence_count(itemset, count)
+
+    def _get_frequent_itemset_counts(
+        self,
+        itemsets_with_occurrence_counts: ItemsetsWithOccurrenceCounts,
+    ) -> ItemsetsWithOccurrenceCounts:
+        """
+        Get the itemsets that reach the minimum support together with their occurrence counts.
+
+        Parameters:
+        itemsets_with_occurrence_counts (ItemsetsWithOccurrenceCounts): A dictionary containing the itemsets as keys and their occurrence counts as values.
+
+        Returns:
+        ItemsetsWithOccurrenceCounts: The frequent itemsets with their occurrence counts.
+        """
+        result = ItemsetsWithOccurrenceCounts(set())
+        for itemset, count in itemsets_with_occurrence_counts.items():
+            if count >= self.min_support:
+                result.set_occurrence_count(itemset, count)
         return result
 
     def _prune_itemsets_below_min_support(
@@ -82,7 +771,7 @@ class Apriori:
         return result
 
     def _generate_candidate_itemsets(
-        self, frequent_itemsets: Set[Itemset]
+        self, frequent_itemsets: Set[Itemset], check_subsets_without_first_item: bool = True
     ) -> Set[Itemset]:
         """
         Generate length-k+1 candidate itemsets based on the given frequent itemsets.
@@ -90,48 +779,160 @@ class Apriori:
 
         Parameters:
         frequent_itemsets (Set[Itemset]): A set containing all frequent itemsets.
+        check_subsets_without_first_item (bool): Whether the subset without the first item (by name) has to be
+                                                 frequent. Disabled if the frequent itemsets only contain the ones
+                                                 with certain first items (candidate distribution). Default value is True.
 
         Returns:
         Set[Itemset]: A set containing all length-k+1 candidate itemsets.
         """
-        # If there are no frequent itemsets, return an empty set
+        return set(
+            self._iter_candidate_itemsets(frequent_itemsets, check_subsets_without_first_item)
+        )
+
+    def _iter_candidate_itemsets(
+        self, frequent_itemsets: Set[Itemset], check_subsets_without_first_item: bool = True
+    ) -> Iterator[Itemset]:
+        """
+        Lazily generate length-k+1 candidate itemsets based on the given frequent itemsets.
+        k is the length of the longest frequent itemset. Every candidate is generated exactly once.
+
+        Parameters:
+        frequent_itemsets (Set[Itemset]): A set containing all frequent itemsets.
+        check_subsets_without_first_item (bool): Whether the subset without the first item (by name) has to be
+                                                 frequent. Disabled if the frequent itemsets only contain the ones
+                                                 with certain first items (candidate distribution). Default value is True.
+
+        Returns:
+        Iterator[Itemset]: The length-k+1 candidate itemsets.
+        """
+        # If there are no frequent itemsets, there are no candidates
         if not frequent_itemsets:
-            return set()
+            return
 
         # Check if all itemsets have the same length
-        if not frequent_itemsets:
-            return set()
-        
         itemset_lengths = {len(itemset.items) for itemset in frequent_itemsets}
         if len(itemset_lengths) > 1:
             # If itemsets have different lengths, only use the longest ones
             max_length = max(itemset_lengths)
             frequent_itemsets = {itemset for itemset in frequent_itemsets if len(itemset.items) == max_length}
 
-        candidates = set()
-        frequent_itemsets_items = {itemset.items for itemset in frequent_itemsets}
-        frequent_list = list(frequent_itemsets)
-        
-        # Generate candidates by joining frequent itemsets
-        for i in range(len(frequent_list)):
-            for j in range(i + 1, len(frequent_list)):
-                set1 = frequent_list[i].items
-                set2 = frequent_list[j].items
-                union = set1.union(set2)
-                
-                # Only consider if the union has exactly one more item than the original itemsets
-                # Only proceed if union creates a (k+1)-itemset
-                if len(union) == len(set1) + 1:
+        # Encode the itemsets as tuples of item ranks (ranked by the item names)
+        items = sorted(
+            {item for itemset in frequent_itemsets for item in itemset.items},
+            key=lambda item: item.name,
+        )
+        item_ranks = {item: rank for rank, item in enumerate(items)}
+        frequent_tuples = sorted(
+            tuple(sorted(item_ranks[item] for item in itemset.items))
+            for itemset in frequent_itemsets
+        )
+        is_frequent_tuple = self._get_frequent_tuple_check(frequent_tuples)
+
+        group_start = 0
+        while group_start < len(frequent_tuples):
+            # The sorted tuples with the same (k-1)-prefix form a consecutive group
+            prefix = frequent_tuples[group_start][:-1]
+            group_end = group_start + 1
+            while group_end < len(frequent_tuples) and frequent_tuples[group_end][:-1] == prefix:
+                group_end += 1
+
+            # Join every pair of itemsets within the group
+            for i in range(group_start, group_end):
+                for j in range(i + 1, group_end):
+                    candidate = frequent_tuples[i] + frequent_tuples[j][-1:]
+
                     # Check that all (k)-subsets of the candidate are frequent
+                    # (the two subsets without one of the last two items are the joined itemsets)
                     all_subsets_frequent = all(
-                        frozenset(subset) in frequent_itemsets_items
-                        for subset in combinations(union, len(set1))
+                        is_frequent_tuple(candidate[:index] + candidate[index + 1 :])
+                        for index in range(0 if check_subsets_without_first_item else 1, len(candidate) - 2)
                     )
 
                     if all_subsets_frequent:
-                        candidates.add(Itemset(frozenset(union)))
+                        yield Itemset(frozenset(items[rank] for rank in candidate))
+
+            group_start = group_end
+
+    def _get_frequent_tuple_check(
+        self, frequent_tuples: List[Tuple[int, ...]]
+    ) -> Callable[[Tuple[int, ...]], bool]:
+        """
+        Get the membership check of the subset pruning for the given encoded frequent itemsets.
 
-        return candidates
+        Without a subset filter, the check looks the tuple up in a set of all frequent tuples.
+        With a subset filter, only the tuples that pass the Bloom filter are searched in the sorted list,
+        so the memory of the check drops to a few bits per frequent itemset.
+
+        Parameters:
+        frequent_tuples (List[Tuple[int, ...]]): The sorted frequent itemsets encoded as tuples of item ranks.
+
+        Returns:
+        Callable[[Tuple[int, ...]], bool]: A function that checks whether a tuple is frequent.
+        """
+        if not self.subset_filter_bits:
+            return set(frequent_tuples).__contains__
+
+        subset_filter = BloomFilter(len(frequent_tuples), self.subset_filter_bits)
+        for frequent_tuple in frequent_tuples:
+            subset_filter.add(frequent_tuple)
+        logger.debug(
+            "Checking the subsets of %d frequent itemsets with a %d byte Bloom filter.",
+            len(frequent_tuples),
+            subset_filter.get_size(),
+        )
+
+        def is_frequent_tuple(candidate_tuple: Tuple[int, ...]) -> bool:
+            # Confirm the survivors of the filter exactly
+            if candidate_tuple not in subset_filter:
+                return False
+            position = bisect_left(frequent_tuples, candidate_tuple)
+            return position < len(frequent_tuples) and frequent_tuples[position] == candidate_tuple
+
+        return is_frequent_tuple
+
+    def _count_candidates_in_batches(
+        self,
+        dataset: Dataset,
+        frequent_itemsets: Set[Itemset],
+        frequent_buckets: Optional[bytearray] = None,
+    ) -> ItemsetsWithOccurrenceCounts:
+        """
+        Generate the candidates of the next level in batches that fit into the candidate memory limit,
+        count every batch and only keep its frequent candidates.
+
+        Parameters:
+        dataset (Dataset): The dataset for which the candidate occurrences should be counted.
+        frequent_itemsets (Set[Itemset]): The frequent itemsets of the current level.
+        frequent_buckets (Optional[bytearray]): The bitmap of the frequent PCY buckets for pair candidates.
+
+        Returns:
+        ItemsetsWithOccurrenceCounts: The frequent candidates with their occurrence counts.
+        """
+        batch_size = max(1, self.candidate_memory_limit // self.CANDIDATE_SIZE)
+        candidates = self._iter_candidate_itemsets(frequent_itemsets)
+
+        result = ItemsetsWithOccurrenceCounts(set())
+        batch_count = 0
+        while True:
+            batch = set(islice(candidates, batch_size))
+            if not batch:
+                break
+            batch_count += 1
+
+            # Drop the pair candidates in infrequent buckets before they are counted
+            if frequent_buckets is not None:
+                batch = self._prune_pair_candidates_with_frequent_buckets(batch, frequent_buckets)
+
+            # Count the batch and keep its frequent candidates
+            itemsets_with_counts = self._count_occurrences_of_itemsets(dataset, batch)
+            for itemset in self._prune_itemsets_below_min_support(itemsets_with_counts):
+                result.set_occurrence_count(itemset, itemsets_with_counts[itemset])
+
+        if batch_count > 1:
+            logger.info("Counted the candidates in %d batches of at most %d.", batch_count, batch_size)
+        self.statistics.candidate_batch_counts.append(batch_count)
+        return result
 
     def _is_valid_candidate(self, candidate: Itemset, frequent_itemsets: Set[Itemset]) -> bool:
         """
@@ -160,27 +961,883 @@ class Apriori:
     def fit(self, dataset: Dataset):
         """
         Use the Apriori algorithm to find all frequent itemsets in the given dataset.
-        Saves the frequent itemsets in the frequent_itemsets attribute.
+        Saves the frequent itemsets in the frequent_itemsets attribute and their occurrence counts
+        in the frequent_itemset_counts attribute.
+
+        Parameters:
+        dataset (Dataset): The dataset to which the Apriori algorithm should be fitted.
+        """
+        # Mine all levels (the frequent itemsets are saved once the last level is mined)
+        for _ in self.iter_levels(dataset):
+            pass
+
+    def iter_levels(self, dataset: Dataset) -> Iterator[ItemsetsWithOccurrenceCounts]:
+        """
+        Use the Apriori algorithm to find the frequent itemsets in the given dataset level by level.
+        Every level is yielded as soon as it is pruned, so the mining of the next level only starts when
+        the next level is requested. Closing the generator early releases the workers and indexes.
+        Once the last level is mined, the frequent itemsets are saved like by fit, so the result can be
+        updated or refitted. A generator that is closed early leaves nothing that can be updated.
 
         Parameters:
         dataset (Dataset): The dataset to which the Apriori algorithm should be fitted.
+
+        Returns:
+        Iterator[ItemsetsWithOccurrenceCounts]: The frequent itemsets of every level with their occurrence counts.
         """
-        # Reset the set of frequent itemsets
+        # Reset the statistics, the frequent itemsets and the negative border. The dataset is only recorded as
+        # fitted once all levels are mined.
+        self.statistics = AprioriStatistics()
         self.frequent_itemsets = set()
-        
-        # Start with 1-itemsets
-        current_itemsets = self._generate_one_itemsets(dataset)
-        
-        # Main Apriori loop
-        while current_itemsets:
-            # Count occurrences of current itemsets
-            itemsets_with_counts = self._count_occurrences_of_itemsets(dataset, current_itemsets)
-            
-            # Prune itemsets below minimum support
-            frequent_current = self._prune_itemsets_below_min_support(itemsets_with_counts)
-            
-            # Add frequent itemsets to the overall result
-            self.frequent_itemsets.update(frequent_current)
-            
-            # Generate candidates for next iteration
-            current_itemsets = self._generate_candidate_itemsets(frequent_current)
\ No newline at end of file
+        self.frequent_itemset_counts = ItemsetsWithOccurrenceCounts(set())
+        self.infrequent_itemset_counts = ItemsetsWithOccurrenceCounts(set())
+        self._fitted_transactions = None
+        self._negative_border_complete = False
+        frequent_itemset_counts = ItemsetsWithOccurrenceCounts(set())
+
+        self._use_apriori_tid = False
+
+        # The workers either count all candidates on their shards or mine the candidates of their partitions
+        count_distribution = self.workers > 1 and self.parallel_mode == "count_distribution"
+        candidate_distribution = self.workers > 1 and self.parallel_mode == "candidate_distribution"
+
+        # Pair candidates dropped by the PCY filter and the infrequent candidates of batches and partitions
+        # are not kept
+        negative_border_complete = (
+            self.keep_negative_border
+            and not self.pcy_bucket_count
+            and not self.candidate_memory_limit
+            and not candidate_distribution
+        )
+
+        # The vertical and AprioriTid representations are built once from the full dataset,
+        # so only the horizontal methods profit from trimming
+        trim_dataset = (
+            self.trim_dataset
+            and self.counting_method in self.HORIZONTAL_COUNTING_METHODS
+            and not count_distribution
+        )
+        # The dataset the current level is counted in
+        working_dataset = dataset
+        frequent_buckets = None
+        frequent_current = set()
+        level = 1
+
+        # Distribute the dataset to the workers once for all levels
+        if count_distribution:
+            self._count_distribution_pool = CountDistributionPool(
+                dataset, self._create_local_apriori(1), self.workers
+            )
+
+        try:
+            # Main Apriori loop
+            while True:
+                if level == 1:
+                    # Start with 1-itemsets (and hash the pairs into buckets if the PCY filter is enabled)
+                    if self.pcy_bucket_count:
+                        current_itemsets, frequent_buckets = self._generate_one_itemsets_and_hash_pairs(dataset)
+                    else:
+                        current_itemsets = self._generate_one_itemsets(dataset)
+
+                    # Count occurrences of current itemsets
+                    itemsets_with_counts = self._count_occurrences_of_itemsets(working_dataset, current_itemsets)
+                elif (
+                    level == 2
+                    and frequent_buckets is None
+                    and not count_distribution
+                    and self._fits_pair_matrix(len(frequent_current))
+                ):
+                    # Count the 2-itemsets in a triangular matrix as it fits into the memory limit
+                    pair_matrix_size = self._get_pair_matrix_size(len(frequent_current))
+                    logger.info(
+                        "Counting the pairs of %d frequent items in a %d byte triangular matrix.",
+                        len(frequent_current),
+                        pair_matrix_size,
+                    )
+                    self.statistics.pair_matrix_size = pair_matrix_size
+                    itemsets_with_counts = self._count_frequent_pairs_with_triangular_matrix(
+                        working_dataset, frequent_current
+                    )
+                elif self.candidate_memory_limit:
+                    # Generate, count and prune the candidates batch by batch and only keep the frequent ones
+                    itemsets_with_counts = self._count_candidates_in_batches(
+                        working_dataset, frequent_current, frequent_buckets
+                    )
+                    frequent_buckets = None
+                else:
+                    # Generate candidates for this level
+                    current_itemsets = self._generate_candidate_itemsets(frequent_current)
+
+                    # Drop the pair candidates in infrequent buckets before they are counted
+                    if frequent_buckets is not None:
+                        current_itemsets = self._prune_pair_candidates_with_frequent_buckets(
+                            current_itemsets, frequent_buckets
+                        )
+                        frequent_buckets = None
+                    if not current_itemsets:
+                        break
+
+                    # Count occurrences of current itemsets
+                    itemsets_with_counts = self._count_occurrences_of_itemsets(working_dataset, current_itemsets)
+                self.statistics.dataset_sizes.append(len(working_dataset.transactions))
+                if self.keep_negative_border:
+                    self._keep_infrequent_itemset_counts(itemsets_with_counts)
+
+                # Prune itemsets below minimum support
+                frequent_current = self._prune_itemsets_below_min_support(itemsets_with_counts)
+                if not frequent_current:
+                    break
+
+                # Hand the frequent itemsets of the level to the caller
+                level_counts = self._get_frequent_itemset_counts(itemsets_with_counts)
+                frequent_itemset_counts.update(level_counts)
+                yield level_counts
+                level += 1
+
+                # Shrink the dataset to the transactions that can contain a candidate of the next level
+                if trim_dataset:
+                    working_dataset = self._trim_dataset(working_dataset, frequent_current, level)
+                    if len(working_dataset.transactions) < self.min_support:
+                        # The candidates of the next level are not counted
+                        negative_border_complete = False
+                        logger.info(
+                            "Stopping early: only %d transactions can contain a %d-itemset.",
+                            len(working_dataset.transactions),
+                            level,
+                        )
+                        break
+
+                # Let the workers mine the longer itemsets partition by partition
+                if candidate_distribution and level == 3:
+                    pool = CandidateDistributionPool(
+                        working_dataset, self._create_local_apriori(self.min_support), self.workers
+                    )
+                    partition_counts = pool.mine(frequent_current)
+                    frequent_itemset_counts.update(partition_counts)
+
+                    # The partitions finish independently, so the longer levels are only known at the end
+                    counts_by_length = dict()
+                    for itemset, count in partition_counts.items():
+                        counts_by_length.setdefault(
+                            len(itemset.items), ItemsetsWithOccurrenceCounts(set())
+                        ).set_occurrence_count(itemset, count)
+                    for length in sorted(counts_by_length):
+                        yield counts_by_length[length]
+                    break
+
+            # Save the frequent itemsets of the fitted dataset
+            self.frequent_itemset_counts = frequent_itemset_counts
+            self.frequent_itemsets = set(frequent_itemset_counts.keys())
+            self._fitted_transactions = [dataset.transactions]
+            self._negative_border_complete = negative_border_complete
+        finally:
+            # Release the representations of the dataset
+            self._vertical_index = None
+            self._apriori_tid_index = None
+            self._dataset_profile = None
+            self._profiled_dataset = None
+            if self._count_distribution_pool is not None:
+                self._count_distribution_pool.close()
+                self._count_distribution_pool = None
+
+    def update(self, increment: Dataset):
+        """
+        Update the frequent itemsets with appended transactions (FUP, Cheung et al.).
+        Saves the frequent itemsets of all transactions fitted so far in the frequent_itemsets attribute.
+
+        The minimum support is absolute, so frequent itemsets stay frequent and only their counts in the increment
+        are added. The same holds for the kept infrequent itemsets. A candidate that was not counted before has
+        fewer occurrences than the minimum support in the fitted transactions, so it can only become frequent if it
+        occurs in the increment. Only these candidates are counted in the fitted transactions (one scan per level).
+        If the negative border is kept completely, candidates whose subsets were all frequent before were counted
+        already, and a missing count means that the candidate did not occur at all.
+
+        Parameters:
+        increment (Dataset): The appended transactions.
+        """
+        # Ensure that there is something to update
+        if self._fitted_transactions is None:
+            raise ValueError("The Apriori algorithm has to be fitted before it can be updated.")
+
+        # Reset the statistics
+        self.statistics = AprioriStatistics()
+        self._use_apriori_tid = False
+
+        # The 1-itemsets of the fitted and the appended transactions
+        known_counts = self._get_known_counts()
+        candidates = {
+            itemset for itemset in known_counts if len(itemset.items) == 1
+        } | self._generate_one_itemsets(increment)
+        self._mine_with_known_counts(known_counts, candidates, increment)
+        self._fitted_transactions.append(increment.transactions)
+
+    def refit(self, min_support: int):
+        """
+        Fit the transactions fitted so far again with a different minimum support, reusing the known counts.
+        Saves the frequent itemsets in the frequent_itemsets attribute.
+
+        The candidates whose counts are known from the previous fit are not counted again. With a lower minimum
+        support, only the newly admitted candidates (with a subset that has become frequent) are counted
+        (one scan per level). With a higher minimum support, all counts are known if the negative border is kept.
+
+        Parameters:
+        min_support (int): The new minimum (absolute) support. Must be a positive integer.
+        """
+        # Ensure that the minimum support is a positive integer and that there is something to refit
+        if not isinstance(min_support, int) or min_support < 1:
+            raise ValueError("The minimum support must be a positive integer.")
+        if self._fitted_transactions is None:
+            raise ValueError("The Apriori algorithm has to be fitted before it can be refitted.")
+
+        # Reset the statistics
+        self.statistics = AprioriStatistics()
+        self._use_apriori_tid = False
+        self.min_support = min_support
+
+        # Without the complete negative border, the counts of the infrequent items are not known
+        known_counts = self._get_known_counts()
+        if not self._negative_border_complete:
+            known_counts.update(
+                self._count_occurrences_in_transactions(
+                    chain.from_iterable(self._fitted_transactions), set(), count_items=True
+                )
+            )
+        candidates = {itemset for itemset in known_counts if len(itemset.items) == 1}
+        self._mine_with_known_counts(known_counts, candidates)
+
+    def _get_known_counts(self) -> ItemsetsWithOccurrenceCounts:
+        """
+        Get the occurrence counts of all itemsets counted in the fitted transactions.
+
+        Returns:
+        ItemsetsWithOccurrenceCounts: The kept infrequent and the frequent itemsets with their occurrence counts.
+        """
+        known_counts = ItemsetsWithOccurrenceCounts(set())
+        known_counts.update(self.infrequent_itemset_counts)
+        known_counts.update(self.frequent_itemset_counts)
+        return known_counts
+
+    def _get_fitted_dataset(self) -> Optional[Dataset]:
+        """
+        Get the transactions fitted so far as a dataset if they are held in memory.
+
+        Returns:
+        Optional[Dataset]: The fitted dataset or None if some transactions are streamed (e.g. from a file).
+        """
+        if not all(
+            isinstance(transactions, (frozenset, set, list, tuple))
+            for transactions in self._fitted_transactions
+        ):
+            return None
+        if len(self._fitted_transactions) == 1 and isinstance(self._fitted_transactions[0], frozenset):
+            return Dataset(self._fitted_transactions[0])
+
+        # Equal transactions of different batches are different occurrences, so they must not be merged
+        return Dataset(tuple(chain.from_iterable(self._fitted_transactions)))
+
+    def _swap_dataset_representations(self, representations: Tuple) -> Tuple:
+        """
+        Exchange the cached representations of the counted dataset (the vertical index, the AprioriTid
+        representation and the profile) with the given ones. Two datasets that are counted alternately keep
+        their own representations this way, so neither is rebuilt on every level.
+
+        Parameters:
+        representations (Tuple): The representations to be cached (as returned by an earlier swap).
+
+        Returns:
+        Tuple: The representations that were cached before.
+        """
+        previous_representations = (
+            self._vertical_index,
+            self._apriori_tid_index,
+            self._dataset_profile,
+            self._profiled_dataset,
+        )
+        (
+            self._vertical_index,
+            self._apriori_tid_index,
+            self._dataset_profile,
+            self._profiled_dataset,
+        ) = representations
+        return previous_representations
+
+    def _mine_with_known_counts(
+        self,
+        known_counts: ItemsetsWithOccurrenceCounts,
+        candidates: Set[Itemset],
+        increment: Optional[Dataset] = None,
+    ):
+        """
+        Mine the frequent itemsets level by level, counting only the candidates whose counts are not known.
+        Saves the frequent itemsets in the frequent_itemsets attribute.
+
+        Parameters:
+        known_counts (ItemsetsWithOccurrenceCounts): The occurrence counts known in the fitted transactions.
+        candidates (Set[Itemset]): The 1-itemset candidates.
+        increment (Optional[Dataset]): The appended transactions whose counts are added (None for a refit).
+        """
+        previous_frequent_itemsets = set(self.frequent_itemset_counts.keys())
+        previous_border_complete = self._negative_border_complete
+
+        frequent_itemset_counts = ItemsetsWithOccurrenceCounts(set())
+        infrequent_itemset_counts = ItemsetsWithOccurrenceCounts(set())
+        negative_border_complete = self.keep_negative_border
+
+        # In-memory transactions are counted with the counting method (an index is only built once for all levels).
+        # The fitted dataset is only built once a candidate has to be counted in it, and its representations are
+        # kept apart from the ones of the increment.
+        fitted_dataset = None
+        fitted_dataset_built = False
+        fitted_representations = (None, None, None, None)
+        try:
+            while candidates:
+                # Count the candidates in the increment
+                if increment is not None:
+                    increment_counts = self._count_occurrences_of_itemsets(increment, candidates)
+                    self.statistics.dataset_sizes.append(len(increment.transactions))
+                else:
+                    increment_counts = ItemsetsWithOccurrenceCounts(set())
+
+                counts = ItemsetsWithOccurrenceCounts(set())
+                unknown_itemsets = set()
+                for itemset in candidates:
+                    increment_count = increment_counts.get_occurrence_count(itemset)
+                    if itemset in known_counts:
+                        counts.set_occurrence_count(itemset, known_counts[itemset] + increment_count)
+                    elif previous_border_complete and self._has_only_frequent_subsets(
+                        itemset, previous_frequent_itemsets
+                    ):
+                        # The itemset was part of the negative border, but did not occur
+                        counts.set_occurrence_count(itemset, increment_count)
+                    elif increment is None or increment_count > 0:
+                        # The itemset may be frequent, so it has to be counted in the fitted transactions
+                        unknown_itemsets.add(itemset)
+                    else:
+                        # The itemset is still infrequent, but its count is unknown
+                        negative_border_complete = False
+
+                # Count the itemsets that may be frequent in the fitted transactions
+                if unknown_itemsets:
+                    logger.info(
+                        "Counting %d itemsets in the fitted transactions.", len(unknown_itemsets)
+                    )
+                    if not fitted_dataset_built:
+                        fitted_dataset = self._get_fitted_dataset()
+                        fitted_dataset_built = True
+                    if fitted_dataset is not None:
+                        increment_representations = self._swap_dataset_representations(fitted_representations)
+                        fitted_counts = self._count_occurrences_of_itemsets(fitted_dataset, unknown_itemsets)
+                        fitted_representations = self._swap_dataset_representations(increment_representations)
+                    else:
+                        fitted_counts = self._count_occurrences_in_transactions(
+                            chain.from_iterable(self._fitted_transactions), unknown_itemsets
+                        )
+                    self.statistics.rescanned_itemset_count += len(unknown_itemsets)
+                    for itemset in unknown_itemsets:
+                        counts.set_occurrence_count(
+                            itemset,
+                            fitted_counts.get_occurrence_count(itemset)
+                            + increment_counts.get_occurrence_count(itemset),
+                        )
+
+                # Prune the level and generate the candidates of the next one
+                if self.keep_negative_border:
+                    for itemset, count in counts.items():
+                        if 0 < count < self.min_support:
+                            infrequent_itemset_counts.set_occurrence_count(itemset, count)
+                level_counts = self._get_frequent_itemset_counts(counts)
+                frequent_itemset_counts.update(level_counts)
+                candidates = self._generate_candidate_itemsets(set(level_counts.keys()))
+        finally:
+            # Release the representations of the increment and the fitted transactions
+            self._vertical_index = None
+            self._apriori_tid_index = None
+            self._dataset_profile = None
+            self._profiled_dataset = None
+
+        self.frequent_itemset_counts = frequent_itemset_counts
+        self.frequent_itemsets = set(frequent_itemset_counts.keys())
+        self.infrequent_itemset_counts = infrequent_itemset_counts
+        self._negative_border_complete = negative_border_complete
+
+    def _has_only_frequent_subsets(self, itemset: Itemset, frequent_itemsets: Set[Itemset]) -> bool:
+        """
+        Check whether all (k-1)-subsets of the given itemset are frequent (always true for 1-itemsets).
+
+        Parameters:
+        itemset (Itemset): The itemset to check.
+        frequent_itemsets (Set[Itemset]): Set of known frequent itemsets.
+
+        Returns:
+        bool: True if all (k-1)-subsets are frequent, False otherwise.
+        """
+        if len(itemset.items) == 1:
+            return True
+        return self._is_valid_candidate(itemset, frequent_itemsets)
+
+    def fit_partitioned(
+        self,
+        transactions: Iterable[Transaction],
+        partition_size: int,
+        transaction_count: Optional[int] = None,
+    ):
+        """
+        Use the partition algorithm (Savasere et al.) to find all frequent itemsets with two scans of the transactions.
+        Saves the frequent itemsets in the frequent_itemsets attribute.
+
+        The first scan splits the transactions into partitions and mines every partition in memory with the
+        minimum support scaled to its size. An itemset that is frequent in the whole dataset is frequent in
+        at least one partition, so the union of the local frequent itemsets contains all frequent itemsets.
+        The second scan counts this union exactly. Only one partition is held in memory at a time.
+
+        Parameters:
+        transactions (Iterable[Transaction]): The transactions (e.g. a TransactionFileSource). Must be iterable twice.
+        partition_size (int): The maximum number of transactions of a partition. Must be a positive integer.
+        transaction_count (Optional[int]): The number of transactions. Only needed if the transactions have no length.
+        """
+        # Ensure that the partitions can be built
+        if not isinstance(partition_size, int) or partition_size < 1:
+            raise ValueError("The partition size must be a positive integer.")
+
+        # The local minimum supports depend on the number of transactions
+        transaction_count = self._get_transaction_count(transactions, transaction_count)
+
+        # Reset the frequent itemsets, the negative border and the statistics
+        self.frequent_itemsets = set()
+        self.frequent_itemset_counts = ItemsetsWithOccurrenceCounts(set())
+        self.infrequent_itemset_counts = ItemsetsWithOccurrenceCounts(set())
+        self.statistics = AprioriStatistics()
+        self._fitted_transactions = [transactions]
+
+        # First scan: mine every partition with the scaled minimum support
+        candidates = set()
+        scanned_transaction_count = 0
+        for partition in self._iter_partitions(transactions, partition_size):
+            scanned_transaction_count += len(partition)
+
+            # A partition can only miss an itemset with a count below min_support * |partition| / |dataset|
+            local_min_support = max(
+                1, -(-self.min_support * len(partition) // max(transaction_count, 1))
+            )
+            local_apriori = self._create_local_apriori(local_min_support)
+            local_apriori.fit(Dataset(tuple(partition)))
+            candidates.update(local_apriori.frequent_itemsets)
+            self.statistics.partition_sizes.append(len(partition))
+        self.statistics.dataset_scans += 1
+
+        # A wrong number of transactions would have scaled the local minimum supports wrongly
+        self._check_transaction_count(scanned_transaction_count, transaction_count)
+        logger.info(
+            "Counting %d candidates from %d partitions in the second scan.",
+            len(candidates),
+            len(self.statistics.partition_sizes),
+        )
+
+        # Second scan: count the union of the local frequent itemsets exactly
+        # (the negative border is not counted completely, only the union of the local frequent itemsets)
+        self._negative_border_complete = False
+        if candidates:
+            occurrence_counts = self._count_occurrences_in_transactions(transactions, candidates)
+            if self.keep_negative_border:
+                self._keep_infrequent_itemset_counts(occurrence_counts)
+            self.frequent_itemset_counts = self._get_frequent_itemset_counts(occurrence_counts)
+            self.frequent_itemsets = set(self.frequent_itemset_counts.keys())
+
+    def fit_dynamic(
+        self,
+        transactions: Iterable[Transaction],
+        interval_count: int,
+        transaction_count: Optional[int] = None,
+    ):
+        """
+        Use Dynamic Itemset Counting (Brin et al.) to find all frequent itemsets with few scans of the transactions.
+        Saves the frequent itemsets in the frequent_itemsets attribute.
+
+        The transactions are split into interval_count intervals. At every interval boundary, the candidates whose
+        subsets have all reached the minimum support (counts only grow, so they are frequent) start to be counted.
+        Every candidate is counted over exactly one full cycle of the transactions (wrapping around to the start),
+        so the counting of different lengths overlaps and fewer scans are needed than the longest frequent itemset is long.
+
+        Parameters:
+        transactions (Iterable[Transaction]): The transactions (e.g. a TransactionFileSource). Must be iterable repeatedly.
+        interval_count (int): The number of intervals per scan. Must be a positive integer.
+        transaction_count (Optional[int]): The number of transactions. Only needed if the transactions have no length.
+        """
+        # Ensure that the intervals can be built
+        if not isinstance(interval_count, int) or interval_count < 1:
+            raise ValueError("The number of intervals must be a positive integer.")
+        transaction_count = self._get_transaction_count(transactions, transaction_count)
+
+        # Reset the frequent itemsets, the negative border and the statistics
+        self.frequent_itemsets = set()
+        self.frequent_itemset_counts = ItemsetsWithOccurrenceCounts(set())
+        self.infrequent_itemset_counts = ItemsetsWithOccurrenceCounts(set())
+        self.statistics = AprioriStatistics()
+        self._fitted_transactions = [transactions]
+        if transaction_count == 0:
+            self._negative_border_complete = self.keep_negative_border
+            return
+        interval_size = -(-transaction_count // interval_count)
+
+        # The counts of all items (counted during the first scan) and of all longer candidates
+        item_counts = dict()
+        occurrence_counts = dict()
+
+        # The number of transactions the active candidates still have to be counted in
+        remaining_transaction_counts = dict()
+
+        while True:
+            self.statistics.dataset_scans += 1
+            first_scan = self.statistics.dataset_scans == 1
+            scanned_transaction_count = 0
+            for interval in self._iter_partitions(transactions, interval_size):
+                # Count the active candidates (and the items in the first scan) in the interval
+                self._count_interval(
+                    interval,
+                    item_counts if first_scan else None,
+                    occurrence_counts,
+                    remaining_transaction_counts,
+                )
+                scanned_transaction_count += len(interval)
+                if scanned_transaction_count > transaction_count:
+                    self._check_transaction_count(scanned_transaction_count, transaction_count)
+
+                # Start counting the candidates whose subsets are all known to be frequent
+                frequent_itemsets = {
+                    Itemset(frozenset({item}))
+                    for item, count in item_counts.items()
+                    if count >= self.min_support
+                } | {itemset for itemset, count in occurrence_counts.items() if count >= self.min_support}
+                for itemset in self._get_negative_border(frequent_itemsets):
+                    if itemset not in occurrence_counts:
+                        occurrence_counts[itemset] = 0
+                        remaining_transaction_counts[itemset] = transaction_count
+
+                # Stop as soon as all items and candidates have been counted completely
+                items_counted = not first_scan or scanned_transaction_count == transaction_count
+                if items_counted and not remaining_transaction_counts:
+                    break
+            else:
+                # The first scan has to find the announced number of transactions
+                if first_scan:
+                    self._check_transaction_count(scanned_transaction_count, transaction_count)
+                continue
+            break
+
+        # All items and the whole negative border of the frequent itemsets were counted
+        self._negative_border_complete = self.keep_negative_border
+        for item, count in item_counts.items():
+            if count >= self.min_support:
+                self.frequent_itemset_counts.set_occurrence_count(Itemset(frozenset({item})), count)
+            elif self.keep_negative_border:
+                self.infrequent_itemset_counts.set_occurrence_count(Itemset(frozenset({item})), count)
+        for itemset, count in occurrence_counts.items():
+            if count >= self.min_support:
+                self.frequent_itemset_counts.set_occurrence_count(itemset, count)
+            elif self.keep_negative_border and count:
+                self.infrequent_itemset_counts.set_occurrence_count(itemset, count)
+        self.frequent_itemsets = frequent_itemsets
+        logger.info(
+            "Counted %d candidates in %d scans.",
+            len(item_counts) + len(occurrence_counts),
+            self.statistics.dataset_scans,
+        )
+
+    def _count_interval(
+        self,
+        interval: List[Transaction],
+        item_counts: Optional[Dict[Item, int]],
+        occurrence_counts: Dict[Itemset, int],
+        remaining_transaction_counts: Dict[Itemset, int],
+    ):
+        """
+        Count the active candidates of Dynamic Itemset Counting in an interval of transactions.
+
+        Parameters:
+        interval (List[Transaction]): The transactions of the interval.
+        item_counts (Optional[Dict[Item, int]]): If given, the occurrences of all items are added to this dictionary.
+        occurrence_counts (Dict[Itemset, int]): The counts of the candidates, updated with the counts of the interval.
+        remaining_transaction_counts (Dict[Itemset, int]): The number of transactions every active candidate still has to be
+                                             counted in. Candidates that are counted completely are removed.
+        """
+        prefix_trie = CandidatePrefixTrie(set(remaining_transaction_counts.keys()))
+        for transaction in interval:
+            prefix_trie.add_transaction(transaction.items)
+            if item_counts is not None:
+                for item in transaction.items:
+                    item_counts[item] = item_counts.get(item, 0) + 1
+
+        for itemset, count in prefix_trie.get_itemsets_with_occurrence_counts().items():
+            occurrence_counts[itemset] += count
+            remaining_transaction_counts[itemset] -= len(interval)
+            if remaining_transaction_counts[itemset] <= 0:
+                del remaining_transaction_counts[itemset]
+
+    def fit_sampled(
+        self,
+        transactions: Iterable[Transaction],
+        sample_size: int,
+        support_lowering: float = 0.8,
+        seed: Optional[int] = None,
+    ):
+        """
+        Use Toivonen's sampling algorithm to find all frequent itemsets with (usually) one verifying scan.
+        Saves the frequent itemsets in the frequent_itemsets attribute.
+
+        The frequent itemsets of a random sample are mined in memory with a lowered minimum support.
+        One scan then counts these itemsets and their negative border (the itemsets that are not frequent in the
+        sample, but all of whose subsets are) in the transactions. If no itemset of the border is frequent,
+        the result is exact. Otherwise the negative border of the verified frequent itemsets is counted in
+        further scans until no new frequent itemset is found.
+
+        Parameters:
+        transactions (Iterable[Transaction]): The transactions (e.g. a TransactionFileSource). Must be iterable twice.
+                                              Transactions that are not a sequence cost an extra scan for the sample.
+        sample_size (int): The number of transactions of the sample. Must be a positive integer.
+        support_lowering (float): The factor the scaled minimum support of the sample is lowered by to make misses
+                                  on the border unlikely. Must be in (0, 1]. Default value is 0.8.
+        seed (Optional[int]): The seed of the random sample. Default value is None.
+        """
+        # Ensure that the sample can be drawn and mined
+        if not isinstance(sample_size, int) or sample_size < 1:
+            raise ValueError("The sample size must be a positive integer.")
+        if not 0 < support_lowering <= 1:
+            raise ValueError("The support lowering must be in (0, 1].")
+
+        # Reset the frequent itemsets, the negative border and the statistics
+        self.frequent_itemsets = set()
+        self.frequent_itemset_counts = ItemsetsWithOccurrenceCounts(set())
+        self.infrequent_itemset_counts = ItemsetsWithOccurrenceCounts(set())
+        self.statistics = AprioriStatistics()
+        self._fitted_transactions = [transactions]
+
+        # Draw the sample (a scan of the transactions is needed if they cannot be indexed)
+        random_generator = random.Random(seed)
+        if isinstance(transactions, Sequence):
+            transaction_count = len(transactions)
+            sample = random_generator.sample(transactions, min(sample_size, transaction_count))
+        else:
+            transaction_count, sample = self._draw_reservoir_sample(
+                transactions, sample_size, random_generator
+            )
+            self.statistics.dataset_scans += 1
+        if not sample:
+            self._negative_border_complete = self.keep_negative_border
+            return
+
+        # Mine the sample with the lowered minimum support
+        sample_min_support = max(
+            1, int(support_lowering * self.min_support * len(sample) / transaction_count)
+        )
+        sample_apriori = self._create_local_apriori(sample_min_support)
+        sample_apriori.fit(Dataset(tuple(sample)))
+        negative_border = self._get_negative_border(sample_apriori.frequent_itemsets)
+        self.statistics.negative_border_size = len(negative_border)
+        logger.info(
+            "Verifying %d sample-frequent itemsets and a negative border of %d itemsets.",
+            len(sample_apriori.frequent_itemsets),
+            len(negative_border),
+        )
+
+        # Count the sample-frequent itemsets, their negative border and all items in one scan
+        occurrence_counts = self._count_occurrences_in_transactions(
+            transactions, sample_apriori.frequent_itemsets | negative_border, count_items=True
+        )
+        frequent_itemsets = self._prune_itemsets_below_min_support(occurrence_counts)
+
+        # Count the negative border of the verified frequent itemsets until it is known completely
+        while True:
+            uncounted_itemsets = {
+                itemset
+                for itemset in self._get_negative_border(frequent_itemsets)
+                if itemset not in occurrence_counts
+            }
+            if not uncounted_itemsets:
+                break
+            logger.info(
+                "The sample missed frequent itemsets, counting %d more itemsets.",
+                len(uncounted_itemsets),
+            )
+            new_occurrence_counts = self._count_occurrences_in_transactions(
+                transactions, uncounted_itemsets
+            )
+            occurrence_counts.update(new_occurrence_counts)
+            frequent_itemsets |= self._prune_itemsets_below_min_support(new_occurrence_counts)
+
+        # All items and the whole negative border of the frequent itemsets were counted
+        self._negative_border_complete = self.keep_negative_border
+        if self.keep_negative_border:
+            self._keep_infrequent_itemset_counts(occurrence_counts)
+        self.frequent_itemset_counts = self._get_frequent_itemset_counts(occurrence_counts)
+        self.frequent_itemsets = frequent_itemsets
+
+    def _draw_reservoir_sample(
+        self,
+        transactions: Iterable[Transaction],
+        sample_size: int,
+        random_generator: random.Random,
+    ) -> Tuple[int, List[Transaction]]:
+        """
+        Draw a uniform random sample of the transactions with a single scan (reservoir sampling).
+
+        Parameters:
+        transactions (Iterable[Transaction]): The transactions to be sampled.
+        sample_size (int): The maximum number of transactions of the sample.
+        random_generator (random.Random): The random number generator.
+
+        Returns:
+        Tuple[int, List[Transaction]]: The number of transactions and the sample.
+        """
+        sample = []
+        transaction_count = 0
+        for transaction in transactions:
+            transaction_count += 1
+            if len(sample) < sample_size:
+                sample.append(transaction)
+            else:
+                # Replace a sampled transaction with the probability sample_size / transaction_count
+                position = random_generator.randrange(transaction_count)
+                if position < sample_size:
+                    sample[position] = transaction
+        return transaction_count, sample
+
+    def _get_negative_border(self, frequent_itemsets: Set[Itemset]) -> Set[Itemset]:
+        """
+        Get the negative border of the given frequent itemsets without the 1-itemsets: all itemsets that are not
+        frequent, but all of whose (k-1)-subsets are.
+
+        Parameters:
+        frequent_itemsets (Set[Itemset]): A downward closed set of frequent itemsets (of all lengths).
+
+        Returns:
+        Set[Itemset]: The itemsets of the negative border with at least two items.
+        """
+        # Group the frequent itemsets by their length
+        frequent_itemsets_by_length = dict()
+        for itemset in frequent_itemsets:
+            frequent_itemsets_by_length.setdefault(len(itemset.items), set()).add(itemset)
+
+        # The candidates joined from the frequent itemsets of one length that are not frequent themselves
+        negative_border = set()
+        for itemsets in frequent_itemsets_by_length.values():
+            negative_border.update(
+                candidate
+                for candidate in self._generate_candidate_itemsets(itemsets)
+                if candidate not in frequent_itemsets
+            )
+        return negative_border
+
+    def _count_occurrences_in_transactions(
+        self,
+        transactions: Iterable[Transaction],
+        itemsets: Set[Itemset],
+        count_items: bool = False,
+    ) -> ItemsetsWithOccurrenceCounts:
+        """
+        Count the occurrences of the given itemsets (of any lengths) with one scan of the transactions.
+
+        Parameters:
+        transactions (Iterable[Transaction]): The transactions to be scanned.
+        itemsets (Set[Itemset]): The itemsets for which the occurrences should be counted.
+        count_items (bool): Whether the 1-itemsets of all items should be counted as well. Default value is False.
+
+        Returns:
+        ItemsetsWithOccurrenceCounts: A dictionary containing the itemsets as keys and their occurrence counts as values.
+        """
+        prefix_trie = CandidatePrefixTrie(itemsets)
+        item_counts = dict()
+        for transaction in transactions:
+            prefix_trie.add_transaction(transaction.items)
+            if count_items:
+                for item in transaction.items:
+                    item_counts[item] = item_counts.get(item, 0) + 1
+        self.statistics.dataset_scans += 1
+
+        result = prefix_trie.get_itemsets_with_occurrence_counts()
+        for item, count in item_counts.items():
+            result.set_occurrence_count(Itemset(frozenset({item})), count)
+        return result
+
+    def _get_transaction_count(
+        self, transactions: Iterable[Transaction], transaction_count: Optional[int]
+    ) -> int:
+        """
+        Get the number of the given transactions without scanning them.
+
+        Parameters:
+        transactions (Iterable[Transaction]): The transactions.
+        transaction_count (Optional[int]): The announced number of transactions (None to use the length).
+
+        Returns:
+        int: The number of transactions.
+        """
+        if transaction_count is None:
+            try:
+                transaction_count = len(transactions)
+            except TypeError:
+                raise ValueError(
+                    "The number of transactions must be given if the transactions have no length."
+                ) from None
+        if not isinstance(transaction_count, int) or transaction_count < 0:
+            raise ValueError("The number of transactions must be a non-negative integer.")
+        return transaction_count
+
+    def _check_transaction_count(self, scanned_transaction_count: int, transaction_count: int):
+        """
+        Ensure that a scan found the announced number of transactions.
+
+        Parameters:
+        scanned_transaction_count (int): The number of transactions found by the scan.
+        transaction_count (int): The announced number of transactions.
+        """
+        if scanned_transaction_count != transaction_count:
+            raise ValueError(
+                f"The transactions contain {scanned_transaction_count} transactions, "
+                f"but {transaction_count} were announced."
+            )
+
+    def _iter_partitions(
+        self, transactions: Iterable[Transaction], partition_size: int
+    ) -> Iterator[List[Transaction]]:
+        """
+        Split the transactions into consecutive partitions.
+
+        Parameters:
+        transactions (Iterable[Transaction]): The transactions to be split.
+        partition_size (int): The maximum number of transactions of a partition.
+
+        Returns:
+        Iterator[List[Transaction]]: The partitions (only the last one can be smaller than the partition size).
+        """
+        partition = []
+        for transaction in transactions:
+            partition.append(transaction)
+            if len(partition) == partition_size:
+                yield partition
+                partition = []
+        if partition:
+            yield partition
+
+    def _create_local_apriori(self, min_support: int) -> "Apriori":
+        """
+        Create an Apriori object with the settings of this one but a different minimum support.
+
+        Parameters:
+        min_support (int): The minimum (absolute) support of the new object.
+
+        Returns:
+        Apriori: The new Apriori object.
+        """
+        return Apriori(
+            min_support=min_support,
+            counting_method=self.counting_method,
+            hash_tree_leaf_size=self.hash_tree_leaf_size,
+            hash_tree_fan_out=self.hash_tree_fan_out,
+            pcy_bucket_count=self.pcy_bucket_count,
+            pair_matrix_memory_limit=self.pair_matrix_memory_limit,
+            trim_dataset=self.trim_dataset,
+            apriori_tid_memory_limit=self.apriori_tid_memory_limit,
+            candidate_memory_limit=self.candidate_memory_limit,
+            subset_filter_bits=self.subset_filter_bits,
+            keep_negative_border=self.keep_negative_border,
+        )
@@ -0,0 +1,77 @@
+import argparse
+import time
+from itertools import combinations
+
+from apriori import Apriori
+from benchmarks.synthetic_dataset import generate_retail_dataset
+
+
+def generate_candidates_by_pairwise_join(frequent_itemsets):
+    """
+    Generate the candidates by joining every pair of frequent itemsets (the former implementation).
+    Used as reference for the prefix-grouped join of Apriori._generate_candidate_itemsets.
+
+    Parameters:
+    frequent_itemsets (Set[Itemset]): The frequent k-itemsets.
+
+    Returns:
+    Set[FrozenSet[Item]]: The items of all (k+1)-candidates.
+    """
+    candidates = set()
+    frequent_itemsets_items = {itemset.items for itemset in frequent_itemsets}
+    frequent_list = list(frequent_itemsets_items)
+    for i in range(len(frequent_list)):
+        for j in range(i + 1, len(frequent_list)):
+            union = frequent_list[i] | frequent_list[j]
+            if len(union) == len(frequent_list[i]) + 1 and all(
+                frozenset(subset) in frequent_itemsets_items
+                for subset in combinations(union, len(frequent_list[i]))
+            ):
+                candidates.add(union)
+    return candidates
+
+
+def main():
+    """Time the candidate generation of every level separately from the counting."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--transactions", type=int, default=2000)
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--average-length", type=int, default=10)
+    parser.add_argument("--min-support", type=int, default=40)
+    parser.add_argument("--skip-reference", action="store_true")
+    arguments = parser.parse_args()
+
+    # Mine the frequent itemsets once to get realistic levels
+    dataset = generate_retail_dataset(
+        arguments.transactions, arguments.items, arguments.average_length
+    )
+    apriori = Apriori(arguments.min_support, counting_method="bitmap")
+    apriori.fit(dataset)
+
+    # Group the frequent itemsets by their length
+    levels = dict()
+    for itemset in apriori.frequent_itemsets:
+        levels.setdefault(len(itemset.items), set()).add(itemset)
+
+    for length in sorted(levels):
+        start = time.perf_counter()
+        candidates = apriori._generate_candidate_itemsets(levels[length])
+        duration = time.perf_counter() - start
+        line = (
+            f"k={length}: {len(levels[length]):6d} frequent -> {len(candidates):6d} candidates, "
+            f"prefix join {duration:8.3f} s"
+        )
+
+        if not arguments.skip_reference:
+            start = time.perf_counter()
+            reference_candidates = generate_candidates_by_pairwise_join(levels[length])
+            reference_duration = time.perf_counter() - start
+
+            # Both joins have to generate the same candidates
+            assert {candidate.items for candidate in candidates} == reference_candidates
+            line += f", pairwise join {reference_duration:8.3f} s"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import argparse
+import time
+import tracemalloc
+from itertools import combinations
+
+from apriori import Apriori
+from benchmarks.synthetic_dataset import generate_retail_dataset
+from classes.itemset import Itemset
+
+
+def main():
+    """Measure the counting throughput and the memory per candidate of the counting methods."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--transactions", type=int, default=3000)
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--average-length", type=int, default=10)
+    parser.add_argument("--candidate-items", type=int, default=60)
+    parser.add_argument("--min-support", type=int, default=20)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument(
+        "--methods", nargs="+", default=["hash_tree", "prefix_trie", "subsets", "apriori_tid"]
+    )
+    arguments = parser.parse_args()
+
+    # All pairs of the first items are the candidates
+    dataset = generate_retail_dataset(
+        arguments.transactions, arguments.items, arguments.average_length
+    )
+    items = sorted(
+        {item for transaction in dataset.transactions for item in transaction.items},
+        key=lambda item: item.name,
+    )
+    candidates = {
+        Itemset(frozenset(pair)) for pair in combinations(items[: arguments.candidate_items], 2)
+    }
+
+    for counting_method in arguments.methods:
+        # Take the fastest of a few runs
+        duration = float("inf")
+        for _ in range(arguments.repeats):
+            apriori = Apriori(arguments.min_support, counting_method=counting_method)
+            start = time.perf_counter()
+            apriori._count_occurrences_of_itemsets(dataset, candidates)
+            duration = min(duration, time.perf_counter() - start)
+
+        # Measure the memory in a separate run (tracing slows the counting down)
+        apriori = Apriori(arguments.min_support, counting_method=counting_method)
+        tracemalloc.start()
+        apriori._count_occurrences_of_itemsets(dataset, candidates)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        print(
+            f"{counting_method:>14}: {len(candidates) / duration:10.0f} candidates/s "
+            f"{peak / len(candidates):8.1f} B/candidate"
+        )
+
+
+if __name__ == "__main__":
+    main()
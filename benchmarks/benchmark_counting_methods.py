@@ -0,0 +1,45 @@
+import argparse
+import time
+
+from apriori import Apriori
+from benchmarks.synthetic_dataset import generate_retail_dataset
+
+
+def main():
+    """Compare the run time of Apriori.fit with the different counting methods on a synthetic dataset."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--transactions", type=int, default=2000)
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--average-length", type=int, default=10)
+    parser.add_argument("--min-support", type=int, default=40)
+    parser.add_argument(
+        "--methods", nargs="+", default=list(Apriori.COUNTING_METHODS)
+    )
+    arguments = parser.parse_args()
+
+    # Generate the dataset once for all methods
+    dataset = generate_retail_dataset(
+        arguments.transactions, arguments.items, arguments.average_length
+    )
+
+    reference_itemsets = None
+    for counting_method in arguments.methods:
+        apriori = Apriori(arguments.min_support, counting_method=counting_method)
+
+        start = time.perf_counter()
+        apriori.fit(dataset)
+        duration = time.perf_counter() - start
+
+        # All methods have to find the same frequent itemsets
+        if reference_itemsets is None:
+            reference_itemsets = apriori.frequent_itemsets
+        assert apriori.frequent_itemsets == reference_itemsets, counting_method
+
+        print(
+            f"{counting_method:>14}: {duration:8.3f} s "
+            f"({len(apriori.frequent_itemsets)} frequent itemsets)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import argparse
+import time
+import tracemalloc
+
+from benchmarks.synthetic_dataset import generate_retail_dataset
+from fpgrowth import FPgrowth
+
+
+def main():
+    """Measure the construction time and the memory per node of the initial FP-tree on a synthetic dataset."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--transactions", type=int, default=1000000)
+    parser.add_argument("--items", type=int, default=2000)
+    parser.add_argument("--average-length", type=int, default=10)
+    parser.add_argument("--min-support", type=int, default=2)
+    parser.add_argument("--repeats", type=int, default=1)
+    parser.add_argument("--backends", nargs="+", default=list(FPgrowth.FP_TREE_BACKENDS))
+    arguments = parser.parse_args()
+
+    # Sort the dataset once, only the construction of the tree is measured
+    dataset = generate_retail_dataset(
+        arguments.transactions, arguments.items, arguments.average_length
+    )
+    fpgrowth = FPgrowth(arguments.min_support)
+    frequent_one_itemsets = fpgrowth._generate_frequent_one_itemsets_with_occurrence_counts(dataset)
+    f_list = fpgrowth._generate_f_list(frequent_one_itemsets)
+    sorted_dataset = fpgrowth._sort_dataset_according_to_f_list(dataset, f_list)
+
+    print(f"{len(sorted_dataset.transactions)} transactions, {len(f_list)} frequent items")
+    for fp_tree_backend in arguments.backends:
+        fpgrowth = FPgrowth(arguments.min_support, fp_tree_backend=fp_tree_backend)
+
+        # Take the fastest of a few runs
+        duration = float("inf")
+        for _ in range(arguments.repeats):
+            start = time.perf_counter()
+            fpgrowth._construct_initial_fp_tree(sorted_dataset)
+            duration = min(duration, time.perf_counter() - start)
+
+        # Measure the memory in a separate run (tracing slows the construction down)
+        tracemalloc.start()
+        fp_tree = fpgrowth._construct_initial_fp_tree(sorted_dataset)
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        if fp_tree_backend == "arrays":
+            node_count = fp_tree.get_node_count()
+        else:
+            node_count = len(fp_tree.get_all_item_nodes())
+        del fp_tree
+
+        print(
+            f"{fp_tree_backend:>6}: {duration:8.3f} s "
+            f"({len(sorted_dataset.transactions) / duration:10.0f} transactions/s), "
+            f"{node_count} nodes, {size / node_count:6.1f} B/node"
+        )
+
+
+if __name__ == "__main__":
+    main()
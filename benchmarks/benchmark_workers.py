@@ -0,0 +1,49 @@
+import argparse
+import os
+import time
+
+from apriori import Apriori
+from benchmarks.synthetic_dataset import generate_retail_dataset
+
+
+def main():
+    """Measure the scaling of Apriori.fit with 1 to N count distribution workers on a synthetic dataset."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--transactions", type=int, default=20000)
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--average-length", type=int, default=10)
+    parser.add_argument("--min-support", type=int, default=400)
+    parser.add_argument("--counting-method", default="prefix_trie")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    arguments = parser.parse_args()
+
+    # Generate the dataset once for all worker counts
+    dataset = generate_retail_dataset(
+        arguments.transactions, arguments.items, arguments.average_length
+    )
+
+    reference_itemsets = None
+    reference_duration = None
+    for workers in range(1, arguments.max_workers + 1):
+        apriori = Apriori(
+            arguments.min_support, counting_method=arguments.counting_method, workers=workers
+        )
+
+        start = time.perf_counter()
+        apriori.fit(dataset)
+        duration = time.perf_counter() - start
+
+        # All worker counts have to find the same frequent itemsets
+        if reference_itemsets is None:
+            reference_itemsets = apriori.frequent_itemsets
+            reference_duration = duration
+        assert apriori.frequent_itemsets == reference_itemsets, workers
+
+        print(
+            f"{workers:>3} workers: {duration:8.3f} s "
+            f"(speedup {reference_duration / duration:5.2f}, {len(apriori.frequent_itemsets)} frequent itemsets)"
+        )
+
+
+if __name__ == "__main__":
+    main()
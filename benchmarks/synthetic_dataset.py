@@ -0,0 +1,40 @@
+import random
+
+from classes.dataset import Dataset
+from classes.item import Item
+from classes.itemset import Itemset
+from classes.transaction import Transaction
+
+
+def generate_retail_dataset(
+    transaction_count: int,
+    item_count: int = 100,
+    average_transaction_length: int = 10,
+    seed: int = 0,
+) -> Dataset:
+    """
+    Generate a synthetic retail dataset with a skewed (Zipf-like) item distribution.
+
+    Parameters:
+    transaction_count (int): The number of transactions.
+    item_count (int): The number of distinct items. Default value is 100.
+    average_transaction_length (int): The average number of items per transaction. Default value is 10.
+    seed (int): The seed of the random number generator. Default value is 0.
+
+    Returns:
+    Dataset: The generated dataset.
+    """
+    # Use a dedicated random number generator to get reproducible datasets
+    rng = random.Random(seed)
+
+    # Popular items are drawn more often than rare items
+    items = [Item(f"Product {index}") for index in range(item_count)]
+    weights = [1 / (rank + 1) for rank in range(item_count)]
+
+    transactions = []
+    for transaction_id in range(transaction_count):
+        length = max(1, int(rng.expovariate(1 / average_transaction_length)))
+        transaction_items = frozenset(rng.choices(items, weights, k=length))
+        transactions.append(Transaction(transaction_id, Itemset(transaction_items)))
+
+    return Dataset(frozenset(transactions))
@@ -0,0 +1,34 @@
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class AprioriStatistics:
+    """A class collecting statistics about the last run of the Apriori algorithm."""
+
+    # The number of pair candidates that were dropped by the PCY bucket filter
+    pruned_pair_candidates: int = 0
+
+    # The size (in bytes) of the triangular matrix the pairs were counted in (0 if it was not used)
+    pair_matrix_size: int = 0
+
+    # The number of transactions that were scanned on every level
+    dataset_sizes: List[int] = field(default_factory=list)
+
+    # The counting method that was used on every counted level
+    counting_methods: List[str] = field(default_factory=list)
+
+    # The number of full scans of an external transaction source (only counted by the out-of-core modes)
+    dataset_scans: int = 0
+
+    # The number of transactions of every partition (only used by the partition mode)
+    partition_sizes: List[int] = field(default_factory=list)
+
+    # The number of itemsets of the negative border of the sample (only used by the sampling mode)
+    negative_border_size: int = 0
+
+    # The number of candidate batches of every level counted with a candidate memory limit
+    candidate_batch_counts: List[int] = field(default_factory=list)
+
+    # The number of itemsets that had to be counted in the fitted transactions by an update or a refit
+    rescanned_itemset_count: int = 0
@@ -0,0 +1,198 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from classes.candidate_prefix_trie import CandidatePrefixTrie
+from classes.dataset import Dataset
+from classes.item import Item
+from classes.itemset import Itemset
+from classes.itemsets_with_occurrence_counts import ItemsetsWithOccurrenceCounts
+
+
+class AprioriTidIndex:
+    """
+    The AprioriTid representation of a dataset: every transaction is replaced by the set of IDs of the
+    (frequent) candidates of the last counted level that it contains.
+
+    A (k+1)-candidate is contained in a transaction if both k-itemsets it was joined from are contained,
+    so level k+1 is counted on the candidate-ID sets alone and the raw dataset is not scanned again.
+    Transactions without any frequent candidate are dropped, so the representation shrinks with every level.
+    """
+
+    def __init__(self, dataset: Dataset, min_support: int = 1):
+        """
+        Initialize the AprioriTidIndex for the given dataset. The dataset is only scanned on the first count.
+
+        Parameters:
+        dataset (Dataset): The dataset that should be represented.
+        min_support (int): The minimum (absolute) support. Only the IDs of candidates that reach
+                           this support are kept for the next level. Default value is 1.
+        """
+        # Save the arguments
+        self.dataset = dataset
+        self.min_support = min_support
+
+        # The IDs of the frequent candidates of the last counted level (keyed by the sorted items)
+        self.candidate_ids: Dict[Tuple[Item, ...], int] = dict()
+
+        # The candidate-ID sets of the transactions (None until the dataset has been scanned)
+        self.transaction_candidate_ids: Optional[List[Set[int]]] = None
+
+        # The length of the candidates of the last counted level
+        self.length = 0
+
+    # Functions
+    def count_occurrences_of_itemsets(
+        self, itemsets: Set[Itemset]
+    ) -> ItemsetsWithOccurrenceCounts:
+        """
+        Count the occurrences of the given itemsets and replace the candidate-ID sets with the ones of the itemsets.
+
+        Parameters:
+        itemsets (Set[Itemset]): The itemsets for which the occurrences should be counted.
+
+        Returns:
+        ItemsetsWithOccurrenceCounts: A dictionary containing the itemsets as keys and their occurrence counts as values.
+        """
+        # Nothing has to be counted (and the level is kept)
+        if not itemsets:
+            return ItemsetsWithOccurrenceCounts(set())
+
+        # Encode the itemsets as tuples sorted by the item names
+        sorted_itemsets = {
+            itemset: tuple(sorted(itemset.items, key=lambda item: item.name))
+            for itemset in itemsets
+        }
+
+        # The candidate-ID sets can only be used if every itemset was joined from two itemsets of the last level
+        if self.transaction_candidate_ids is not None and all(
+            len(items) == self.length + 1
+            and items[:-1] in self.candidate_ids
+            and items[:-2] + items[-1:] in self.candidate_ids
+            for items in sorted_itemsets.values()
+        ):
+            return self._count_with_candidate_ids(sorted_itemsets)
+        return self._count_with_dataset(sorted_itemsets)
+
+    def _count_with_dataset(
+        self, sorted_itemsets: Dict[Itemset, Tuple[Item, ...]]
+    ) -> ItemsetsWithOccurrenceCounts:
+        """
+        Count the itemsets with a scan of the dataset and build the candidate-ID sets of the transactions.
+
+        Parameters:
+        sorted_itemsets (Dict[Itemset, Tuple[Item, ...]]): The itemsets with their items sorted by name.
+
+        Returns:
+        ItemsetsWithOccurrenceCounts: A dictionary containing the itemsets as keys and their occurrence counts as values.
+        """
+        # Walk every transaction through a prefix trie of the itemsets and remember the contained ones
+        prefix_trie = CandidatePrefixTrie(set(sorted_itemsets.keys()))
+        transaction_itemsets = []
+        for transaction in self.dataset.transactions:
+            contained_itemsets = []
+            prefix_trie.add_transaction(transaction.items, contained_itemsets)
+            if contained_itemsets:
+                transaction_itemsets.append(contained_itemsets)
+        result = prefix_trie.get_itemsets_with_occurrence_counts()
+
+        # Number the frequent itemsets and replace the transactions with their candidate-ID sets
+        itemset_ids = {
+            itemset: candidate_id
+            for candidate_id, itemset in enumerate(
+                itemset for itemset, count in result.items() if count >= self.min_support
+            )
+        }
+        self._replace_level(
+            {sorted_itemsets[itemset]: candidate_id for itemset, candidate_id in itemset_ids.items()},
+            (
+                {itemset_ids[itemset] for itemset in contained_itemsets if itemset in itemset_ids}
+                for contained_itemsets in transaction_itemsets
+            ),
+            len(next(iter(sorted_itemsets.values()))) if sorted_itemsets else 0,
+        )
+        return result
+
+    def _count_with_candidate_ids(
+        self, sorted_itemsets: Dict[Itemset, Tuple[Item, ...]]
+    ) -> ItemsetsWithOccurrenceCounts:
+        """
+        Count the itemsets on the candidate-ID sets of the last level (without scanning the dataset).
+
+        Parameters:
+        sorted_itemsets (Dict[Itemset, Tuple[Item, ...]]): The itemsets with their items sorted by name.
+                                                            Every itemset has to be joinable from the last level.
+
+        Returns:
+        ItemsetsWithOccurrenceCounts: A dictionary containing the itemsets as keys and their occurrence counts as values.
+        """
+        # Number the itemsets and index them by the ID of their first generating itemset
+        itemsets = list(sorted_itemsets.keys())
+        extensions: Dict[int, List[Tuple[int, int]]] = dict()
+        for candidate_id, itemset in enumerate(itemsets):
+            items = sorted_itemsets[itemset]
+            extensions.setdefault(self.candidate_ids[items[:-1]], []).append(
+                (self.candidate_ids[items[:-2] + items[-1:]], candidate_id)
+            )
+
+        # A transaction contains a candidate if it contains both generating itemsets
+        counts = [0] * len(itemsets)
+        new_transaction_candidate_ids = []
+        for candidate_ids in self.transaction_candidate_ids:
+            new_candidate_ids = set()
+            for candidate_id in candidate_ids:
+                for other_candidate_id, new_candidate_id in extensions.get(candidate_id, ()):
+                    if other_candidate_id in candidate_ids:
+                        new_candidate_ids.add(new_candidate_id)
+            for new_candidate_id in new_candidate_ids:
+                counts[new_candidate_id] += 1
+            if new_candidate_ids:
+                new_transaction_candidate_ids.append(new_candidate_ids)
+
+        result = ItemsetsWithOccurrenceCounts(set())
+        for itemset, count in zip(itemsets, counts):
+            result.set_occurrence_count(itemset, count)
+
+        # Only keep the IDs of the frequent itemsets for the next level
+        frequent_ids = {
+            candidate_id for candidate_id, count in enumerate(counts) if count >= self.min_support
+        }
+        self._replace_level(
+            {
+                sorted_itemsets[itemsets[candidate_id]]: candidate_id
+                for candidate_id in frequent_ids
+            },
+            (candidate_ids & frequent_ids for candidate_ids in new_transaction_candidate_ids),
+            self.length + 1,
+        )
+        return result
+
+    def _replace_level(
+        self,
+        candidate_ids: Dict[Tuple[Item, ...], int],
+        transaction_candidate_ids: Iterable[Set[int]],
+        length: int,
+    ):
+        """
+        Replace the candidate IDs and the candidate-ID sets with the ones of a new level.
+        Transactions without any candidate are dropped.
+
+        Parameters:
+        candidate_ids (Dict[Tuple[Item, ...], int]): The IDs of the frequent candidates of the new level.
+        transaction_candidate_ids (Iterable[Set[int]]): The candidate-ID sets of the transactions.
+        length (int): The length of the candidates of the new level.
+        """
+        self.candidate_ids = candidate_ids
+        self.transaction_candidate_ids = [
+            candidate_id_set for candidate_id_set in transaction_candidate_ids if candidate_id_set
+        ]
+        self.length = length
+
+    def get_entry_count(self) -> int:
+        """
+        Get the number of candidate IDs stored over all transactions.
+
+        Returns:
+        int: The number of stored candidate IDs.
+        """
+        if self.transaction_candidate_ids is None:
+            return 0
+        return sum(len(candidate_ids) for candidate_ids in self.transaction_candidate_ids)
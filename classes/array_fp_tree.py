@@ -0,0 +1,294 @@
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from classes.item import Item
+from classes.item_tuple import ItemTuple
+from classes.fp_tree_header_table import FPTreeHeaderTable
+from classes.fp_tree_header_table_element import FPTreeHeaderTableElement
+
+
+class ArrayFPTree:
+    """
+    An FP-tree whose nodes are stored in parallel arrays of machine integers (a struct of arrays).
+
+    A node is identified by its index into the arrays, node 0 is the root. For every node the arrays hold the
+    rank of its item, its occurrence count, the index of its parent, the index of the next node with the same
+    item (the node link), the index of its first child and the index of its next sibling (-1 if there is none).
+    A node therefore takes a few machine integers instead of a Python object with a dictionary of children.
+
+    The children of a node are found by walking the sibling links. Nodes with many children (near the root)
+    additionally get a dictionary from the item ranks to the children, so an insertion does not have to walk
+    all of them. The head of the node-link chain and the overall occurrence count of every item are kept in
+    arrays that are updated while items are added.
+    """
+
+    # The number of children after which the children of a node are indexed by their item rank
+    CHILD_INDEX_THRESHOLD = 8
+
+    # Constructor
+    def __init__(self):
+        """
+        Initialize the ArrayFPTree with only the root node
+        """
+        # The items in the order they were added, their position is their rank
+        self.items: List[Item] = list()
+        self.item_ranks: Dict[Item, int] = dict()
+
+        # The nodes (the root has no item, no parent and no links)
+        self.node_item_ranks = array("l", [-1])
+        self.occurrence_counts = array("l", [0])
+        self.parents = array("l", [-1])
+        self.node_links = array("l", [-1])
+        self.first_children = array("l", [-1])
+        self.next_siblings = array("l", [-1])
+
+        # The first node and the overall occurrence count of every item rank
+        self.header_heads = array("l")
+        self.header_counts = array("l")
+
+        # The children (by item rank) of the nodes with many children
+        self.child_indexes: Dict[int, Dict[int, int]] = dict()
+
+        # The number of nodes that are not the first child of their parent (0 for a single path)
+        self.branch_count = 0
+
+        # The header table is built on request and discarded when items are added
+        self._header_table: Optional[FPTreeHeaderTable] = None
+
+    # Functions
+    def add_items_to_tree(self, item_tupel: ItemTuple, occurrence_count: int = 1):
+        """
+        Add a tuple of items to the ArrayFPTree (has to be sorted according to the f-list).
+
+        Parameters:
+        item_tupel (ItemTuple): The tuple of items to be added to the ArrayFPTree. (sorted according to the f-list)
+        occurrence_count (int): The number of occurrences of the item tuple. (default: 1)
+        """
+        self._header_table = None
+        item_ranks = self.item_ranks
+        occurrence_counts = self.occurrence_counts
+        header_counts = self.header_counts
+
+        # Start at the root node
+        node = 0
+        for item in item_tupel.items:
+            rank = item_ranks.get(item)
+            if rank is None:
+                rank = self._add_item(item)
+            header_counts[rank] += occurrence_count
+
+            # Increase the occurrence count of the child with the item or create it
+            child = self._find_child(node, rank)
+            if child < 0:
+                child = self._add_node(node, rank, occurrence_count)
+            else:
+                occurrence_counts[child] += occurrence_count
+            node = child
+
+    def _add_item(self, item: Item) -> int:
+        """
+        Give the next rank to a new item and add an empty header entry for it.
+
+        Parameters:
+        item (Item): The new item.
+
+        Returns:
+        int: The rank of the item.
+        """
+        rank = len(self.items)
+        self.items.append(item)
+        self.item_ranks[item] = rank
+        self.header_heads.append(-1)
+        self.header_counts.append(0)
+        return rank
+
+    def _find_child(self, node: int, rank: int) -> int:
+        """
+        Find the child of the given node with the given item rank.
+
+        Parameters:
+        node (int): The index of the parent node.
+        rank (int): The rank of the item.
+
+        Returns:
+        int: The index of the child, -1 if the node has no child with the item.
+        """
+        # Nodes with many children are looked up in their index
+        child_index = self.child_indexes.get(node)
+        if child_index is not None:
+            return child_index.get(rank, -1)
+
+        # Walk the siblings otherwise
+        node_item_ranks = self.node_item_ranks
+        next_siblings = self.next_siblings
+        child = self.first_children[node]
+        child_count = 0
+        while child >= 0:
+            if node_item_ranks[child] == rank:
+                return child
+            child = next_siblings[child]
+            child_count += 1
+
+        # Index the children once the walk gets too long
+        if child_count >= self.CHILD_INDEX_THRESHOLD:
+            child_index = dict()
+            child = self.first_children[node]
+            while child >= 0:
+                child_index[node_item_ranks[child]] = child
+                child = next_siblings[child]
+            self.child_indexes[node] = child_index
+        return -1
+
+    def _add_node(self, parent: int, rank: int, occurrence_count: int) -> int:
+        """
+        Add a new node as first child of the given parent and as head of the node-link chain of its item.
+
+        Parameters:
+        parent (int): The index of the parent node.
+        rank (int): The rank of the item of the new node.
+        occurrence_count (int): The occurrence count of the new node.
+
+        Returns:
+        int: The index of the new node.
+        """
+        node = len(self.occurrence_counts)
+        first_child = self.first_children[parent]
+        self.node_item_ranks.append(rank)
+        self.occurrence_counts.append(occurrence_count)
+        self.parents.append(parent)
+        self.node_links.append(self.header_heads[rank])
+        self.first_children.append(-1)
+        self.next_siblings.append(first_child)
+
+        # Link the node to its parent and to the other nodes of its item
+        self.first_children[parent] = node
+        self.header_heads[rank] = node
+        if first_child >= 0:
+            self.branch_count += 1
+        child_index = self.child_indexes.get(parent)
+        if child_index is not None:
+            child_index[rank] = node
+        return node
+
+    def get_header_table(self) -> FPTreeHeaderTable:
+        """
+        Get the HeaderTable of the ArrayFPTree. The node links of its elements are node indexes.
+
+        Returns:
+        FPTreeHeaderTable: The HeaderTable of the ArrayFPTree
+        """
+        if self._header_table is None:
+            header_table = FPTreeHeaderTable()
+            for rank, item in enumerate(self.items):
+                # Follow the node-link chain of the item
+                node_links = []
+                node = self.header_heads[rank]
+                while node >= 0:
+                    node_links.append(node)
+                    node = self.node_links[node]
+
+                header_table_element = FPTreeHeaderTableElement(
+                    item, self.header_counts[rank], node_links
+                )
+                header_table.elements.append(header_table_element)
+                header_table.elements_by_item[item] = header_table_element
+            self._header_table = header_table
+        return self._header_table
+
+    def get_prefix_paths(self, item: Item) -> List[Tuple[Tuple[Item, ...], int]]:
+        """
+        Get the non-empty prefix paths of all nodes of the given item.
+
+        Parameters:
+        item (Item): The item.
+
+        Returns:
+        List[Tuple[Tuple[Item, ...], int]]: The items from the root to the parent of every node of the item
+                                             (in f-list order) with the occurrence count of the node.
+        """
+        rank = self.item_ranks.get(item)
+        if rank is None:
+            return []
+
+        items = self.items
+        node_item_ranks = self.node_item_ranks
+        parents = self.parents
+        node_links = self.node_links
+
+        prefix_paths = []
+        node = self.header_heads[rank]
+        while node >= 0:
+            # Walk up the parent indexes to the root (node 0)
+            prefix_ranks = []
+            parent = parents[node]
+            while parent > 0:
+                prefix_ranks.append(node_item_ranks[parent])
+                parent = parents[parent]
+            if prefix_ranks:
+                prefix_ranks.reverse()
+                prefix_paths.append(
+                    (tuple(map(items.__getitem__, prefix_ranks)), self.occurrence_counts[node])
+                )
+            node = node_links[node]
+        return prefix_paths
+
+    def get_single_path(self) -> List[Tuple[Item, int]]:
+        """
+        Get the items and occurrence counts along the path from the root to the first leaf.
+
+        Returns:
+        List[Tuple[Item, int]]: The item and the occurrence count of every node on the path.
+        """
+        path = []
+        node = self.first_children[0]
+        while node >= 0:
+            path.append((self.items[self.node_item_ranks[node]], self.occurrence_counts[node]))
+            node = self.first_children[node]
+        return path
+
+    def is_single_path(self) -> bool:
+        """
+        Check whether the ArrayFPTree has only a single path
+
+        Returns:
+        bool: True if there is only a single path in the ArrayFPTree, False otherwise
+        """
+        # Every node that is not the first child of its parent starts a second path
+        return self.branch_count == 0
+
+    def is_empty(self) -> bool:
+        """
+        Check whether the ArrayFPTree is empty
+
+        Returns:
+        bool: True if the ArrayFPTree is empty, False otherwise
+        """
+        return self.get_node_count() == 0
+
+    def get_node_count(self) -> int:
+        """
+        Get the number of item nodes (without the root node)
+
+        Returns:
+        int: The number of item nodes.
+        """
+        return len(self.occurrence_counts) - 1
+
+    def get_size(self) -> int:
+        """
+        Get the size of the node and header arrays.
+
+        Returns:
+        int: The size (in bytes) of the node and header arrays.
+        """
+        arrays = (
+            self.node_item_ranks,
+            self.occurrence_counts,
+            self.parents,
+            self.node_links,
+            self.first_children,
+            self.next_siblings,
+            self.header_heads,
+            self.header_counts,
+        )
+        return sum(len(values) * values.itemsize for values in arrays)
@@ -0,0 +1,81 @@
+from math import log
+from typing import Hashable
+
+
+class BloomFilter:
+    """
+    A compact probabilistic set membership filter.
+
+    Every key sets a few bits in a bit array, chosen by double hashing of the hash of the key. A key whose bits
+    are not all set was never added, while a key whose bits are all set was added with a high probability
+    (roughly 0.6185^bits_per_key for false positives). The filter never stores the keys themselves.
+    """
+
+    def __init__(self, expected_count: int, bits_per_key: int = 10):
+        """
+        Initialize an empty filter.
+
+        Parameters:
+        expected_count (int): The number of keys that will be added. Must be a non-negative integer.
+        bits_per_key (int): The number of bits per expected key. Must be a positive integer. Default value is 10.
+        """
+        # Ensure that the filter can be built
+        if not isinstance(expected_count, int) or expected_count < 0:
+            raise ValueError("The expected number of keys must be a non-negative integer.")
+        if not isinstance(bits_per_key, int) or bits_per_key < 1:
+            raise ValueError("The number of bits per key must be a positive integer.")
+
+        # The optimal number of hash functions is bits_per_key * ln(2)
+        self.bit_count = max(8, expected_count * bits_per_key)
+        self.hash_count = max(1, round(bits_per_key * log(2)))
+        self.bits = bytearray((self.bit_count + 7) // 8)
+
+    # Functions
+    def add(self, key: Hashable):
+        """
+        Add the given key to the filter.
+
+        Parameters:
+        key (Hashable): The key.
+        """
+        # Double hashing: the positions are first_hash + i * second_hash (modulo the number of bits)
+        key_hash = hash(key) & 0xFFFFFFFFFFFFFFFF
+        position = key_hash & 0xFFFFFFFF
+        step = (key_hash >> 32) | 1
+        bits = self.bits
+        bit_count = self.bit_count
+        for _ in range(self.hash_count):
+            position %= bit_count
+            bits[position >> 3] |= 1 << (position & 7)
+            position += step
+
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Check whether the given key may have been added.
+
+        Parameters:
+        key (Hashable): The key.
+
+        Returns:
+        bool: False if the key was certainly not added, True if it was added with a high probability.
+        """
+        key_hash = hash(key) & 0xFFFFFFFFFFFFFFFF
+        position = key_hash & 0xFFFFFFFF
+        step = (key_hash >> 32) | 1
+        bits = self.bits
+        bit_count = self.bit_count
+        for _ in range(self.hash_count):
+            position %= bit_count
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+            position += step
+        return True
+
+    def get_size(self) -> int:
+        """
+        Get the size of the bit array.
+
+        Returns:
+        int: The size (in bytes) of the bit array.
+        """
+        return len(self.bits)
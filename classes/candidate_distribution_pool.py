@@ -0,0 +1,137 @@
+import multiprocessing
+from multiprocessing.connection import Connection
+from typing import Dict, List, Set
+
+from classes.dataset import Dataset
+from classes.item import Item
+from classes.itemset import Itemset
+from classes.itemsets_with_occurrence_counts import ItemsetsWithOccurrenceCounts
+
+
+def _mine_partition(connection: Connection, dataset: Dataset, counter):
+    """
+    Mine all frequent supersets of the received frequent itemsets that start with the same item
+    and send them back with their occurrence counts.
+
+    Parameters:
+    connection (Connection): The worker end of the pipe to the pool.
+    dataset (Dataset): The whole dataset.
+    counter (Apriori): The Apriori object whose counting method and minimum support are used.
+    """
+    frequent_current = connection.recv()
+    try:
+        frequent_itemset_counts = ItemsetsWithOccurrenceCounts(set())
+        while frequent_current:
+            # All candidates of the partition are joined from itemsets of the partition, but their subsets without
+            # the first item belong to other partitions
+            candidates = counter._generate_candidate_itemsets(
+                frequent_current, check_subsets_without_first_item=False
+            )
+            if not candidates:
+                break
+            itemsets_with_counts = counter._count_occurrences_of_itemsets(dataset, candidates)
+            level_counts = counter._get_frequent_itemset_counts(itemsets_with_counts)
+            frequent_itemset_counts.update(level_counts)
+            frequent_current = set(level_counts.keys())
+        connection.send(frequent_itemset_counts)
+    except Exception as exception:
+        connection.send(exception)
+    connection.close()
+
+
+class CandidateDistributionPool:
+    """
+    A pool of worker processes for the candidate distribution algorithm (Agrawal and Shafer).
+
+    The frequent itemsets are partitioned by their first item (by name). Every worker holds the whole dataset
+    and mines its partition independently: the candidates of the next level that start with an item of the
+    partition are exactly the joins of frequent itemsets of the partition, so no candidates have to be
+    exchanged. Only the subsets of a candidate within the partition are checked before it is counted.
+    """
+
+    def __init__(self, dataset: Dataset, counter, worker_count: int):
+        """
+        Initialize the pool.
+
+        Parameters:
+        dataset (Dataset): The dataset every worker mines.
+        counter (Apriori): The Apriori object whose counting method and minimum support the workers use.
+        worker_count (int): The number of worker processes. Must be a positive integer.
+        """
+        # Ensure that there is at least one worker
+        if not isinstance(worker_count, int) or worker_count < 1:
+            raise ValueError("The number of workers must be a positive integer.")
+
+        self.dataset = dataset
+        self.counter = counter
+        self.worker_count = worker_count
+
+    # Functions
+    def partition_itemsets(self, frequent_itemsets: Set[Itemset]) -> List[Set[Itemset]]:
+        """
+        Partition the frequent itemsets by their first item, balancing the number of itemsets per partition.
+
+        Parameters:
+        frequent_itemsets (Set[Itemset]): The frequent itemsets of one length.
+
+        Returns:
+        List[Set[Itemset]]: One partition per worker (some can be empty).
+        """
+        # Group the itemsets by their first item
+        groups: Dict[Item, Set[Itemset]] = dict()
+        for itemset in frequent_itemsets:
+            first_item = min(itemset.items, key=lambda item: item.name)
+            groups.setdefault(first_item, set()).add(itemset)
+
+        # Assign the largest groups first, always to the smallest partition
+        partitions: List[Set[Itemset]] = [set() for _ in range(self.worker_count)]
+        for first_item in sorted(groups, key=lambda item: (-len(groups[item]), item.name)):
+            min(partitions, key=len).update(groups[first_item])
+        return partitions
+
+    def mine(self, frequent_itemsets: Set[Itemset]) -> ItemsetsWithOccurrenceCounts:
+        """
+        Mine all frequent supersets of the given frequent itemsets in parallel.
+
+        Parameters:
+        frequent_itemsets (Set[Itemset]): The frequent itemsets of one length (at least two items).
+
+        Returns:
+        ItemsetsWithOccurrenceCounts: The frequent itemsets that are longer than the given ones with their occurrence counts.
+        """
+        connections: List[Connection] = []
+        processes: List[multiprocessing.Process] = []
+        try:
+            # Start one worker per non-empty partition and send it the partition
+            for partition in self.partition_itemsets(frequent_itemsets):
+                if not partition:
+                    continue
+                connection, worker_connection = multiprocessing.Pipe()
+                process = multiprocessing.Process(
+                    target=_mine_partition,
+                    args=(worker_connection, self.dataset, self.counter),
+                    daemon=True,
+                )
+                process.start()
+                worker_connection.close()
+                connection.send(partition)
+                connections.append(connection)
+                processes.append(process)
+
+            # Collect the frequent itemsets of all partitions
+            result = ItemsetsWithOccurrenceCounts(set())
+            error = None
+            for connection in connections:
+                partial_result = connection.recv()
+                if isinstance(partial_result, Exception):
+                    error = partial_result
+                    continue
+                result.update(partial_result)
+            if error is not None:
+                raise error
+            return result
+        finally:
+            for connection in connections:
+                connection.close()
+            for process in processes:
+                process.join()
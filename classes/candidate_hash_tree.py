@@ -0,0 +1,169 @@
+from typing import Dict, FrozenSet, List, Set, Tuple
+
+from classes.candidate_hash_tree_node import CandidateHashTreeNode
+from classes.dataset import Dataset
+from classes.item import Item
+from classes.itemset import Itemset
+from classes.itemsets_with_occurrence_counts import ItemsetsWithOccurrenceCounts
+
+
+class CandidateHashTree:
+    """
+    The classic Apriori hash tree over candidate itemsets of the same length k.
+
+    Every transaction is pushed through the tree once. At depth d the tree is descended for every item
+    of the transaction that can still be the d-th item of a contained candidate, so only the leaves with
+    candidates the transaction can possibly contain are visited and checked.
+    """
+
+    def __init__(self, itemsets: Set[Itemset], leaf_size: int = 8, fan_out: int = 8):
+        """
+        Initialize the hash tree with the given candidate itemsets.
+
+        Parameters:
+        itemsets (Set[Itemset]): The candidate itemsets (all of the same, non-zero length).
+        leaf_size (int): The number of candidates a leaf can hold before it is split. Default value is 8.
+        fan_out (int): The number of children of an interior node. Default value is 8.
+        """
+        # Save the arguments
+        self.leaf_size = leaf_size
+        self.fan_out = fan_out
+
+        # Rank the items of the candidates by their name
+        items = sorted(
+            {item for itemset in itemsets for item in itemset.items},
+            key=lambda item: item.name,
+        )
+        self.item_ranks: Dict[Item, int] = {item: rank for rank, item in enumerate(items)}
+
+        # Remember the itemset of every encoded candidate
+        self.itemsets: Dict[Tuple[int, ...], Itemset] = dict()
+        for itemset in itemsets:
+            candidate = tuple(sorted(self.item_ranks[item] for item in itemset.items))
+            self.itemsets[candidate] = itemset
+        self.length = len(next(iter(self.itemsets))) if self.itemsets else 0
+
+        # Insert all candidates into the tree
+        self.root = CandidateHashTreeNode(0)
+        for candidate in self.itemsets:
+            self._insert(candidate)
+
+        # The number of transactions pushed through the tree so far
+        self.transaction_number = 0
+
+    # Functions
+    def _insert(self, candidate: Tuple[int, ...]):
+        """
+        Insert an encoded candidate into the tree.
+
+        Parameters:
+        candidate (Tuple[int, ...]): The sorted item ranks of the candidate.
+        """
+        # Descend to the leaf responsible for the candidate
+        node = self.root
+        while not node.is_leaf():
+            node = node.children[candidate[node.depth] % self.fan_out]
+
+        # Add the candidate to the leaf
+        node.candidates.append(candidate)
+        node.candidate_rank_sets.append(frozenset(candidate))
+        node.occurrence_counts.append(0)
+
+        # Split the leaf if it is too large and there are items left to hash on
+        if len(node.candidates) > self.leaf_size and node.depth < self.length:
+            candidates = node.candidates
+            node.children = [
+                CandidateHashTreeNode(node.depth + 1) for _ in range(self.fan_out)
+            ]
+            node.candidates = list()
+            node.candidate_rank_sets = list()
+            node.occurrence_counts = list()
+            for candidate in candidates:
+                self._insert(candidate)
+
+    def add_transaction(self, items: Itemset):
+        """
+        Push a transaction through the tree and increment the counts of all contained candidates.
+
+        Parameters:
+        items (Itemset): The items of the transaction.
+        """
+        self.transaction_number += 1
+
+        # Encode the transaction (items that are not part of any candidate are irrelevant)
+        ranks = sorted(
+            self.item_ranks[item] for item in items if item in self.item_ranks
+        )
+        if len(ranks) < self.length or self.length == 0:
+            return
+
+        self._count_subsets(self.root, ranks, frozenset(ranks), 0)
+
+    def _count_subsets(
+        self,
+        node: CandidateHashTreeNode,
+        ranks: List[int],
+        rank_set: FrozenSet[int],
+        start: int,
+    ):
+        """
+        Recursively visit all leaves that can hold candidates contained in the transaction.
+
+        Parameters:
+        node (CandidateHashTreeNode): The current node.
+        ranks (List[int]): The sorted item ranks of the transaction.
+        rank_set (FrozenSet[int]): The item ranks of the transaction as a set.
+        start (int): The position of the first transaction item that can be hashed at this node.
+        """
+        if node.is_leaf():
+            # A leaf can be reached on several paths, but a transaction must only be counted once
+            if node.last_transaction_number == self.transaction_number:
+                return
+            node.last_transaction_number = self.transaction_number
+
+            # Increment the counts of the contained candidates
+            for index, candidate_rank_set in enumerate(node.candidate_rank_sets):
+                if candidate_rank_set <= rank_set:
+                    node.occurrence_counts[index] += 1
+            return
+
+        # Hash every item that leaves enough items for the rest of a candidate
+        for position in range(start, len(ranks) - (self.length - node.depth) + 1):
+            child = node.children[ranks[position] % self.fan_out]
+            self._count_subsets(child, ranks, rank_set, position + 1)
+
+    def get_itemsets_with_occurrence_counts(self) -> ItemsetsWithOccurrenceCounts:
+        """
+        Get the candidates with the occurrence counts collected so far.
+
+        Returns:
+        ItemsetsWithOccurrenceCounts: A dictionary containing the itemsets as keys and their occurrence counts as values.
+        """
+        result = ItemsetsWithOccurrenceCounts(set())
+
+        # Collect the counts of all leaves
+        nodes = [self.root]
+        while nodes:
+            node = nodes.pop()
+            if node.is_leaf():
+                for candidate, count in zip(node.candidates, node.occurrence_counts):
+                    result.set_occurrence_count(self.itemsets[candidate], count)
+            else:
+                nodes.extend(node.children)
+        return result
+
+    def count_occurrences_in_dataset(
+        self, dataset: Dataset
+    ) -> ItemsetsWithOccurrenceCounts:
+        """
+        Count the occurrences of the candidates in the given dataset with a single scan.
+
+        Parameters:
+        dataset (Dataset): The dataset for which the candidate occurrences should be counted.
+
+        Returns:
+        ItemsetsWithOccurrenceCounts: A dictionary containing the itemsets as keys and their occurrence counts as values.
+        """
+        for transaction in dataset.transactions:
+            self.add_transaction(transaction.items)
+        return self.get_itemsets_with_occurrence_counts()
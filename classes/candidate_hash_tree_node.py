@@ -0,0 +1,40 @@
+from typing import FrozenSet, List, Optional, Tuple
+
+
+class CandidateHashTreeNode:
+    """
+    A single node of the candidate hash tree.
+
+    A leaf node stores the candidates (as sorted tuples of item ranks) together with their occurrence counts.
+    An interior node stores its child nodes, which are selected by hashing the item rank at the depth of the node.
+    """
+
+    def __init__(self, depth: int):
+        """
+        Initialize the node as an empty leaf.
+
+        Parameters:
+        depth (int): The depth of the node in the hash tree (the root node has depth 0).
+        """
+        # Save the arguments
+        self.depth = depth
+
+        # A leaf node has no children
+        self.children: Optional[List["CandidateHashTreeNode"]] = None
+
+        # The candidates stored in a leaf node with their rank sets and occurrence counts
+        self.candidates: List[Tuple[int, ...]] = list()
+        self.candidate_rank_sets: List[FrozenSet[int]] = list()
+        self.occurrence_counts: List[int] = list()
+
+        # The number of the last transaction that reached this leaf (to count a transaction only once)
+        self.last_transaction_number = -1
+
+    def is_leaf(self) -> bool:
+        """
+        Check whether the node is a leaf node.
+
+        Returns:
+        bool: True if the node is a leaf node, False otherwise
+        """
+        return self.children is None
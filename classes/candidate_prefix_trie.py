@@ -0,0 +1,143 @@
+from typing import Dict, List, Optional, Set
+
+from classes.candidate_prefix_trie_node import CandidatePrefixTrieNode
+from classes.dataset import Dataset
+from classes.item import Item
+from classes.itemset import Itemset
+from classes.itemset_count_table import ItemsetCountTable
+from classes.itemsets_with_occurrence_counts import ItemsetsWithOccurrenceCounts
+
+
+class CandidatePrefixTrie:
+    """
+    A prefix trie over rank-sorted candidate itemsets.
+
+    Every transaction walks the trie once: starting at the root, the walk descends into the child of every
+    (rank-sorted) transaction item, so every contained candidate is reached and incremented exactly once.
+    The memory of the trie is proportional to the number of distinct candidate prefixes.
+    The occurrence counts are kept in an ItemsetCountTable, the nodes only hold the IDs of the candidates.
+    """
+
+    def __init__(self, itemsets: Set[Itemset]):
+        """
+        Initialize the prefix trie with the given candidate itemsets.
+
+        Parameters:
+        itemsets (Set[Itemset]): The candidate itemsets (can be of different lengths).
+        """
+        # Rank the items of the candidates by their name
+        items = sorted(
+            {item for itemset in itemsets for item in itemset.items},
+            key=lambda item: item.name,
+        )
+        self.item_ranks: Dict[Item, int] = {item: rank for rank, item in enumerate(items)}
+
+        # Number the candidates and count their occurrences in a table
+        self.count_table = ItemsetCountTable()
+
+        # The ID of the empty candidate (if any)
+        self.empty_itemset_id: Optional[int] = None
+
+        # Insert all candidates into the trie
+        self.root = CandidatePrefixTrieNode()
+        for itemset in itemsets:
+            ranks = sorted(self.item_ranks[item] for item in itemset.items)
+            if not ranks:
+                self.empty_itemset_id = self.count_table.add(itemset)
+                continue
+
+            # Descend along the prefix and store the ID at the last item
+            node = self.root
+            for rank in ranks[:-1]:
+                child = node.children.get(rank)
+                if child is None:
+                    child = CandidatePrefixTrieNode()
+                    node.children[rank] = child
+                node = child
+            node.itemset_ids[ranks[-1]] = self.count_table.add(itemset)
+
+    # Functions
+    def add_transaction(
+        self, items: Itemset, contained_itemsets: Optional[List[Itemset]] = None
+    ):
+        """
+        Walk the trie with a transaction and increment the counts of all contained candidates.
+
+        Parameters:
+        items (Itemset): The items of the transaction.
+        contained_itemsets (Optional[List[Itemset]]): If given, the contained candidates are appended to this list.
+        """
+        contained_ids: List[int] = []
+
+        # The empty itemset is contained in every transaction
+        if self.empty_itemset_id is not None:
+            contained_ids.append(self.empty_itemset_id)
+
+        # Encode the transaction (items that are not part of any candidate are irrelevant)
+        ranks = sorted(
+            self.item_ranks[item] for item in items if item in self.item_ranks
+        )
+        self._walk(self.root, ranks, 0, contained_ids)
+
+        # Count all contained candidates at once
+        self.count_table.add_occurrences(contained_ids)
+        if contained_itemsets is not None:
+            contained_itemsets.extend(map(self.count_table.itemsets.__getitem__, contained_ids))
+
+    def _walk(
+        self,
+        node: CandidatePrefixTrieNode,
+        ranks: List[int],
+        start: int,
+        contained_ids: List[int],
+    ):
+        """
+        Collect the contained candidates and recursively descend into the children that match a remaining
+        transaction item.
+
+        Parameters:
+        node (CandidatePrefixTrieNode): The current node.
+        ranks (List[int]): The sorted item ranks of the transaction.
+        start (int): The position of the first transaction item that can follow the current prefix.
+        contained_ids (List[int]): The IDs of the contained candidates are appended to this list.
+        """
+        # The candidates that end with a remaining transaction item are contained
+        itemset_ids = node.itemset_ids
+        if itemset_ids:
+            for position in range(start, len(ranks)):
+                itemset_id = itemset_ids.get(ranks[position])
+                if itemset_id is not None:
+                    contained_ids.append(itemset_id)
+
+        # Descend into the children of the remaining transaction items
+        children = node.children
+        if children:
+            for position in range(start, len(ranks)):
+                child = children.get(ranks[position])
+                if child is not None:
+                    self._walk(child, ranks, position + 1, contained_ids)
+
+    def get_itemsets_with_occurrence_counts(self) -> ItemsetsWithOccurrenceCounts:
+        """
+        Get the candidates with the occurrence counts collected so far.
+
+        Returns:
+        ItemsetsWithOccurrenceCounts: A dictionary containing the itemsets as keys and their occurrence counts as values.
+        """
+        return self.count_table.to_itemsets_with_occurrence_counts()
+
+    def count_occurrences_in_dataset(
+        self, dataset: Dataset
+    ) -> ItemsetsWithOccurrenceCounts:
+        """
+        Count the occurrences of the candidates in the given dataset with a single scan.
+
+        Parameters:
+        dataset (Dataset): The dataset for which the candidate occurrences should be counted.
+
+        Returns:
+        ItemsetsWithOccurrenceCounts: A dictionary containing the itemsets as keys and their occurrence counts as values.
+        """
+        for transaction in dataset.transactions:
+            self.add_transaction(transaction.items)
+        return self.get_itemsets_with_occurrence_counts()
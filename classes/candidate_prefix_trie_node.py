@@ -0,0 +1,21 @@
+from typing import Dict
+
+
+class CandidatePrefixTrieNode:
+    """
+    A single node of the candidate prefix trie.
+
+    The path from the root to a node spells a prefix of rank-sorted candidates.
+    A candidate that ends with the next item is not stored as a node of its own: the node holds the ID of the
+    candidate in the count table of the trie, keyed by the rank of that item.
+    """
+
+    def __init__(self):
+        """
+        Initialize the node without children and without candidates.
+        """
+        # The child nodes keyed by the item rank
+        self.children: Dict[int, "CandidatePrefixTrieNode"] = dict()
+
+        # The IDs of the candidates that end with the item of the rank
+        self.itemset_ids: Dict[int, int] = dict()
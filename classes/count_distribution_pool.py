@@ -0,0 +1,126 @@
+import multiprocessing
+from multiprocessing.connection import Connection
+from typing import List, Set
+
+from classes.dataset import Dataset
+from classes.itemset import Itemset
+from classes.itemsets_with_occurrence_counts import ItemsetsWithOccurrenceCounts
+
+
+def _count_shard(connection: Connection, shard: Dataset, counter):
+    """
+    Count the candidates sent through the connection in a shard until None is received.
+
+    Parameters:
+    connection (Connection): The worker end of the pipe to the pool.
+    shard (Dataset): The transactions of the worker.
+    counter (Apriori): The Apriori object whose counting method is used on the shard.
+    """
+    while True:
+        itemsets = connection.recv()
+        if itemsets is None:
+            break
+        try:
+            counts = counter._count_occurrences_of_itemsets(shard, set(itemsets))
+            connection.send([counts.get_occurrence_count(itemset) for itemset in itemsets])
+        except Exception as exception:
+            connection.send(exception)
+    connection.close()
+
+
+class CountDistributionPool:
+    """
+    A pool of worker processes for the count distribution algorithm (Agrawal and Shafer).
+
+    Every worker holds a horizontal shard of the dataset for the lifetime of the pool, so the dataset is only
+    sent once. On every level, all workers count the full set of candidates on their shard in parallel and
+    the partial counts are summed.
+    """
+
+    def __init__(self, dataset: Dataset, counter, worker_count: int):
+        """
+        Start the worker processes and distribute the dataset.
+
+        Parameters:
+        dataset (Dataset): The dataset to be distributed.
+        counter (Apriori): The Apriori object whose counting method the workers use on their shards.
+        worker_count (int): The number of worker processes. Must be a positive integer.
+        """
+        # Ensure that there is at least one worker
+        if not isinstance(worker_count, int) or worker_count < 1:
+            raise ValueError("The number of workers must be a positive integer.")
+
+        # Deal the transactions to the shards
+        shards: List[list] = [[] for _ in range(worker_count)]
+        for position, transaction in enumerate(dataset.transactions):
+            shards[position % worker_count].append(transaction)
+
+        # Start one worker per shard
+        self.connections: List[Connection] = []
+        self.processes: List[multiprocessing.Process] = []
+        for shard in shards:
+            connection, worker_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_count_shard,
+                args=(worker_connection, Dataset(tuple(shard)), counter),
+                daemon=True,
+            )
+            process.start()
+            worker_connection.close()
+            self.connections.append(connection)
+            self.processes.append(process)
+
+    # Functions
+    def count_occurrences_of_itemsets(
+        self, itemsets: Set[Itemset]
+    ) -> ItemsetsWithOccurrenceCounts:
+        """
+        Count the occurrences of the given itemsets on all shards and sum the partial counts.
+
+        Parameters:
+        itemsets (Set[Itemset]): The itemsets for which the occurrences should be counted.
+
+        Returns:
+        ItemsetsWithOccurrenceCounts: A dictionary containing the itemsets as keys and their occurrence counts as values.
+        """
+        # Send the candidates to all workers before waiting for any of them
+        itemsets = list(itemsets)
+        for connection in self.connections:
+            connection.send(itemsets)
+
+        # Sum the partial counts (in the order of the candidates)
+        counts = [0] * len(itemsets)
+        error = None
+        for connection in self.connections:
+            partial_counts = connection.recv()
+            if isinstance(partial_counts, Exception):
+                error = partial_counts
+                continue
+            for position, count in enumerate(partial_counts):
+                counts[position] += count
+        if error is not None:
+            raise error
+
+        result = ItemsetsWithOccurrenceCounts(set())
+        for itemset, count in zip(itemsets, counts):
+            result.set_occurrence_count(itemset, count)
+        return result
+
+    def close(self):
+        """Stop the worker processes."""
+        for connection in self.connections:
+            try:
+                connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            connection.close()
+        for process in self.processes:
+            process.join()
+        self.connections = []
+        self.processes = []
+
+    def __enter__(self) -> "CountDistributionPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import FrozenSet
+from typing import FrozenSet, Tuple, Union
 
 from classes.transaction import Transaction
 
@@ -8,4 +8,5 @@ from classes.transaction import Transaction
 class Dataset:
     """A class representing a (transactional) dataset."""
 
-    transactions: FrozenSet[Transaction]
+    # The transactions (a tuple where equal transactions have to be counted separately, e.g. after trimming)
+    transactions: Union[FrozenSet[Transaction], Tuple[Transaction, ...]]
@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+from typing import Dict, Set
+
+from classes.dataset import Dataset
+from classes.item import Item
+
+
+@dataclass(frozen=True)
+class DatasetProfile:
+    """A class representing the shape of a dataset: the distribution of the transaction lengths and the item counts."""
+
+    transaction_length_counts: Dict[int, int]
+    item_counts: Dict[Item, int]
+
+    @staticmethod
+    def from_dataset(dataset: Dataset) -> "DatasetProfile":
+        """
+        Profile the given dataset with a single scan.
+
+        Parameters:
+        dataset (Dataset): The dataset to be profiled.
+
+        Returns:
+        DatasetProfile: The profile of the dataset.
+        """
+        transaction_length_counts = dict()
+        item_counts = dict()
+        for transaction in dataset.transactions:
+            length = len(transaction.items.items)
+            transaction_length_counts[length] = transaction_length_counts.get(length, 0) + 1
+            for item in transaction.items:
+                item_counts[item] = item_counts.get(item, 0) + 1
+        return DatasetProfile(transaction_length_counts, item_counts)
+
+    def get_item_occurrence_count(self) -> int:
+        """
+        Get the number of item occurrences over all transactions.
+
+        Returns:
+        int: The sum of all transaction lengths.
+        """
+        return sum(length * count for length, count in self.transaction_length_counts.items())
+
+    def trim(self, items: Set[Item], transaction_length_counts: Dict[int, int]) -> "DatasetProfile":
+        """
+        Derive the profile of a trimmed dataset without scanning it again.
+        The item counts are those of this profile restricted to the remaining items, so they are upper bounds
+        of the counts in the trimmed dataset (dropped transactions are not subtracted).
+
+        Parameters:
+        items (Set[Item]): The items that remain in the trimmed dataset.
+        transaction_length_counts (Dict[int, int]): The distribution of the transaction lengths of the trimmed dataset.
+
+        Returns:
+        DatasetProfile: The (estimated) profile of the trimmed dataset.
+        """
+        return DatasetProfile(
+            transaction_length_counts,
+            {item: count for item, count in self.item_counts.items() if item in items},
+        )
@@ -1,5 +1,6 @@
-from typing import List
+from typing import List, Tuple
 
+from classes.item import Item
 from classes.fp_tree_root_node import FPTreeRootNode
 from classes.fp_tree_item_node import FPTreeItemNode
 from classes.item_tuple import ItemTuple
@@ -17,6 +18,9 @@ class FPTree:
         # Create a root node for the tree
         self.root = FPTreeRootNode()
 
+        # Create the header table, it is kept up to date while items are added
+        self.header_table = FPTreeHeaderTable()
+
     # Functions
     def add_items_to_tree(self, item_tupel: ItemTuple, occurrence_count: int = 1):
         """
@@ -28,19 +32,23 @@ class FPTree:
         """
         # Set the root node as current node
         current_node = self.root
+        header_table = self.header_table
 
         # Iterate through the item_tupel
         for item in item_tupel.items:
-            # Check if the item is already present as a child of the current node
-            if len([x for x in current_node.childs if x.item == item]) > 0:
+            # Look up the child of the current node with the item (if present)
+            child = current_node.children.get(item)
+            if child is not None:
                 # Set the node with the item to be the current_node
-                current_node = [x for x in current_node.childs if x.item == item][0]
+                current_node = child
 
-                # Increase the occurrence count of that node
+                # Increase the occurrence count of that node and of its item
                 current_node.occurrence_count += occurrence_count
+                header_table.add_occurrence_count(item, occurrence_count)
             else:
-                # Create a new node
+                # Create a new node and link it in the header table
                 new_node = FPTreeItemNode(item, occurrence_count, current_node)
+                header_table.add_node(new_node)
 
                 # Set the new_node as current_node
                 current_node = new_node
@@ -52,14 +60,48 @@ class FPTree:
         Returns:
         FPTreeHeaderTable: The HeaderTable of the FPTree
         """
-        # Create a FPTreeHeaderTable
-        header_table = FPTreeHeaderTable()
+        # The header table is maintained by add_items_to_tree()
+        return self.header_table
+
+    def get_prefix_paths(self, item: Item) -> List[Tuple[Tuple[Item, ...], int]]:
+        """
+        Get the non-empty prefix paths of all nodes of the given item.
 
-        # Call the add_to_header_table() function of the FPTreeRootNode
-        self.root.add_to_header_table(header_table)
+        Parameters:
+        item (Item): The item.
 
-        # Return the header_table
-        return header_table
+        Returns:
+        List[Tuple[Tuple[Item, ...], int]]: The items from the root to the parent of every node of the item
+                                             (in f-list order) with the occurrence count of the node.
+        """
+        header_table_element = self.header_table.get_element(item)
+        if header_table_element is None:
+            return []
+
+        # Collect the predecessors of every node of the item
+        prefix_paths = []
+        for node in header_table_element.node_links:
+            predecessors = node.get_predecessors()
+            if predecessors:
+                prefix_paths.append(
+                    (tuple(predecessor.item for predecessor in predecessors), node.occurrence_count)
+                )
+        return prefix_paths
+
+    def get_single_path(self) -> List[Tuple[Item, int]]:
+        """
+        Get the items and occurrence counts along the path from the root to the first leaf.
+
+        Returns:
+        List[Tuple[Item, int]]: The item and the occurrence count of every node on the path.
+        """
+        path = []
+        children = self.root.children
+        while children:
+            node = next(iter(children.values()))
+            path.append((node.item, node.occurrence_count))
+            children = node.children
+        return path
 
     def get_all_item_nodes(self) -> List[FPTreeItemNode]:
         """
@@ -1,20 +1,71 @@
-from typing import List
+from typing import Dict, List, Optional
 
+from classes.item import Item
+from classes.fp_tree_node import FPTreeNode
 from classes.fp_tree_header_table_element import FPTreeHeaderTableElement
 
 
 class FPTreeHeaderTable:
-    """A class representing the header table of an FP-tree"""
+    """
+    A class representing the header table of an FP-tree.
+
+    The elements are indexed by their item, so an element is found with a single dictionary lookup.
+    The FPTree keeps its header table up to date while items are added, so the node links and the overall
+    occurrence counts do not have to be collected by walking the tree.
+    """
 
     # Constructor
     def __init__(self):
         """
         Initialize the HeaderTable
         """
-        # Save the arguments
+        # The elements in the order their items were added
         self.elements: List[FPTreeHeaderTableElement] = list()
 
+        # The element of every item
+        self.elements_by_item: Dict[Item, FPTreeHeaderTableElement] = dict()
+
     # Function(s)
+    def get_element(self, item: Item) -> Optional[FPTreeHeaderTableElement]:
+        """
+        Get the element of the given item.
+
+        Parameters:
+        item (Item): The item.
+
+        Returns:
+        Optional[FPTreeHeaderTableElement]: The element of the item, None if the item is not in the header table.
+        """
+        return self.elements_by_item.get(item)
+
+    def add_node(self, node: FPTreeNode):
+        """
+        Link the given item node and add its occurrence count to the element of its item.
+
+        Parameters:
+        node (FPTreeNode): The item node.
+        """
+        header_table_element = self.elements_by_item.get(node.item)
+        if header_table_element is None:
+            # Create a new HeaderTableElement for the item
+            header_table_element = FPTreeHeaderTableElement(node.item, 0, [])
+            self.elements_by_item[node.item] = header_table_element
+            self.elements.append(header_table_element)
+
+        # Link the node and add its occurrence count to the overall occurrence count
+        header_table_element.node_links.append(node)
+        header_table_element.overall_occurrence_count += node.occurrence_count
+
+    def add_occurrence_count(self, item: Item, occurrence_count: int):
+        """
+        Add the given occurrence count to the overall occurrence count of an item that is already in the header table.
+
+        Parameters:
+        item (Item): The item.
+        occurrence_count (int): The occurrence count to add.
+        """
+        self.elements_by_item[item].overall_occurrence_count += occurrence_count
+
     def __str__(self) -> str:
         """
         Get a human-readable string representation of the FPTreeHeaderTable
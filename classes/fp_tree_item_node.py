@@ -1,8 +1,7 @@
-from typing import List
+from typing import List, Tuple
 
 from classes.item import Item
 from classes.fp_tree_node import FPTreeNode
-from classes.fp_tree_header_table_element import FPTreeHeaderTableElement
 from classes.fp_tree_header_table import FPTreeHeaderTable
 
 
@@ -30,97 +29,80 @@ class FPTreeItemNode(FPTreeNode):
         self.parent = parent
 
         # Set the other parameters used later in the lifespan
-        self.childs = list()
+        self.children = dict()
 
-        # Save the node as child in the parent node
-        parent.childs.append(self)
+        # Save the node as child (keyed by its item) in the parent node
+        parent.children[item] = self
 
     # Functions
     def add_to_header_table(self, header_table: FPTreeHeaderTable):
         """
-        Add this FPTreeItemNode to the given FPTreeHeaderTable.
+        Add this FPTreeItemNode and all nodes below it to the given FPTreeHeaderTable.
 
         Parameters:
-        header_table (FPTreeHeaderTable): The FPTreeHeaderTable to which the node should be added.
+        header_table (FPTreeHeaderTable): The FPTreeHeaderTable to which the nodes should be added.
         """
-        # Check if there already is a element for this item
-        if len([x for x in header_table.elements if x.item == self.item]) > 0:
-            # If there is already an element for this item in the HeaderTable
-            # Get the element
-            header_table_element = [
-                x for x in header_table.elements if x.item == self.item
-            ][0]
-
-            # Add the occurrence count to the overall occurrence count
-            header_table_element.overall_occurrence_count += self.occurrence_count
-
-            # Add the ItemNode itself to the element_node_links
-            header_table_element.node_links.append(self)
-        else:
-            # If there is no element for this item in the HeaderTable
-            # Create a new HeaderTableElement
-            header_table_element = FPTreeHeaderTableElement(
-                self.item, self.occurrence_count, [self]
-            )
+        # Visit the nodes in depth-first order with an explicit stack (deep trees would exceed the recursion limit)
+        stack = [self]
+        while stack:
+            node = stack.pop()
 
-            # Add it to the HeaderTable
-            header_table.elements.append(header_table_element)
+            # Link the node in the element of its item (the element is created if necessary)
+            header_table.add_node(node)
 
-        # Do a recursive call to add_to_header_table for all childs
-        for child in self.childs:
-            # Recursive call of the add_to_header_table() function
-            child.add_to_header_table(header_table)
+            # Push the childs in reverse order, so they are visited in insertion order
+            stack.extend(reversed(node.children.values()))
 
-    def get_predecessors(self) -> List[FPTreeNode]:
+    def get_predecessors(self) -> Tuple[FPTreeNode, ...]:
         """
         Get the predecessors of this item node (excluding the root node)
 
         Returns:
-        List[FPTreeNode]: The predecessors of this item node.
+        Tuple[FPTreeNode, ...]: The predecessors of this item node, starting below the root node.
         """
+        # Walk up the parents once, the root node is the only node without a parent
+        predecessors = []
+        node = self.parent
+        while node.parent is not None:
+            predecessors.append(node)
+            node = node.parent
 
-        # Get the parents predecessors
-        predecessors = self.parent.get_predecessors()
-
-        # Add the parent to the predecessors if it is not the root node
-        if self.parent.parent != None:
-            predecessors.append(self.parent)
-
-        # Return the predecessors
-        return predecessors
+        # The predecessors were collected from the bottom to the top
+        predecessors.reverse()
+        return tuple(predecessors)
 
     def get_all_item_nodes(self) -> List[FPTreeNode]:
         """
-        Get all item nodes within the FPTree
+        Get this item node and all item nodes below it
 
         Returns:
-        List[FPTreeNode]: All item nodes within the FPTree.
+        List[FPTreeNode]: The item nodes in depth-first order.
         """
-        # Init an list and add this node to it
-        node_list = [self]
+        node_list = []
 
-        # Go through all childs and add their lists to this node_list
-        for child in self.childs:
-            node_list.extend(child.get_all_item_nodes())
+        # Visit the nodes in depth-first order with an explicit stack
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            node_list.append(node)
+            stack.extend(reversed(node.children.values()))
 
         return node_list
 
     def is_single_path(self) -> bool:
         """
-        Check whether the RootNode has only a single path behind it
+        Check whether the ItemNode has only a single path behind it
 
         Returns:
-        bool: True if there is only a single path behind the RootNode, False otherwise
+        bool: True if there is only a single path behind the ItemNode, False otherwise
         """
-        # If there is more then one child return False
-        if len(self.childs) > 1:
-            return False
-        # If there is exactly one child ask that child if there is only a single path
-        elif len(self.childs) == 1:
-            return self.childs[0].is_single_path()
-        # If there are no childs there is only a single path
-        else:
-            return True
+        # Follow the only child as long as there is exactly one
+        node = self
+        while len(node.children) == 1:
+            node = next(iter(node.children.values()))
+
+        # If there is more then one child there is more than one path, if there are no childs the path ends
+        return len(node.children) == 0
 
     def __str__(self, level: int = 0) -> str:
         """
@@ -132,23 +114,23 @@ class FPTreeItemNode(FPTreeNode):
         Returns:
         str: A human-readable string representation of the FPTreeItemNode.
         """
-        # Get the string representation of the FPTreeItemNode
-        string_representation = (
-            (" " * (level - 1) * 2)
-            + "├── "
-            + self.item.name
-            + ": "
-            + str(self.occurrence_count)
-        )
-
-        # Get the string representations of all childs
-        for child in self.childs:
-            string_representation = (
-                string_representation + "\n" + child.__str__(level + 1)
+        lines = []
+
+        # Visit the nodes in depth-first order with an explicit stack of nodes and their levels
+        stack = [(self, level)]
+        while stack:
+            node, node_level = stack.pop()
+            lines.append(
+                (" " * (node_level - 1) * 2)
+                + "├── "
+                + node.item.name
+                + ": "
+                + str(node.occurrence_count)
             )
+            stack.extend((child, node_level + 1) for child in reversed(node.children.values()))
 
         # Return the string representation
-        return string_representation
+        return "\n".join(lines)
 
     def __eq__(self, value: object) -> bool:
         """
@@ -161,19 +143,21 @@ class FPTreeItemNode(FPTreeNode):
         Returns:
         bool: True if the FPTreeItemNodes are equal, False otherwise
         """
-        if not isinstance(value, FPTreeItemNode):
-            return False
-
-        # Check if the item and the occurrence count are equal
-        if self.item != value.item or self.occurrence_count != value.occurrence_count:
-            return False
+        # Compare the nodes pairwise with an explicit stack
+        pairs = [(self, value)]
+        while pairs:
+            node, other = pairs.pop()
+            if not isinstance(other, FPTreeItemNode):
+                return False
 
-        # Check if the childs are equal
-        # The order of the childs does not matter
-        for child in self.childs:
-            if child not in value.childs:
+            # Check if the item and the occurrence count are equal
+            if node.item != other.item or node.occurrence_count != other.occurrence_count:
                 return False
-        for child in value.childs:
-            if child not in self.childs:
+
+            # Check if the childs have the same items
+            # The order of the childs does not matter, the children of both nodes are matched by their items
+            if node.children.keys() != other.children.keys():
                 return False
+            other_children = other.children
+            pairs.extend((child, other_children[item]) for item, child in node.children.items())
         return True
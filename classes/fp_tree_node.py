@@ -1,4 +1,6 @@
-from typing import List
+from typing import Dict, List, Tuple
+
+from classes.item import Item
 
 
 class FPTreeNode:
@@ -8,18 +10,28 @@ class FPTreeNode:
         """
         Initialize the FPTreeNode with the given parent.
         """
-        # Set the childs as an empty list
-        self.childs = list()
+        # Set the children (keyed by their item) as an empty dictionary
+        self.children: Dict[Item, "FPTreeNode"] = dict()
 
         # Set the occurrence count to 0
         self.occurrence_count = 0
 
-    def get_predecessors(self) -> List["FPTreeNode"]:
+    @property
+    def childs(self) -> List["FPTreeNode"]:
+        """
+        Get the children of this node as a list (in insertion order)
+
+        Returns:
+        List[FPTreeNode]: The children of this node.
+        """
+        return list(self.children.values())
+
+    def get_predecessors(self) -> Tuple["FPTreeNode", ...]:
         """
         Get the predecessors of this node (excluding the root node)
 
         Returns:
-        List[FPTreeNode]: The predecessors of this item node.
+        Tuple[FPTreeNode, ...]: The predecessors of this item node.
         """
         # A default FP-tree node has no predecessors
-        return []
+        return ()
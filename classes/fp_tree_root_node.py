@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Tuple
 
 from classes.fp_tree_item_node import FPTreeItemNode
 from classes.fp_tree_header_table import FPTreeHeaderTable
@@ -29,19 +29,19 @@ class FPTreeRootNode(FPTreeNode):
         # The root node itself is not part of the HeaderTable
 
         # But the all childs have to be added
-        for child in self.childs:
+        for child in self.children.values():
             # Recursive call of the add_to_header_table() function
             child.add_to_header_table(header_table)
 
-    def get_predecessors(self) -> List[FPTreeItemNode]:
+    def get_predecessors(self) -> Tuple[FPTreeItemNode, ...]:
         """
         Get the predecessors (there is no predecessor to a root node)
 
         Returns:
-        List[FPTreeItemNode]: An empty list as there are no predecessors
+        Tuple[FPTreeItemNode, ...]: An empty tuple as there are no predecessors
         """
-        # Return an empty list as there are no predecessors
-        return []
+        # Return an empty tuple as there are no predecessors
+        return ()
 
     def get_all_item_nodes(self) -> List[FPTreeItemNode]:
         """
@@ -54,7 +54,7 @@ class FPTreeRootNode(FPTreeNode):
         node_list = []
 
         # Go through all childs and add there lists to this node_list
-        for child in self.childs:
+        for child in self.children.values():
             node_list.extend(child.get_all_item_nodes())
 
         return node_list
@@ -67,11 +67,11 @@ class FPTreeRootNode(FPTreeNode):
         bool: True if there is only a single path behind the RootNode, False otherwise
         """
         # If there is more then one child return False
-        if len(self.childs) > 1:
+        if len(self.children) > 1:
             return False
         # If there is exactly one child ask that child if there is only a single path
-        elif len(self.childs) == 1:
-            return self.childs[0].is_single_path()
+        elif len(self.children) == 1:
+            return next(iter(self.children.values())).is_single_path()
         # If there are no childs there is only a single path
         else:
             return True
@@ -84,7 +84,7 @@ class FPTreeRootNode(FPTreeNode):
         bool: True if the FPTree is empty, False otherwise
         """
         # If there at least one child return False
-        if len(self.childs) >= 1:
+        if len(self.children) >= 1:
             return False
         # Otherwise return true
         return True
@@ -103,7 +103,7 @@ class FPTreeRootNode(FPTreeNode):
         string_representation = "Root"
 
         # Get the string representations of all childs
-        for child in self.childs:
+        for child in self.children.values():
             string_representation = string_representation + "\n" + child.__str__(1)
 
         # Return the string representation
@@ -125,11 +125,5 @@ class FPTreeRootNode(FPTreeNode):
             return False
 
         # Check if the childs are equal
-        # The order of the childs does not matter
-        for child in self.childs:
-            if child not in value.childs:
-                return False
-        for child in value.childs:
-            if child not in self.childs:
-                return False
-        return True
+        # The order of the childs does not matter, the children of both nodes are matched by their items
+        return self.children == value.children
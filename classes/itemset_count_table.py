@@ -0,0 +1,157 @@
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+from classes.itemset import Itemset
+from classes.itemsets_with_occurrence_counts import ItemsetsWithOccurrenceCounts
+
+
+class ItemsetCountTable:
+    """
+    A compact table of occurrence counts for the mining internals.
+
+    Every itemset gets a dense integer ID (in the order the itemsets are added) and its count is stored at that
+    position of an array of machine integers, so a count does not need a dictionary entry or an integer object
+    of its own. Counting structures keep the IDs themselves, so the index from the itemsets to their IDs is only
+    built when an itemset is looked up. The table is only converted to an ItemsetsWithOccurrenceCounts where the
+    counts are handed out.
+
+    Incrementing a single array element is slow in Python, so counting structures that find many occurrences
+    per transaction add them as whole batches of IDs (e.g. all candidates contained in a transaction).
+    The IDs are buffered and summed in bulk.
+    """
+
+    # The number of buffered IDs after which the buffer is added to the counts
+    PENDING_ID_LIMIT = 65536
+
+    def __init__(self, itemsets: Iterable[Itemset] = ()):
+        """
+        Initialize the table with the given itemsets. The occurrence count of each itemset is set to 0.
+
+        Parameters:
+        itemsets (Iterable[Itemset]): The distinct itemsets. They are numbered in the order of iteration.
+        """
+        # The itemset and the occurrence count of every ID
+        self.itemsets: List[Itemset] = list(itemsets)
+        self.counts = array("l", [0]) * len(self.itemsets)
+
+        # The IDs of the occurrences that have not been added to the counts yet
+        self._pending_ids: List[int] = list()
+
+        # The ID of every itemset (built on the first lookup)
+        self._ids: Optional[Dict[Itemset, int]] = None
+
+    # Functions
+    def add(self, itemset: Itemset, count: int = 0) -> int:
+        """
+        Add the given itemset (which must not be in the table yet) with the given occurrence count.
+
+        Parameters:
+        itemset (Itemset): The itemset.
+        count (int): The occurrence count of the itemset. Default value is 0.
+
+        Returns:
+        int: The ID of the itemset.
+        """
+        itemset_id = len(self.itemsets)
+        self.itemsets.append(itemset)
+        self.counts.append(count)
+        if self._ids is not None:
+            self._ids[itemset] = itemset_id
+        return itemset_id
+
+    def get_id(self, itemset: Itemset) -> Optional[int]:
+        """
+        Get the ID of the given itemset.
+
+        Parameters:
+        itemset (Itemset): The itemset.
+
+        Returns:
+        Optional[int]: The ID of the itemset, None if it is not in the table.
+        """
+        if self._ids is None:
+            self._ids = {itemset: itemset_id for itemset_id, itemset in enumerate(self.itemsets)}
+        return self._ids.get(itemset)
+
+    def add_occurrences(self, itemset_ids: Iterable[int]):
+        """
+        Add one occurrence for every given ID (an ID can be given several times).
+
+        Parameters:
+        itemset_ids (Iterable[int]): The IDs of the occurring itemsets.
+        """
+        pending_ids = self._pending_ids
+        pending_ids.extend(itemset_ids)
+        if len(pending_ids) >= self.PENDING_ID_LIMIT:
+            self.flush()
+
+    def flush(self):
+        """
+        Add the buffered occurrences to the counts.
+        """
+        counts = self.counts
+        for itemset_id, count in Counter(self._pending_ids).items():
+            counts[itemset_id] += count
+        self._pending_ids.clear()
+
+    def get_occurrence_count(self, itemset: Itemset) -> int:
+        """
+        Get the occurrence count of the given itemset.
+
+        Parameters:
+        itemset (Itemset): The itemset.
+
+        Returns:
+        int: The occurrence count of the itemset, 0 if it is not in the table.
+        """
+        self.flush()
+        itemset_id = self.get_id(itemset)
+        return 0 if itemset_id is None else self.counts[itemset_id]
+
+    def to_itemsets_with_occurrence_counts(self, min_count: int = 0) -> ItemsetsWithOccurrenceCounts:
+        """
+        Convert the table to an ItemsetsWithOccurrenceCounts.
+
+        Parameters:
+        min_count (int): Only itemsets with at least this occurrence count are converted. Default value is 0.
+
+        Returns:
+        ItemsetsWithOccurrenceCounts: A dictionary containing the itemsets as keys and their occurrence counts as values.
+        """
+        self.flush()
+        result = ItemsetsWithOccurrenceCounts(set())
+        for itemset, count in zip(self.itemsets, self.counts):
+            if count >= min_count:
+                result.set_occurrence_count(itemset, count)
+        return result
+
+    def get_size(self) -> int:
+        """
+        Get the size of the count array.
+
+        Returns:
+        int: The size (in bytes) of the count array.
+        """
+        return len(self.counts) * self.counts.itemsize
+
+    def __len__(self) -> int:
+        """
+        Get the number of itemsets in the table.
+
+        Returns:
+        int: The number of itemsets.
+        """
+        return len(self.itemsets)
+
+    def __contains__(self, itemset: Itemset) -> bool:
+        """
+        Check whether the given itemset is in the table.
+
+        Parameters:
+        itemset (Itemset): The itemset.
+
+        Returns:
+        bool: True if the itemset is in the table, False otherwise
+        """
+        return self.get_id(itemset) is not None
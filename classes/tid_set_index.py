@@ -0,0 +1,61 @@
+from typing import Dict, FrozenSet, Set
+
+from classes.dataset import Dataset
+from classes.item import Item
+from classes.vertical_index import VerticalIndex
+
+
+class TIDSetIndex(VerticalIndex):
+    """A vertical index of a dataset that maps every item to the set of transaction IDs (TIDs) containing it."""
+
+    def _build_item_covers(self, dataset: Dataset) -> Dict[Item, FrozenSet[int]]:
+        """
+        Build the TID set of every item in the given dataset.
+
+        Parameters:
+        dataset (Dataset): The dataset that should be indexed.
+
+        Returns:
+        Dict[Item, FrozenSet[int]]: The TID set of every item.
+        """
+        item_tid_sets: Dict[Item, Set[int]] = dict()
+        for tid, transaction in enumerate(dataset.transactions):
+            for item in transaction.items:
+                item_tid_sets.setdefault(item, set()).add(tid)
+        return {item: frozenset(tid_set) for item, tid_set in item_tid_sets.items()}
+
+    def _empty_cover(self) -> FrozenSet[int]:
+        """
+        Get the TID set of an item that is not contained in any transaction.
+
+        Returns:
+        FrozenSet[int]: An empty TID set.
+        """
+        return frozenset()
+
+    def _intersect(
+        self, cover: FrozenSet[int], other_cover: FrozenSet[int]
+    ) -> FrozenSet[int]:
+        """
+        Intersect two TID sets.
+
+        Parameters:
+        cover (FrozenSet[int]): The first TID set.
+        other_cover (FrozenSet[int]): The second TID set.
+
+        Returns:
+        FrozenSet[int]: The TIDs that are contained in both TID sets.
+        """
+        return cover & other_cover
+
+    def _count(self, cover: FrozenSet[int]) -> int:
+        """
+        Count the transactions of a TID set.
+
+        Parameters:
+        cover (FrozenSet[int]): The TID set to be counted.
+
+        Returns:
+        int: The number of TIDs in the TID set.
+        """
+        return len(cover)
@@ -0,0 +1,75 @@
+from typing import Dict, List
+
+from classes.dataset import Dataset
+from classes.item import Item
+from classes.vertical_index import VerticalIndex
+
+
+class TransactionBitmapIndex(VerticalIndex):
+    """
+    A vertical index of a dataset that maps every item to a packed bitmap over the transaction positions.
+
+    The bitmaps are stored as Python integers (bit i is set if the i-th transaction contains the item),
+    so intersecting two covers is a word-parallel AND and counting a cover is a popcount.
+    """
+
+    def _build_item_covers(self, dataset: Dataset) -> Dict[Item, int]:
+        """
+        Build the bitmap of every item in the given dataset.
+
+        Parameters:
+        dataset (Dataset): The dataset that should be indexed.
+
+        Returns:
+        Dict[Item, int]: The bitmap of every item.
+        """
+        # Collect the positions of the transactions containing each item
+        item_positions: Dict[Item, List[int]] = dict()
+        for position, transaction in enumerate(dataset.transactions):
+            for item in transaction.items:
+                item_positions.setdefault(item, []).append(position)
+
+        # Pack the positions into bitmaps
+        # Setting the bits in a bytearray avoids creating a new (large) integer for every single bit
+        bitmap_length = (len(dataset.transactions) + 7) // 8
+        item_bitmaps = dict()
+        for item, positions in item_positions.items():
+            bitmap = bytearray(bitmap_length)
+            for position in positions:
+                bitmap[position >> 3] |= 1 << (position & 7)
+            item_bitmaps[item] = int.from_bytes(bitmap, "little")
+        return item_bitmaps
+
+    def _empty_cover(self) -> int:
+        """
+        Get the bitmap of an item that is not contained in any transaction.
+
+        Returns:
+        int: An empty bitmap.
+        """
+        return 0
+
+    def _intersect(self, cover: int, other_cover: int) -> int:
+        """
+        Intersect two bitmaps.
+
+        Parameters:
+        cover (int): The first bitmap.
+        other_cover (int): The second bitmap.
+
+        Returns:
+        int: The bitmap of the transactions that are contained in both bitmaps.
+        """
+        return cover & other_cover
+
+    def _count(self, cover: int) -> int:
+        """
+        Count the transactions of a bitmap.
+
+        Parameters:
+        cover (int): The bitmap to be counted.
+
+        Returns:
+        int: The number of set bits in the bitmap.
+        """
+        return cover.bit_count()
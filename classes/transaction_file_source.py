@@ -0,0 +1,72 @@
+from typing import Iterable, Iterator
+
+from classes.item import Item
+from classes.itemset import Itemset
+from classes.transaction import Transaction
+
+
+class TransactionFileSource:
+    """
+    A transactional dataset stored in a text file with one transaction per line.
+
+    The items of a transaction are separated by the item separator and the line number is the transaction ID.
+    The file is streamed on every iteration, so only the current transaction is held in memory.
+    """
+
+    def __init__(self, path: str, item_separator: str = ","):
+        """
+        Initialize the source for the given file.
+
+        Parameters:
+        path (str): The path of the file.
+        item_separator (str): The string separating the items of a transaction. Default value is ",".
+        """
+        # Ensure that the items can be separated
+        if not item_separator or "\n" in item_separator:
+            raise ValueError("The item separator must be a non-empty string without line breaks.")
+
+        self.path = path
+        self.item_separator = item_separator
+
+    def __iter__(self) -> Iterator[Transaction]:
+        """
+        Stream the transactions of the file.
+
+        Returns:
+        Iterator[Transaction]: The transactions in the order of the file.
+        """
+        with open(self.path, encoding="utf-8") as file:
+            for line_number, line in enumerate(file, start=1):
+                line = line.rstrip("\n")
+                items = (
+                    frozenset(Item(name) for name in line.split(self.item_separator))
+                    if line
+                    else frozenset()
+                )
+                yield Transaction(line_number, Itemset(items))
+
+    @staticmethod
+    def write(
+        path: str, transactions: Iterable[Transaction], item_separator: str = ","
+    ) -> "TransactionFileSource":
+        """
+        Write the given transactions to a file (the transaction IDs are not stored).
+
+        Parameters:
+        path (str): The path of the file.
+        transactions (Iterable[Transaction]): The transactions to be written.
+        item_separator (str): The string separating the items of a transaction. Default value is ",".
+
+        Returns:
+        TransactionFileSource: The source for the written file.
+        """
+        source = TransactionFileSource(path, item_separator)
+        with open(path, "w", encoding="utf-8") as file:
+            for transaction in transactions:
+                names = sorted(item.name for item in transaction.items)
+                if any(item_separator in name or "\n" in name or not name for name in names):
+                    raise ValueError(
+                        "The item names must be non-empty and must not contain the item separator or line breaks."
+                    )
+                file.write(item_separator.join(names) + "\n")
+        return source
@@ -0,0 +1,153 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Set, Tuple
+
+from classes.dataset import Dataset
+from classes.item import Item
+from classes.itemset import Itemset
+from classes.itemsets_with_occurrence_counts import ItemsetsWithOccurrenceCounts
+
+
+class VerticalIndex(ABC):
+    """
+    Abstract superclass for the vertical indexes of a dataset.
+
+    A vertical index maps every item to its cover (the transactions containing the item).
+    The occurrence count of an itemset is the size of the intersection of the covers of its items.
+    The covers of the frequent itemsets of the last counted level are kept, so that a (k+1)-itemset
+    only needs a single intersection of the cover of its k-prefix with the cover of its last item.
+    """
+
+    def __init__(self, dataset: Dataset, min_support: int = 1):
+        """
+        Initialize the VerticalIndex by scanning the given dataset once.
+
+        Parameters:
+        dataset (Dataset): The dataset that should be indexed.
+        min_support (int): The minimum (absolute) support. Only the covers of itemsets that reach
+                           this support are kept for the next level. Default value is 1.
+        """
+        # Save the arguments
+        self.dataset = dataset
+        self.min_support = min_support
+
+        # Build the cover of every item
+        self.item_covers: Dict[Item, Any] = self._build_item_covers(dataset)
+
+        # The covers of the frequent itemsets of the last counted level (keyed by the sorted items)
+        self.prefix_covers: Dict[Tuple[Item, ...], Any] = dict()
+
+    # Functions to be implemented by the subclasses
+    @abstractmethod
+    def _build_item_covers(self, dataset: Dataset) -> Dict[Item, Any]:
+        """
+        Build the cover of every item in the given dataset.
+        The position of a transaction is used as its TID as the transaction ids do not have to be unique.
+
+        Parameters:
+        dataset (Dataset): The dataset that should be indexed.
+
+        Returns:
+        Dict[Item, Any]: The cover of every item.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _empty_cover(self) -> Any:
+        """
+        Get the cover of an item that is not contained in any transaction.
+
+        Returns:
+        Any: The empty cover.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _intersect(self, cover: Any, other_cover: Any) -> Any:
+        """
+        Intersect two covers.
+
+        Parameters:
+        cover (Any): The first cover.
+        other_cover (Any): The second cover.
+
+        Returns:
+        Any: The cover of the transactions that are contained in both covers.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _count(self, cover: Any) -> int:
+        """
+        Count the transactions of a cover.
+
+        Parameters:
+        cover (Any): The cover to be counted.
+
+        Returns:
+        int: The number of transactions in the cover.
+        """
+        raise NotImplementedError
+
+    # Functions
+    def get_cover(self, items: Tuple[Item, ...]) -> Any:
+        """
+        Get the cover of the given (sorted) items.
+
+        Parameters:
+        items (Tuple[Item, ...]): The items sorted by their name.
+
+        Returns:
+        Any: The cover of all transactions that contain all of the given items.
+        """
+        # Reuse the cover of the prefix if it was kept from the last level
+        prefix_cover = self.prefix_covers.get(items[:-1])
+        if prefix_cover is not None:
+            return self._intersect(
+                prefix_cover, self.item_covers.get(items[-1], self._empty_cover())
+            )
+
+        # Otherwise intersect the covers of all items, starting with the smallest one
+        item_covers = sorted(
+            (self.item_covers.get(item, self._empty_cover()) for item in items),
+            key=self._count,
+        )
+        cover = item_covers[0]
+        for item_cover in item_covers[1:]:
+            # Stop early if no transaction is left
+            if not cover:
+                break
+            cover = self._intersect(cover, item_cover)
+        return cover
+
+    def count_occurrences_of_itemsets(
+        self, itemsets: Set[Itemset]
+    ) -> ItemsetsWithOccurrenceCounts:
+        """
+        Count the occurrences of the given itemsets in the indexed dataset.
+
+        Parameters:
+        itemsets (Set[Itemset]): The itemsets for which the occurrences should be counted.
+
+        Returns:
+        ItemsetsWithOccurrenceCounts: A dictionary containing the itemsets as keys and their occurrence counts as values.
+        """
+        result = ItemsetsWithOccurrenceCounts(itemsets)
+        level_covers = dict()
+        for itemset in itemsets:
+            # The empty itemset is contained in every transaction
+            if not itemset.items:
+                result.set_occurrence_count(itemset, len(self.dataset.transactions))
+                continue
+
+            items = tuple(sorted(itemset.items, key=lambda item: item.name))
+            cover = self.get_cover(items)
+            count = self._count(cover)
+            result.set_occurrence_count(itemset, count)
+
+            # Keep the cover if the itemset can be the prefix of a candidate of the next level
+            if count >= self.min_support:
+                level_covers[items] = cover
+
+        # Replace the covers of the previous level
+        self.prefix_covers = level_covers
+        return result
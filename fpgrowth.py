@@ -1,4 +1,6 @@
-from typing import Set, List
+from collections import Counter
+from itertools import chain
+from typing import Dict, Set, List, Union
 
 from classes.dataset import Dataset
 from classes.itemset import Itemset
@@ -8,12 +10,16 @@ from classes.sorted_dataset import SortedDataset
 from classes.sorted_transaction import SortedTransaction
 from classes.item_tuple import ItemTuple
 from classes.fp_tree import FPTree
+from classes.array_fp_tree import ArrayFPTree
 from classes.conditional_pattern_base import ConditionalPatternBase
 from classes.conditional_pattern import ConditionalPattern
 
 
 class FPgrowth:
-    def __init__(self, min_support: int = 2):
+    # The available FP-tree backends
+    FP_TREE_BACKENDS = ("nodes", "arrays")
+
+    def __init__(self, min_support: int = 2, fp_tree_backend: str = "nodes"):
         """
         Initialize the FP-growth algorithm with the a minimum (absolute) support.
 
@@ -21,12 +27,24 @@ class FPgrowth:
         min_support (int): The minimum (absolute) support. This parameter defines the minimum number
                            of occurrences an itemset must have to be considered frequent. Must be a positive integer.
                            Default value is 2.
+        fp_tree_backend (str): How the nodes of the FP-trees are stored.
+                               "nodes" stores every node as an object with a dictionary of its children (FPTree).
+                               "arrays" stores the nodes in parallel integer arrays (ArrayFPTree), which takes
+                               less memory per node.
+                               Default value is "nodes".
         """
         # Ensure that the minimum support is a positive integer
         if not isinstance(min_support, int) or min_support < 1:
             raise ValueError("The minimum support must be a positive integer.")
 
+        # Ensure that the FP-tree backend is known
+        if fp_tree_backend not in self.FP_TREE_BACKENDS:
+            raise ValueError(
+                f"The FP-tree backend must be one of: {', '.join(self.FP_TREE_BACKENDS)}."
+            )
+
         self.min_support = min_support
+        self.fp_tree_backend = fp_tree_backend
         self.frequent_itemsets = set()
 
     def _generate_frequent_one_itemsets_with_occurrence_counts(
@@ -41,32 +59,16 @@ class FPgrowth:
         Returns:
         ItemsetsWithOccurrenceCounts: A dictionary containing the frequent 1-itemsets as keys and their occurrence counts as values.
         """
-        # Count occurrences of each item
-        item_counts = {}
-        
-        for transaction in dataset.transactions:
-            for item in transaction.items.items:  # Access the items attribute of Itemset
-                if item not in item_counts:
-                    item_counts[item] = 0
-                item_counts[item] += 1
-        
-        # Create list of frequent itemsets
-        frequent_itemsets_list = []
-        for item, count in item_counts.items():
-            if count >= self.min_support:
-                # Create itemset with frozenset to make it hashable
-                itemset = Itemset(frozenset({item}))
-                frequent_itemsets_list.append(itemset)
-        
-        # Create ItemsetsWithOccurrenceCounts
-        frequent_one_itemsets = ItemsetsWithOccurrenceCounts(frequent_itemsets_list)
-        
-        # Set the occurrence counts
+        # Count the occurrences of each item in bulk
+        item_counts = Counter(
+            chain.from_iterable(transaction.items.items for transaction in dataset.transactions)
+        )
+
+        # Keep only the frequent 1-itemsets
+        frequent_one_itemsets = ItemsetsWithOccurrenceCounts(set())
         for item, count in item_counts.items():
             if count >= self.min_support:
-                itemset = Itemset(frozenset({item}))
-                frequent_one_itemsets.set_occurrence_count(itemset, count)
-        
+                frequent_one_itemsets.set_occurrence_count(Itemset(frozenset({item})), count)
         return frequent_one_itemsets
 
     def _generate_f_list(
@@ -131,6 +133,17 @@ class FPgrowth:
         
         return SortedDataset(frozenset(sorted_transactions))
 
+    def _create_fp_tree(self) -> Union[FPTree, ArrayFPTree]:
+        """
+        Create an empty FP-tree of the configured backend.
+
+        Returns:
+        Union[FPTree, ArrayFPTree]: The empty FP-tree.
+        """
+        if self.fp_tree_backend == "arrays":
+            return ArrayFPTree()
+        return FPTree()
+
     def _construct_initial_fp_tree(self, sorted_dataset: SortedDataset) -> FPTree:
         """
         Construct the initial FP-tree from the given sorted dataset.
@@ -141,7 +154,7 @@ class FPgrowth:
         Returns:
         FPTree: The initial FP-tree.
         """
-        fp_tree = FPTree()
+        fp_tree = self._create_fp_tree()
         
         for transaction in sorted_dataset.transactions:
             fp_tree.add_items_to_tree(transaction.items, 1)
@@ -162,31 +175,56 @@ class FPgrowth:
         ConditionalPatternBase: The conditional pattern base for the given item.
         """
         conditional_patterns = set()
-        header_table = fp_tree.get_header_table()
-        
-        # Find the header table element for the given item
-        target_element = None
-        for element in header_table.elements:
-            if element.item == item:
-                target_element = element
-                break
-        
-        if target_element is None:
-            return ConditionalPatternBase(frozenset())
-        
-        # For each node of the item in the tree
-        for node in target_element.node_links:
-            # Get the path from root to this node (excluding the node itself)
-            predecessors = node.get_predecessors()
-            
-            if predecessors:  # If there are predecessors
-                # Create ItemTuple from predecessors (they should already be in f_list order)
-                prefix_items = ItemTuple(tuple(pred.item for pred in predecessors))
-                conditional_pattern = ConditionalPattern(prefix_items, node.occurrence_count)
-                conditional_patterns.add(conditional_pattern)
-        
+
+        # The prefix path of every node of the item is a conditional pattern
+        # (the prefix items are already in f-list order)
+        for prefix_items, occurrence_count in fp_tree.get_prefix_paths(item):
+            conditional_pattern = ConditionalPattern(ItemTuple(prefix_items), occurrence_count)
+            conditional_patterns.add(conditional_pattern)
+
         return ConditionalPatternBase(frozenset(conditional_patterns))
 
+    def _filter_conditional_pattern_base(
+        self, conditional_pattern_base: ConditionalPatternBase, item_ranks: Dict[Item, int]
+    ) -> ConditionalPatternBase:
+        """
+        Remove the infrequent items from the given conditional pattern base.
+
+        Parameters:
+        conditional_pattern_base (ConditionalPatternBase): The conditional pattern base to be filtered.
+        item_ranks (Dict[Item, int]): The position of every frequent item in the f-list.
+
+        Returns:
+        ConditionalPatternBase: The conditional pattern base with only the items that are frequent within it,
+                                sorted according to the f-list.
+        """
+        # Count the occurrences of each item in the conditional pattern base
+        item_counts = {}
+        for pattern in conditional_pattern_base.conditional_patterns:
+            for item in pattern.prefix_items.items:
+                item_counts[item] = item_counts.get(item, 0) + pattern.occurrence_count
+
+        # Keep only the items that meet the minimum support, sorted by their f-list rank
+        # (patterns that become equal are merged, so their occurrence counts are not lost)
+        filtered_counts = {}
+        for pattern in conditional_pattern_base.conditional_patterns:
+            filtered_items = sorted(
+                (item for item in pattern.prefix_items.items if item_counts[item] >= self.min_support),
+                key=item_ranks.__getitem__,
+            )
+            if filtered_items:
+                filtered_items = tuple(filtered_items)
+                filtered_counts[filtered_items] = (
+                    filtered_counts.get(filtered_items, 0) + pattern.occurrence_count
+                )
+
+        return ConditionalPatternBase(
+            frozenset(
+                ConditionalPattern(ItemTuple(items), occurrence_count)
+                for items, occurrence_count in filtered_counts.items()
+            )
+        )
+
     def _construct_conditional_fp_tree(
         self, conditional_pattern_base: ConditionalPatternBase
     ) -> FPTree:
@@ -199,42 +237,16 @@ class FPgrowth:
         Returns:
         FPTree: The conditional FP-tree.
         """
-        # Count occurrences of each item in the conditional pattern base
-        item_counts = {}
-        
-        item_counts = {}
-    for pattern in conditional_pattern_base.conditional_patterns:
-        for item in pattern.prefix_items.items:
-            item_counts[item] = item_counts.get(item, 0) + pattern.occurrence_count
-        
-        # Filter items that meet minimum support
-        # 2) Keep only those items meeting min_support
-    frequent_items = {
-        item
-        for item, count in item_counts.items()
-        if count >= self.min_support
-    }
-        
-        # Construct conditional FP-tree
-        # 3) Build the conditional tree
-    conditional_fp_tree = FPTree()
-    for pattern in conditional_pattern_base.conditional_patterns:
-        # filter out infrequent items
-        filtered = [
-            item
-            for item in pattern.prefix_items.items
-            if item in frequent_items
-        ]
-        # sort by descending count, then alphabetically for ties
-        filtered.sort(key=lambda it: (-item_counts[it], it))
-
-        if filtered:
-            item_tuple = ItemTuple(tuple(filtered))
+        conditional_fp_tree = self._create_fp_tree()
+
+        # The prefix items of every conditional pattern are already sorted according to the f-list,
+        # so they can be added as they are (the infrequent items are removed before by _filter_conditional_pattern_base)
+        for pattern in conditional_pattern_base.conditional_patterns:
             conditional_fp_tree.add_items_to_tree(
-                item_tuple, pattern.occurrence_count
+                pattern.prefix_items, pattern.occurrence_count
             )
 
-    return conditional_fp_tree
+        return conditional_fp_tree
 
     def fit(self, dataset: Dataset):
         """
@@ -308,27 +320,17 @@ class FPgrowth:
             beta = alpha | {item}
             beta_itemset = Itemset(frozenset(beta))
             
-            # Calculate support for this itemset by checking conditional pattern base
-            conditional_pattern_base = self._get_conditional_pattern_base(item, fp_tree)
-            
-            # Count support for beta itemset
-            support_count = 0
-            if not conditional_pattern_base.conditional_patterns:
-                # If no conditional patterns, this is a 1-itemset extension
-                # Get support from header table
-                for element in header_table.elements:
-                    if element.item == item:
-                        support_count = sum(node.occurrence_count for node in element.node_links)
-                        break
-            else:
-                # For multi-item extensions, sum from conditional patterns
-                support_count = sum(pattern.occurrence_count for pattern in conditional_pattern_base.conditional_patterns)
-            
+            # The support of beta is the sum of the counts of all nodes of the item
+            support_count = header_table.get_element(item).overall_occurrence_count
+
             # Only add if meets minimum support
             if support_count >= self.min_support:
                 self.frequent_itemsets.add(beta_itemset)
-                
-                # Construct conditional FP-tree
+
+                # Get the conditional pattern base without its infrequent items and construct the conditional FP-tree
+                conditional_pattern_base = self._filter_conditional_pattern_base(
+                    self._get_conditional_pattern_base(item, fp_tree), item_to_order
+                )
                 conditional_fp_tree = self._construct_conditional_fp_tree(conditional_pattern_base)
                 
                 # Recursively mine the conditional FP-tree
@@ -343,27 +345,15 @@ class FPgrowth:
         fp_tree (FPTree): FP-tree with single path
         alpha (Set[Item]): Current suffix pattern
         """
-        # Get all nodes in the single path (excluding root)
-        path_nodes = []
-        current = fp_tree.root
-        
-        # Traverse the single path to collect all nodes
-        while current and current.children:
-            if len(current.children) == 1:  # Single path continues
-                child = next(iter(current.children.values()))
-                path_nodes.append(child)
-                current = child
-            else:
-                break
-        
-        if not path_nodes:
+        # Get the items and occurrence counts of all nodes in the single path (excluding root)
+        path_items = fp_tree.get_single_path()
+
+        if not path_items:
             return
-        
+
         # Generate all non-empty subsets of path items
         from itertools import combinations
-        
-        path_items = [(node.item, node.occurrence_count) for node in path_nodes]
-        
+
         for r in range(1, len(path_items) + 1):
             for combo in combinations(path_items, r):
                 # Check if combination meets minimum support
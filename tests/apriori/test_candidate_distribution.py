@@ -0,0 +1,81 @@
+import pytest
+
+from apriori import Apriori
+
+from classes.candidate_distribution_pool import CandidateDistributionPool
+from classes.item import Item
+from classes.itemset import Itemset
+
+#####
+# Test the candidate distribution with worker processes
+#####
+
+
+def test_itemsets_are_partitioned_by_their_first_item():
+    """Test that all itemsets with the same first item end up in the same partition."""
+
+    apple, banana, cherry, dragonfruit = (
+        Item("Apple"),
+        Item("Banana"),
+        Item("Cherry"),
+        Item("Dragonfruit"),
+    )
+    frequent_itemsets = {
+        Itemset(frozenset({apple, banana})),
+        Itemset(frozenset({apple, cherry})),
+        Itemset(frozenset({apple, dragonfruit})),
+        Itemset(frozenset({banana, cherry})),
+        Itemset(frozenset({cherry, dragonfruit})),
+    }
+    pool = CandidateDistributionPool(None, Apriori(), 2)
+    partitions = pool.partition_itemsets(frequent_itemsets)
+
+    # The three Apple itemsets form the largest group, the others share the second partition
+    assert sorted(len(partition) for partition in partitions) == [2, 3]
+    assert set().union(*partitions) == frequent_itemsets
+    for partition in partitions:
+        first_items = {min(itemset.items, key=lambda item: item.name) for itemset in partition}
+        assert first_items in ({apple}, {banana, cherry})
+
+
+def test_candidates_without_checking_the_first_subset():
+    """Test that the subset without the first item is not checked for partitions."""
+
+    apriori = Apriori()
+    apple, banana, cherry = Item("Apple"), Item("Banana"), Item("Cherry")
+    partition = {Itemset(frozenset({apple, banana})), Itemset(frozenset({apple, cherry}))}
+
+    # {Banana, Cherry} belongs to another partition
+    assert apriori._generate_candidate_itemsets(partition) == set()
+    assert apriori._generate_candidate_itemsets(
+        partition, check_subsets_without_first_item=False
+    ) == {Itemset(frozenset({apple, banana, cherry}))}
+
+
+@pytest.mark.parametrize("counting_method", ["scan", "tid_set", "prefix_trie"])
+@pytest.mark.parametrize("workers", [2, 3])
+@pytest.mark.parametrize("min_support", [2, 10])
+def test_fit_with_random_grocery_dataset(random_grocery_dataset, counting_method, workers, min_support):
+    """Test that the candidate distribution finds the same frequent itemsets as a single process."""
+
+    # Fit in a single process
+    apriori = Apriori(min_support=min_support, counting_method=counting_method)
+    apriori.fit(random_grocery_dataset)
+
+    # Fit with workers
+    parallel_apriori = Apriori(
+        min_support=min_support,
+        counting_method=counting_method,
+        workers=workers,
+        parallel_mode="candidate_distribution",
+    )
+    parallel_apriori.fit(random_grocery_dataset)
+
+    assert parallel_apriori.frequent_itemsets == apriori.frequent_itemsets
+
+
+def test_invalid_parallel_mode():
+    """Test that unknown parallel modes are rejected."""
+
+    with pytest.raises(ValueError):
+        Apriori(workers=2, parallel_mode="data_distribution")
@@ -0,0 +1,69 @@
+import pytest
+
+from apriori import Apriori
+
+from classes.item import Item
+from classes.itemset import Itemset
+
+#####
+# Test the batching of the candidates under a memory limit
+#####
+
+
+def test_candidates_are_generated_lazily(large_book_dataset):
+    """Test that the lazy generation yields every candidate exactly once."""
+
+    apriori = Apriori(min_support=2)
+    apriori.fit(large_book_dataset)
+    frequent_pairs = {itemset for itemset in apriori.frequent_itemsets if len(itemset.items) == 2}
+
+    candidates = list(apriori._iter_candidate_itemsets(frequent_pairs))
+    assert len(candidates) == len(set(candidates))
+    assert set(candidates) == apriori._generate_candidate_itemsets(frequent_pairs)
+
+
+def test_only_frequent_candidates_are_kept(small_fruit_dataset):
+    """Test that every batch is pruned before the next one is generated."""
+
+    # Room for a single candidate per batch
+    apriori = Apriori(min_support=2, candidate_memory_limit=Apriori.CANDIDATE_SIZE)
+    frequent_items = {
+        Itemset(frozenset({Item("Apple")})),
+        Itemset(frozenset({Item("Banana")})),
+        Itemset(frozenset({Item("Cherry")})),
+        Itemset(frozenset({Item("Dragonfruit")})),
+    }
+    itemsets_with_occurrence_counts = apriori._count_candidates_in_batches(
+        small_fruit_dataset, frequent_items
+    )
+
+    assert dict(itemsets_with_occurrence_counts) == {
+        Itemset(frozenset({Item("Apple"), Item("Cherry")})): 3,
+        Itemset(frozenset({Item("Apple"), Item("Dragonfruit")})): 2,
+        Itemset(frozenset({Item("Banana"), Item("Cherry")})): 2,
+    }
+    assert apriori.statistics.candidate_batch_counts == [6]
+
+
+@pytest.mark.parametrize("counting_method", ["scan", "bitmap", "prefix_trie", "apriori_tid"])
+@pytest.mark.parametrize("pcy_bucket_count", [0, 7])
+@pytest.mark.parametrize("min_support", [1, 5])
+def test_fit_with_random_grocery_dataset(random_grocery_dataset, counting_method, pcy_bucket_count, min_support):
+    """Test that batching does not change the frequent itemsets."""
+
+    # Fit without a memory limit
+    apriori = Apriori(min_support=min_support, counting_method=counting_method, pcy_bucket_count=pcy_bucket_count)
+    apriori.fit(random_grocery_dataset)
+
+    # Fit with batches of 10 candidates
+    batching_apriori = Apriori(
+        min_support=min_support,
+        counting_method=counting_method,
+        pcy_bucket_count=pcy_bucket_count,
+        candidate_memory_limit=10 * Apriori.CANDIDATE_SIZE,
+    )
+    batching_apriori.fit(random_grocery_dataset)
+
+    assert batching_apriori.frequent_itemsets == apriori.frequent_itemsets
+    assert max(batching_apriori.statistics.candidate_batch_counts) > 1
+    assert batching_apriori.statistics.pruned_pair_candidates == apriori.statistics.pruned_pair_candidates
@@ -0,0 +1,72 @@
+import pytest
+
+from apriori import Apriori
+
+from classes.count_distribution_pool import CountDistributionPool
+from classes.dataset import Dataset
+from classes.item import Item
+from classes.itemset import Itemset
+
+#####
+# Test the count distribution with worker processes
+#####
+
+
+def test_partial_counts_are_summed(small_fruit_dataset):
+    """Test that the counts of the shards add up to the counts of the dataset."""
+
+    itemsets = {
+        Itemset(frozenset({Item("Apple")})),
+        Itemset(frozenset({Item("Apple"), Item("Cherry")})),
+        Itemset(frozenset({Item("Banana"), Item("Dragonfruit")})),
+    }
+    with CountDistributionPool(small_fruit_dataset, Apriori(min_support=1), 3) as pool:
+        assert len(pool.processes) == 3
+
+        # The workers keep their shards for further levels
+        for _ in range(2):
+            assert dict(pool.count_occurrences_of_itemsets(itemsets)) == {
+                Itemset(frozenset({Item("Apple")})): 4,
+                Itemset(frozenset({Item("Apple"), Item("Cherry")})): 3,
+                Itemset(frozenset({Item("Banana"), Item("Dragonfruit")})): 0,
+            }
+
+
+@pytest.mark.parametrize("counting_method", ["scan", "bitmap", "prefix_trie", "apriori_tid"])
+@pytest.mark.parametrize("workers", [2, 3])
+def test_fit_with_random_grocery_dataset(random_grocery_dataset, counting_method, workers):
+    """Test that the count distribution finds the same frequent itemsets as a single process."""
+
+    # Fit in a single process
+    apriori = Apriori(min_support=5, counting_method=counting_method)
+    apriori.fit(random_grocery_dataset)
+
+    # Fit with workers
+    parallel_apriori = Apriori(min_support=5, counting_method=counting_method, workers=workers)
+    parallel_apriori.fit(random_grocery_dataset)
+
+    assert parallel_apriori.frequent_itemsets == apriori.frequent_itemsets
+    assert parallel_apriori._count_distribution_pool is None
+
+
+def test_equal_transactions_are_counted_on_the_shards(small_fruit_dataset):
+    """Test that equal transactions that end up in the same shard are counted separately."""
+
+    transaction = min(small_fruit_dataset.transactions, key=lambda transaction: transaction.id)
+    dataset = Dataset((transaction, transaction, transaction))
+
+    # Fit in a single process and with two workers
+    apriori = Apriori(min_support=3)
+    apriori.fit(dataset)
+    distributed_apriori = Apriori(min_support=3, workers=2)
+    distributed_apriori.fit(dataset)
+
+    assert len(apriori.frequent_itemsets) == 7
+    assert dict(distributed_apriori.frequent_itemset_counts) == dict(apriori.frequent_itemset_counts)
+
+
+def test_invalid_number_of_workers():
+    """Test that the number of workers must be positive."""
+
+    with pytest.raises(ValueError):
+        Apriori(workers=0)
@@ -0,0 +1,102 @@
+import pytest
+
+from apriori import Apriori
+
+from classes.item import Item
+from classes.itemset import Itemset
+
+#####
+# Test the triangular pair matrix
+#####
+
+
+def test_with_small_fruit_dataset(small_fruit_dataset):
+    """Test that the matrix returns exactly the frequent pairs with their occurrence counts."""
+
+    # Create the Apriori object
+    apriori = Apriori(min_support=2)
+
+    # The frequent 1-itemsets
+    one_itemsets = {
+        Itemset(frozenset({Item("Apple")})),
+        Itemset(frozenset({Item("Banana")})),
+        Itemset(frozenset({Item("Cherry")})),
+        Itemset(frozenset({Item("Dragonfruit")})),
+    }
+
+    # Count the pairs
+    itemsets_with_occurrence_counts = (
+        apriori._count_frequent_pairs_with_triangular_matrix(
+            small_fruit_dataset, one_itemsets
+        )
+    )
+
+    # Check the occurrence counts
+    expected_occurrences = {
+        Itemset(frozenset({Item("Apple"), Item("Cherry")})): 3,
+        Itemset(frozenset({Item("Apple"), Item("Dragonfruit")})): 2,
+        Itemset(frozenset({Item("Banana"), Item("Cherry")})): 2,
+    }
+    assert dict(itemsets_with_occurrence_counts) == expected_occurrences
+
+
+def test_infrequent_items_are_ignored(small_fruit_dataset):
+    """Test that only pairs of the given (frequent) 1-itemsets are counted."""
+
+    # Create the Apriori object
+    apriori = Apriori(min_support=1)
+
+    # Only two frequent 1-itemsets
+    one_itemsets = {
+        Itemset(frozenset({Item("Apple")})),
+        Itemset(frozenset({Item("Dragonfruit")})),
+    }
+
+    # Count the pairs
+    itemsets_with_occurrence_counts = (
+        apriori._count_frequent_pairs_with_triangular_matrix(
+            small_fruit_dataset, one_itemsets
+        )
+    )
+
+    assert dict(itemsets_with_occurrence_counts) == {
+        Itemset(frozenset({Item("Apple"), Item("Dragonfruit")})): 2
+    }
+
+
+@pytest.mark.parametrize("min_support", [1, 5, 10, 20])
+def test_fit_with_random_grocery_dataset(random_grocery_dataset, min_support):
+    """Test that counting the pairs in the matrix does not change the frequent itemsets."""
+
+    # Fit with and without the matrix
+    matrix_apriori = Apriori(min_support=min_support)
+    matrix_apriori.fit(random_grocery_dataset)
+    candidate_apriori = Apriori(min_support=min_support, pair_matrix_memory_limit=0)
+    candidate_apriori.fit(random_grocery_dataset)
+
+    assert matrix_apriori.frequent_itemsets == candidate_apriori.frequent_itemsets
+    assert matrix_apriori.statistics.pair_matrix_size > 0
+    assert candidate_apriori.statistics.pair_matrix_size == 0
+
+
+def test_matrix_is_not_used_above_the_memory_limit(random_grocery_dataset):
+    """Test that the pairs are counted as candidates if the matrix does not fit into the memory limit."""
+
+    # 12 frequent items need 66 counters, which do not fit into 16 bytes
+    apriori = Apriori(min_support=1, pair_matrix_memory_limit=16)
+    apriori.fit(random_grocery_dataset)
+
+    assert apriori.statistics.pair_matrix_size == 0
+
+
+@pytest.mark.parametrize("counting_method", ["tid_set", "bitmap", "apriori_tid", "apriori_hybrid"])
+def test_matrix_is_not_used_by_methods_with_level_state(random_grocery_dataset, counting_method):
+    """Test that the pairs are counted with the counting method if it carries state from one level to the next."""
+
+    apriori = Apriori(min_support=5, counting_method=counting_method)
+    apriori.fit(random_grocery_dataset)
+
+    # Every level (including the pairs) is counted with the counting method
+    assert apriori.statistics.pair_matrix_size == 0
+    assert len(apriori.statistics.dataset_sizes) >= 3
+    assert len(apriori.statistics.counting_methods) == len(apriori.statistics.dataset_sizes)
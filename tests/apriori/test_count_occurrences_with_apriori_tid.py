@@ -0,0 +1,100 @@
+import pytest
+
+from apriori import Apriori
+
+from classes.apriori_tid_index import AprioriTidIndex
+from classes.item import Item
+from classes.itemset import Itemset
+
+#####
+# Test the AprioriTid representation
+#####
+
+
+def test_levels_are_counted_on_candidate_id_sets(small_fruit_dataset):
+    """Test that the second level is counted on the candidate-ID sets and that they shrink."""
+
+    # Create the AprioriTid representation
+    apriori_tid_index = AprioriTidIndex(small_fruit_dataset, min_support=2)
+
+    # Count the 1-itemsets (scans the dataset)
+    fruits = [Item("Apple"), Item("Banana"), Item("Cherry"), Item("Dragonfruit")]
+    apriori_tid_index.count_occurrences_of_itemsets(
+        {Itemset(frozenset({fruit})) for fruit in fruits}
+    )
+    assert apriori_tid_index.length == 1
+    assert apriori_tid_index.get_entry_count() == 12
+
+    # Count the 2-itemsets on the candidate-ID sets only
+    itemsets_with_occurrence_counts = apriori_tid_index.count_occurrences_of_itemsets(
+        {
+            Itemset(frozenset({fruits[i], fruits[j]}))
+            for i in range(len(fruits))
+            for j in range(i + 1, len(fruits))
+        }
+    )
+
+    # Check the occurrence counts
+    expected_occurrences = {
+        Itemset(frozenset({Item("Apple"), Item("Banana")})): 1,
+        Itemset(frozenset({Item("Apple"), Item("Cherry")})): 3,
+        Itemset(frozenset({Item("Apple"), Item("Dragonfruit")})): 2,
+        Itemset(frozenset({Item("Banana"), Item("Cherry")})): 2,
+        Itemset(frozenset({Item("Banana"), Item("Dragonfruit")})): 0,
+        Itemset(frozenset({Item("Cherry"), Item("Dragonfruit")})): 1,
+    }
+    assert dict(itemsets_with_occurrence_counts) == expected_occurrences
+
+    # Only the three frequent 2-itemsets are kept: one transaction holds two of them
+    assert apriori_tid_index.length == 2
+    assert len(apriori_tid_index.candidate_ids) == 3
+    assert apriori_tid_index.get_entry_count() == 7
+
+
+def test_itemsets_not_joinable_from_the_last_level_rescan_the_dataset(small_fruit_dataset):
+    """Test that itemsets which cannot be joined from the last level are counted on the dataset."""
+
+    # Create the AprioriTid representation and count a single 1-itemset
+    apriori_tid_index = AprioriTidIndex(small_fruit_dataset, min_support=1)
+    apriori_tid_index.count_occurrences_of_itemsets({Itemset(frozenset({Item("Apple")}))})
+
+    # The generating 1-itemset Cherry was never counted
+    itemsets_with_occurrence_counts = apriori_tid_index.count_occurrences_of_itemsets(
+        {Itemset(frozenset({Item("Apple"), Item("Cherry")}))}
+    )
+    assert dict(itemsets_with_occurrence_counts) == {
+        Itemset(frozenset({Item("Apple"), Item("Cherry")})): 3
+    }
+
+
+@pytest.mark.parametrize("counting_method", ["apriori_tid", "apriori_hybrid"])
+@pytest.mark.parametrize("min_support", [1, 5, 20])
+def test_fit_with_random_grocery_dataset(random_grocery_dataset, counting_method, min_support):
+    """Test that AprioriTid and Apriori-Hybrid find the same frequent itemsets as the scan counting method."""
+
+    # Fit both variants
+    scanning_apriori = Apriori(min_support=min_support)
+    scanning_apriori.fit(random_grocery_dataset)
+    apriori = Apriori(min_support=min_support, counting_method=counting_method)
+    apriori.fit(random_grocery_dataset)
+
+    assert apriori.frequent_itemsets == scanning_apriori.frequent_itemsets
+
+
+def test_hybrid_switches_to_apriori_tid(random_grocery_dataset):
+    """Test that the hybrid method switches once the candidate-ID sets fit into the memory limit."""
+
+    # With a huge limit the hybrid method switches after the first level
+    apriori = Apriori(
+        min_support=3, counting_method="apriori_hybrid", pair_matrix_memory_limit=0
+    )
+    apriori.fit(random_grocery_dataset)
+    assert apriori.statistics.counting_methods[0] == "prefix_trie"
+    assert set(apriori.statistics.counting_methods[1:]) == {"apriori_tid"}
+
+    # Without memory the hybrid method never switches
+    apriori = Apriori(
+        min_support=3, counting_method="apriori_hybrid", apriori_tid_memory_limit=0
+    )
+    apriori.fit(random_grocery_dataset)
+    assert set(apriori.statistics.counting_methods) == {"prefix_trie"}
@@ -0,0 +1,97 @@
+import pytest
+
+from apriori import Apriori
+
+from classes.item import Item
+from classes.itemset import Itemset
+from classes.transaction_bitmap_index import TransactionBitmapIndex
+from classes.vertical_index import VerticalIndex
+
+#####
+# Test the counting with the bitmap index
+#####
+
+
+def test_bitmaps_of_small_fruit_dataset(small_fruit_dataset):
+    """Test that every item bitmap has one bit per transaction containing the item."""
+
+    # Create the index
+    bitmap_index = TransactionBitmapIndex(small_fruit_dataset)
+
+    # Check the number of set bits
+    expected_counts = {
+        Item("Apple"): 4,
+        Item("Banana"): 2,
+        Item("Cherry"): 4,
+        Item("Dragonfruit"): 2,
+    }
+    for item, expected_count in expected_counts.items():
+        assert bitmap_index.item_covers[item].bit_count() == expected_count
+
+    # No bit beyond the last transaction is set
+    for bitmap in bitmap_index.item_covers.values():
+        assert bitmap >> len(small_fruit_dataset.transactions) == 0
+
+
+def test_counting_of_3_itemsets_with_small_fruit_dataset(small_fruit_dataset):
+    """Test the counting of occurrences of 3-itemsets with the bitmap counting method."""
+
+    # Create the Apriori object
+    apriori = Apriori(counting_method="bitmap")
+
+    # List of 3-itemsets
+    three_itemsets = {
+        Itemset(frozenset({Item("Apple"), Item("Banana"), Item("Cherry")})),
+        Itemset(frozenset({Item("Apple"), Item("Cherry"), Item("Dragonfruit")})),
+        Itemset(frozenset({Item("Banana"), Item("Cherry"), Item("Dragonfruit")})),
+    }
+
+    # Count the occurrences of the 3-itemsets
+    itemsets_with_occurrence_counts = apriori._count_occurrences_of_itemsets(
+        small_fruit_dataset, three_itemsets
+    )
+
+    # Check the occurrence counts
+    expected_occurrences = {
+        Itemset(frozenset({Item("Apple"), Item("Banana"), Item("Cherry")})): 1,
+        Itemset(frozenset({Item("Apple"), Item("Cherry"), Item("Dragonfruit")})): 1,
+        Itemset(frozenset({Item("Banana"), Item("Cherry"), Item("Dragonfruit")})): 0,
+    }
+    assert dict(itemsets_with_occurrence_counts) == expected_occurrences
+
+
+@pytest.mark.parametrize("min_support", [1, 2, 3])
+def test_fit_with_large_book_dataset(large_book_dataset, min_support):
+    """Test that the bitmap counting method finds the same frequent itemsets as the scan counting method."""
+
+    # Fit both variants
+    scanning_apriori = Apriori(min_support=min_support)
+    scanning_apriori.fit(large_book_dataset)
+    bitmap_apriori = Apriori(min_support=min_support, counting_method="bitmap")
+    bitmap_apriori.fit(large_book_dataset)
+
+    assert bitmap_apriori.frequent_itemsets == scanning_apriori.frequent_itemsets
+
+
+@pytest.mark.parametrize("min_support", [5, 10, 20])
+def test_fit_with_random_grocery_dataset(random_grocery_dataset, min_support):
+    """Test that the bitmap counting method finds the same frequent itemsets as the scan counting method on a larger dataset."""
+
+    # Fit both variants
+    scanning_apriori = Apriori(min_support=min_support)
+    scanning_apriori.fit(random_grocery_dataset)
+    bitmap_apriori = Apriori(min_support=min_support, counting_method="bitmap")
+    bitmap_apriori.fit(random_grocery_dataset)
+
+    assert bitmap_apriori.frequent_itemsets == scanning_apriori.frequent_itemsets
+
+
+def test_incomplete_vertical_index_cannot_be_created(small_fruit_dataset):
+    """Test that a vertical index that does not implement all abstract methods fails on creation."""
+
+    class IncompleteIndex(VerticalIndex):
+        def _build_item_covers(self, dataset):
+            return dict()
+
+    with pytest.raises(TypeError):
+        IncompleteIndex(small_fruit_dataset)
@@ -0,0 +1,113 @@
+import pytest
+
+from apriori import Apriori
+
+from classes.candidate_hash_tree import CandidateHashTree
+from classes.item import Item
+from classes.itemset import Itemset
+
+#####
+# Test the candidate hash tree
+#####
+
+
+def test_leaves_are_split_when_they_overflow():
+    """Test that a leaf with more candidates than the leaf size is split into an interior node."""
+
+    # Create six 2-itemsets
+    fruits = [Item("Apple"), Item("Banana"), Item("Cherry"), Item("Dragonfruit")]
+    itemsets = {
+        Itemset(frozenset({fruits[i], fruits[j]}))
+        for i in range(len(fruits))
+        for j in range(i + 1, len(fruits))
+    }
+
+    # Build the hash tree with tiny leaves
+    hash_tree = CandidateHashTree(itemsets, leaf_size=2, fan_out=2)
+
+    # The root has to be split
+    assert not hash_tree.root.is_leaf()
+    assert len(hash_tree.root.children) == 2
+
+    # No candidate is lost
+    assert set(hash_tree.get_itemsets_with_occurrence_counts().keys()) == itemsets
+
+
+def test_transaction_is_counted_once_per_candidate(small_fruit_dataset):
+    """Test that a candidate reachable on several paths of a transaction is only counted once."""
+
+    # With a fan-out of 2 many items share a bucket, so leaves are reached on several paths
+    itemsets = {
+        Itemset(frozenset({Item("Apple"), Item("Cherry")})),
+        Itemset(frozenset({Item("Apple"), Item("Banana")})),
+        Itemset(frozenset({Item("Cherry"), Item("Dragonfruit")})),
+    }
+    hash_tree = CandidateHashTree(itemsets, leaf_size=1, fan_out=2)
+
+    # Count the occurrences
+    itemsets_with_occurrence_counts = hash_tree.count_occurrences_in_dataset(
+        small_fruit_dataset
+    )
+
+    # Check the occurrence counts
+    expected_occurrences = {
+        Itemset(frozenset({Item("Apple"), Item("Cherry")})): 3,
+        Itemset(frozenset({Item("Apple"), Item("Banana")})): 1,
+        Itemset(frozenset({Item("Cherry"), Item("Dragonfruit")})): 1,
+    }
+    assert dict(itemsets_with_occurrence_counts) == expected_occurrences
+
+
+def test_counting_of_mixed_itemset_lengths(small_fruit_dataset):
+    """Test the counting of itemsets of different lengths (one hash tree per length)."""
+
+    # Create the Apriori object
+    apriori = Apriori(counting_method="hash_tree")
+
+    # Itemsets of different lengths
+    itemsets = {
+        Itemset(frozenset({Item("Apple")})),
+        Itemset(frozenset({Item("Banana"), Item("Cherry")})),
+        Itemset(frozenset({Item("Apple"), Item("Cherry"), Item("Dragonfruit")})),
+        Itemset(frozenset({Item("Elderberry")})),
+    }
+
+    # Count the occurrences of the itemsets
+    itemsets_with_occurrence_counts = apriori._count_occurrences_of_itemsets(
+        small_fruit_dataset, itemsets
+    )
+
+    # Check the occurrence counts
+    expected_occurrences = {
+        Itemset(frozenset({Item("Apple")})): 4,
+        Itemset(frozenset({Item("Banana"), Item("Cherry")})): 2,
+        Itemset(frozenset({Item("Apple"), Item("Cherry"), Item("Dragonfruit")})): 1,
+        Itemset(frozenset({Item("Elderberry")})): 0,
+    }
+    assert dict(itemsets_with_occurrence_counts) == expected_occurrences
+
+
+@pytest.mark.parametrize("leaf_size, fan_out", [(1, 2), (3, 3), (8, 8), (100, 16)])
+def test_fit_with_random_grocery_dataset(random_grocery_dataset, leaf_size, fan_out):
+    """Test that the hash_tree counting method finds the same frequent itemsets as the scan counting method."""
+
+    # Fit both variants
+    scanning_apriori = Apriori(min_support=5)
+    scanning_apriori.fit(random_grocery_dataset)
+    hash_tree_apriori = Apriori(
+        min_support=5,
+        counting_method="hash_tree",
+        hash_tree_leaf_size=leaf_size,
+        hash_tree_fan_out=fan_out,
+    )
+    hash_tree_apriori.fit(random_grocery_dataset)
+
+    assert hash_tree_apriori.frequent_itemsets == scanning_apriori.frequent_itemsets
+
+
+@pytest.mark.parametrize("leaf_size, fan_out", [(0, 8), (8, 1), (8.0, 8)])
+def test_invalid_hash_tree_parameters(leaf_size, fan_out):
+    """Test that invalid leaf sizes and fan-outs are rejected."""
+
+    with pytest.raises(ValueError):
+        Apriori(hash_tree_leaf_size=leaf_size, hash_tree_fan_out=fan_out)
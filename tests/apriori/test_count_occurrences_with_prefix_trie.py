@@ -0,0 +1,104 @@
+import pytest
+
+from apriori import Apriori
+
+from classes.candidate_prefix_trie import CandidatePrefixTrie
+from classes.item import Item
+from classes.itemset import Itemset
+from classes.itemsets_with_occurrence_counts import ItemsetsWithOccurrenceCounts
+
+#####
+# Test the candidate prefix trie
+#####
+
+
+def test_candidates_share_their_prefixes():
+    """Test that candidates with a common prefix share the trie nodes of the prefix."""
+
+    # Two 3-itemsets with the common prefix (Apple, Banana)
+    itemsets = {
+        Itemset(frozenset({Item("Apple"), Item("Banana"), Item("Cherry")})),
+        Itemset(frozenset({Item("Apple"), Item("Banana"), Item("Dragonfruit")})),
+    }
+    prefix_trie = CandidatePrefixTrie(itemsets)
+
+    # The root has one child (Apple) with one child (Banana) that holds the IDs of both candidates
+    apple_node = prefix_trie.root.children[prefix_trie.item_ranks[Item("Apple")]]
+    assert len(prefix_trie.root.children) == 1
+    assert len(apple_node.children) == 1
+    banana_node = apple_node.children[prefix_trie.item_ranks[Item("Banana")]]
+    assert len(banana_node.children) == 0
+    assert len(banana_node.itemset_ids) == 2
+
+    # Only the node of the whole prefix holds candidates
+    assert not prefix_trie.root.itemset_ids
+    assert not apple_node.itemset_ids
+
+
+def test_counting_of_2_itemsets_with_small_fruit_dataset(small_fruit_dataset):
+    """Test the counting of occurrences of 2-itemsets with the prefix_trie counting method."""
+
+    # Create the Apriori object
+    apriori = Apriori(counting_method="prefix_trie")
+
+    # All 2-itemsets plus one with an unknown item
+    fruits = [Item("Apple"), Item("Banana"), Item("Cherry"), Item("Dragonfruit")]
+    two_itemsets = {
+        Itemset(frozenset({fruits[i], fruits[j]}))
+        for i in range(len(fruits))
+        for j in range(i + 1, len(fruits))
+    }
+    two_itemsets.add(Itemset(frozenset({Item("Apple"), Item("Elderberry")})))
+
+    # Count the occurrences of the 2-itemsets
+    itemsets_with_occurrence_counts = apriori._count_occurrences_of_itemsets(
+        small_fruit_dataset, two_itemsets
+    )
+
+    # The result has the same type as the other counting methods
+    assert isinstance(itemsets_with_occurrence_counts, ItemsetsWithOccurrenceCounts)
+
+    # Check the occurrence counts
+    expected_occurrences = {
+        Itemset(frozenset({Item("Apple"), Item("Banana")})): 1,
+        Itemset(frozenset({Item("Apple"), Item("Cherry")})): 3,
+        Itemset(frozenset({Item("Apple"), Item("Dragonfruit")})): 2,
+        Itemset(frozenset({Item("Banana"), Item("Cherry")})): 2,
+        Itemset(frozenset({Item("Banana"), Item("Dragonfruit")})): 0,
+        Itemset(frozenset({Item("Cherry"), Item("Dragonfruit")})): 1,
+        Itemset(frozenset({Item("Apple"), Item("Elderberry")})): 0,
+    }
+    assert dict(itemsets_with_occurrence_counts) == expected_occurrences
+
+
+def test_counting_of_nested_candidates(small_fruit_dataset):
+    """Test the counting of candidates that are prefixes of other candidates."""
+
+    # A 1-itemset that is the prefix of a 2-itemset
+    itemsets = {
+        Itemset(frozenset({Item("Apple")})),
+        Itemset(frozenset({Item("Apple"), Item("Cherry")})),
+    }
+
+    # Count the occurrences
+    itemsets_with_occurrence_counts = CandidatePrefixTrie(
+        itemsets
+    ).count_occurrences_in_dataset(small_fruit_dataset)
+
+    assert dict(itemsets_with_occurrence_counts) == {
+        Itemset(frozenset({Item("Apple")})): 4,
+        Itemset(frozenset({Item("Apple"), Item("Cherry")})): 3,
+    }
+
+
+@pytest.mark.parametrize("min_support", [5, 10, 20])
+def test_fit_with_random_grocery_dataset(random_grocery_dataset, min_support):
+    """Test that the prefix_trie counting method finds the same frequent itemsets as the scan counting method."""
+
+    # Fit both variants
+    scanning_apriori = Apriori(min_support=min_support)
+    scanning_apriori.fit(random_grocery_dataset)
+    prefix_trie_apriori = Apriori(min_support=min_support, counting_method="prefix_trie")
+    prefix_trie_apriori.fit(random_grocery_dataset)
+
+    assert prefix_trie_apriori.frequent_itemsets == scanning_apriori.frequent_itemsets
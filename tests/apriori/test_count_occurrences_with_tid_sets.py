@@ -0,0 +1,100 @@
+import pytest
+
+from apriori import Apriori
+
+from classes.item import Item
+from classes.itemset import Itemset
+from classes.tid_set_index import TIDSetIndex
+
+#####
+# Test the counting with the vertical index
+#####
+
+
+def test_counting_of_2_itemsets_with_small_fruit_dataset(small_fruit_dataset):
+    """Test the counting of occurrences of 2-itemsets with the tid_set counting method."""
+
+    # Create the Apriori object
+    apriori = Apriori(counting_method="tid_set")
+
+    # List of 2-itemsets
+    two_itemsets = {
+        Itemset(frozenset({Item("Apple"), Item("Cherry")})),
+        Itemset(frozenset({Item("Banana"), Item("Dragonfruit")})),
+        Itemset(frozenset({Item("Apple"), Item("Elderberry")})),
+    }
+
+    # Count the occurrences of the 2-itemsets
+    itemsets_with_occurrence_counts = apriori._count_occurrences_of_itemsets(
+        small_fruit_dataset, two_itemsets
+    )
+
+    # Check the occurrence counts
+    expected_occurrences = {
+        Itemset(frozenset({Item("Apple"), Item("Cherry")})): 3,
+        Itemset(frozenset({Item("Banana"), Item("Dragonfruit")})): 0,
+        Itemset(frozenset({Item("Apple"), Item("Elderberry")})): 0,
+    }
+    assert dict(itemsets_with_occurrence_counts) == expected_occurrences
+
+
+def test_prefix_covers_are_reused_for_the_next_level(small_fruit_dataset):
+    """Test that the TID sets of the frequent itemsets of a level are kept as prefixes for the next level."""
+
+    # Create the index
+    tid_set_index = TIDSetIndex(small_fruit_dataset, min_support=2)
+
+    # Count a frequent and an infrequent 2-itemset
+    tid_set_index.count_occurrences_of_itemsets(
+        {
+            Itemset(frozenset({Item("Apple"), Item("Cherry")})),
+            Itemset(frozenset({Item("Apple"), Item("Banana")})),
+        }
+    )
+
+    # Only the frequent 2-itemset is kept as prefix
+    assert set(tid_set_index.prefix_covers.keys()) == {(Item("Apple"), Item("Cherry"))}
+
+    # Count a 3-itemset that uses the kept prefix
+    itemsets_with_occurrence_counts = tid_set_index.count_occurrences_of_itemsets(
+        {Itemset(frozenset({Item("Apple"), Item("Cherry"), Item("Dragonfruit")}))}
+    )
+    assert (
+        itemsets_with_occurrence_counts.get_occurrence_count(
+            Itemset(frozenset({Item("Apple"), Item("Cherry"), Item("Dragonfruit")}))
+        )
+        == 1
+    )
+
+
+@pytest.mark.parametrize("min_support", [1, 2, 3])
+def test_fit_returns_the_same_itemsets_as_scanning(small_fruit_dataset, min_support):
+    """Test that the tid_set counting method finds the same frequent itemsets as the scan counting method."""
+
+    # Fit both variants
+    scanning_apriori = Apriori(min_support=min_support)
+    scanning_apriori.fit(small_fruit_dataset)
+    vertical_apriori = Apriori(min_support=min_support, counting_method="tid_set")
+    vertical_apriori.fit(small_fruit_dataset)
+
+    assert vertical_apriori.frequent_itemsets == scanning_apriori.frequent_itemsets
+
+
+@pytest.mark.parametrize("min_support", [5, 10, 20])
+def test_fit_with_random_grocery_dataset(random_grocery_dataset, min_support):
+    """Test that the tid_set counting method finds the same frequent itemsets as the scan counting method on a larger dataset."""
+
+    # Fit both variants
+    scanning_apriori = Apriori(min_support=min_support)
+    scanning_apriori.fit(random_grocery_dataset)
+    vertical_apriori = Apriori(min_support=min_support, counting_method="tid_set")
+    vertical_apriori.fit(random_grocery_dataset)
+
+    assert vertical_apriori.frequent_itemsets == scanning_apriori.frequent_itemsets
+
+
+def test_unknown_counting_method():
+    """Test that an unknown counting method is rejected."""
+
+    with pytest.raises(ValueError):
+        Apriori(counting_method="magic")
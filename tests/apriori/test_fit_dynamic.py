@@ -0,0 +1,64 @@
+import pytest
+
+from apriori import Apriori
+
+from classes.transaction_file_source import TransactionFileSource
+
+#####
+# Test Dynamic Itemset Counting
+#####
+
+
+@pytest.mark.parametrize("interval_count", [1, 4, 30])
+@pytest.mark.parametrize("min_support", [1, 5, 20])
+def test_fit_dynamic_with_random_grocery_dataset(random_grocery_dataset, interval_count, min_support):
+    """Test that Dynamic Itemset Counting finds the same frequent itemsets as the level-wise fit."""
+
+    # Fit level by level
+    apriori = Apriori(min_support=min_support)
+    apriori.fit(random_grocery_dataset)
+
+    # Fit with overlapping levels
+    dynamic_apriori = Apriori(min_support=min_support)
+    dynamic_apriori.fit_dynamic(list(random_grocery_dataset.transactions), interval_count)
+
+    assert dynamic_apriori.frequent_itemsets == apriori.frequent_itemsets
+
+
+def test_fit_dynamic_needs_fewer_scans_than_levels(random_grocery_dataset):
+    """Test that the levels overlap, so that fewer scans than levels are needed."""
+
+    # Fit level by level (the last level has no frequent itemsets)
+    apriori = Apriori(min_support=3, pair_matrix_memory_limit=0)
+    apriori.fit(random_grocery_dataset)
+    level_count = len(apriori.statistics.dataset_sizes)
+
+    # Fit with many intervals (in a fixed transaction order)
+    dynamic_apriori = Apriori(min_support=3)
+    dynamic_apriori.fit_dynamic(
+        sorted(random_grocery_dataset.transactions, key=lambda transaction: transaction.id), 20
+    )
+
+    assert dynamic_apriori.frequent_itemsets == apriori.frequent_itemsets
+    assert dynamic_apriori.statistics.dataset_scans < level_count
+
+
+def test_fit_dynamic_with_transaction_file(tmp_path, large_book_dataset):
+    """Test that the transactions can be streamed from a file repeatedly."""
+
+    # Write the dataset to a file
+    source = TransactionFileSource.write(str(tmp_path / "books.txt"), large_book_dataset.transactions)
+
+    apriori = Apriori(min_support=3)
+    apriori.fit_dynamic(source, 3, len(large_book_dataset.transactions))
+
+    # Compare with a fit on the whole dataset
+    expected_apriori = Apriori(min_support=3)
+    expected_apriori.fit(large_book_dataset)
+    assert apriori.frequent_itemsets == expected_apriori.frequent_itemsets
+
+    # A wrong number of transactions is detected
+    with pytest.raises(ValueError):
+        apriori.fit_dynamic(source, 3, len(large_book_dataset.transactions) + 1)
+    with pytest.raises(ValueError):
+        apriori.fit_dynamic(source, 3, len(large_book_dataset.transactions) - 1)
@@ -0,0 +1,74 @@
+import pytest
+
+from apriori import Apriori
+
+from classes.transaction_file_source import TransactionFileSource
+
+#####
+# Test the partition algorithm
+#####
+
+
+@pytest.mark.parametrize("partition_size", [1, 7, 40, 1000])
+@pytest.mark.parametrize("min_support", [1, 5, 20])
+def test_fit_partitioned_with_random_grocery_dataset(random_grocery_dataset, partition_size, min_support):
+    """Test that the partition algorithm finds the same frequent itemsets as a fit on the whole dataset."""
+
+    # Fit on the whole dataset
+    apriori = Apriori(min_support=min_support)
+    apriori.fit(random_grocery_dataset)
+
+    # Fit partition by partition
+    partitioning_apriori = Apriori(min_support=min_support)
+    partitioning_apriori.fit_partitioned(
+        list(random_grocery_dataset.transactions), partition_size
+    )
+
+    assert partitioning_apriori.frequent_itemsets == apriori.frequent_itemsets
+    assert partitioning_apriori.statistics.dataset_scans == 2
+    assert max(partitioning_apriori.statistics.partition_sizes) <= partition_size
+    assert sum(partitioning_apriori.statistics.partition_sizes) == len(random_grocery_dataset.transactions)
+
+
+@pytest.mark.parametrize("partition_size", [1, 2, 3])
+def test_fit_partitioned_with_equal_transactions(small_fruit_dataset, partition_size):
+    """Test that equal transactions in the same partition are counted separately."""
+
+    transaction = min(small_fruit_dataset.transactions, key=lambda transaction: transaction.id)
+
+    apriori = Apriori(min_support=3)
+    apriori.fit_partitioned([transaction, transaction, transaction], partition_size)
+
+    # All seven subsets of the three items occur three times
+    assert len(apriori.frequent_itemsets) == 7
+    assert set(dict(apriori.frequent_itemset_counts).values()) == {3}
+
+
+def test_fit_partitioned_with_transaction_file(tmp_path, large_book_dataset):
+    """Test that the transactions can be streamed from a file."""
+
+    # Write the dataset to a file
+    source = TransactionFileSource.write(
+        str(tmp_path / "books.txt"), large_book_dataset.transactions, item_separator="|"
+    )
+
+    # The file source has no length, so the number of transactions has to be given
+    apriori = Apriori(min_support=3)
+    with pytest.raises(ValueError):
+        apriori.fit_partitioned(source, 4)
+    apriori.fit_partitioned(source, 4, len(large_book_dataset.transactions))
+
+    # Compare with a fit on the whole dataset
+    expected_apriori = Apriori(min_support=3)
+    expected_apriori.fit(large_book_dataset)
+    assert apriori.frequent_itemsets == expected_apriori.frequent_itemsets
+
+
+def test_fit_partitioned_with_wrong_transaction_count(small_fruit_dataset):
+    """Test that a wrong number of transactions is detected."""
+
+    apriori = Apriori(min_support=2)
+    with pytest.raises(ValueError):
+        apriori.fit_partitioned(iter(small_fruit_dataset.transactions), 2, 10)
+    with pytest.raises(ValueError):
+        apriori.fit_partitioned(list(small_fruit_dataset.transactions), 0)
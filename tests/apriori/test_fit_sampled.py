@@ -0,0 +1,101 @@
+import pytest
+
+from apriori import Apriori
+
+from classes.item import Item
+from classes.itemset import Itemset
+from classes.transaction_file_source import TransactionFileSource
+
+#####
+# Test Toivonen's sampling algorithm
+#####
+
+
+def test_negative_border():
+    """Test that the negative border contains the minimal infrequent itemsets."""
+
+    apriori = Apriori()
+    apple, banana, cherry = Item("Apple"), Item("Banana"), Item("Cherry")
+    frequent_itemsets = {
+        Itemset(frozenset({apple})),
+        Itemset(frozenset({banana})),
+        Itemset(frozenset({cherry})),
+        Itemset(frozenset({apple, banana})),
+        Itemset(frozenset({apple, cherry})),
+    }
+
+    # {Banana, Cherry} has frequent subsets only, {Apple, Banana, Cherry} has the infrequent subset {Banana, Cherry}
+    assert apriori._get_negative_border(frequent_itemsets) == {
+        Itemset(frozenset({banana, cherry}))
+    }
+
+
+@pytest.mark.parametrize("sample_size", [10, 60, 1000])
+@pytest.mark.parametrize("min_support", [1, 5, 20])
+def test_fit_sampled_with_random_grocery_dataset(random_grocery_dataset, sample_size, min_support):
+    """Test that the sampling algorithm finds the same frequent itemsets as a fit on the whole dataset."""
+
+    # Fit on the whole dataset
+    apriori = Apriori(min_support=min_support)
+    apriori.fit(random_grocery_dataset)
+
+    # Fit on a sample and verify with the whole dataset
+    sampling_apriori = Apriori(min_support=min_support)
+    sampling_apriori.fit_sampled(list(random_grocery_dataset.transactions), sample_size, seed=1)
+
+    assert sampling_apriori.frequent_itemsets == apriori.frequent_itemsets
+    assert sampling_apriori.statistics.dataset_scans >= 1
+
+
+def test_fit_sampled_counts_missed_itemsets(random_grocery_dataset):
+    """Test that itemsets missed by a tiny sample are found by further scans."""
+
+    # Fit on the whole dataset
+    apriori = Apriori(min_support=10)
+    apriori.fit(random_grocery_dataset)
+
+    # A sample of two transactions misses frequent itemsets
+    sampling_apriori = Apriori(min_support=10)
+    sampling_apriori.fit_sampled(
+        list(random_grocery_dataset.transactions), 2, support_lowering=1.0, seed=3
+    )
+
+    assert sampling_apriori.frequent_itemsets == apriori.frequent_itemsets
+    assert sampling_apriori.statistics.dataset_scans > 1
+
+
+def test_fit_sampled_with_equal_transactions(small_fruit_dataset):
+    """Test that equal transactions in the sample are counted separately, so no further scan is needed."""
+
+    transaction = min(small_fruit_dataset.transactions, key=lambda transaction: transaction.id)
+
+    apriori = Apriori(min_support=3)
+    apriori.fit_sampled([transaction, transaction, transaction], 3, seed=0)
+
+    assert len(apriori.frequent_itemsets) == 7
+    assert apriori.statistics.dataset_scans == 1
+
+
+def test_fit_sampled_with_transaction_file(tmp_path, large_book_dataset):
+    """Test that a sample can be drawn from a file with a single extra scan."""
+
+    # Write the dataset to a file
+    source = TransactionFileSource.write(str(tmp_path / "books.txt"), large_book_dataset.transactions)
+
+    apriori = Apriori(min_support=3)
+    apriori.fit_sampled(source, 8, seed=0)
+
+    # Compare with a fit on the whole dataset
+    expected_apriori = Apriori(min_support=3)
+    expected_apriori.fit(large_book_dataset)
+    assert apriori.frequent_itemsets == expected_apriori.frequent_itemsets
+
+
+def test_fit_sampled_with_invalid_parameters(small_fruit_dataset):
+    """Test that invalid sample sizes and support lowerings are rejected."""
+
+    apriori = Apriori(min_support=2)
+    with pytest.raises(ValueError):
+        apriori.fit_sampled(list(small_fruit_dataset.transactions), 0)
+    with pytest.raises(ValueError):
+        apriori.fit_sampled(list(small_fruit_dataset.transactions), 2, support_lowering=0)
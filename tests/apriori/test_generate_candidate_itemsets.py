@@ -183,3 +183,38 @@ def test_with_two_itemsets_and_no_valid_candidate_three_itemsets():
     )
 
     assert not extra_itemsets, f"Extra itemsets: {extra_itemsets_text}."
+
+
+#####
+# Test with the levels of a random dataset
+#####
+
+
+def test_with_all_levels_of_random_grocery_dataset(random_grocery_dataset):
+    """Test that exactly the (k+1)-itemsets whose k-subsets are all frequent are generated for every level."""
+
+    # Mine the frequent itemsets to get realistic levels
+    apriori = Apriori(min_support=3)
+    apriori.fit(random_grocery_dataset)
+
+    # Group the frequent itemsets by their length
+    levels = dict()
+    for itemset in apriori.frequent_itemsets:
+        levels.setdefault(len(itemset.items), set()).add(itemset)
+
+    for length, frequent_itemsets in levels.items():
+        # Generate the candidate itemsets
+        candidate_itemsets = apriori._generate_candidate_itemsets(frequent_itemsets)
+
+        # Build the expected candidates by brute force
+        frequent_items = {itemset.items for itemset in frequent_itemsets}
+        expected_itemsets = set()
+        for first_items in frequent_items:
+            for second_items in frequent_items:
+                union = first_items | second_items
+                if len(union) == length + 1 and all(
+                    union - {item} in frequent_items for item in union
+                ):
+                    expected_itemsets.add(Itemset(union))
+
+        assert candidate_itemsets == expected_itemsets, f"Level: {length}."
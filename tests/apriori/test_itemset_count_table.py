@@ -0,0 +1,73 @@
+from classes.candidate_prefix_trie import CandidatePrefixTrie
+from classes.item import Item
+from classes.itemset import Itemset
+from classes.itemset_count_table import ItemsetCountTable
+
+#####
+# Test the array-backed count table
+#####
+
+
+def test_itemsets_are_numbered_densely():
+    """Test that the itemsets get consecutive IDs and can be looked up by their IDs and vice versa."""
+
+    apple = Itemset(frozenset({Item("Apple")}))
+    banana = Itemset(frozenset({Item("Banana")}))
+    cherry = Itemset(frozenset({Item("Cherry")}))
+
+    count_table = ItemsetCountTable([apple, banana])
+    assert count_table.get_id(apple) == 0
+    assert count_table.get_id(banana) == 1
+
+    # An itemset added after the first lookup is indexed as well
+    assert count_table.add(cherry, 5) == 2
+    assert count_table.get_id(cherry) == 2
+    assert cherry in count_table
+    assert Itemset(frozenset({Item("Dragonfruit")})) not in count_table
+
+    assert len(count_table) == 3
+    assert count_table.itemsets[2] == cherry
+    assert count_table.get_occurrence_count(cherry) == 5
+    assert count_table.get_size() == 3 * count_table.counts.itemsize
+
+
+def test_occurrences_are_summed_across_flushes(monkeypatch):
+    """Test that buffered occurrences are summed correctly, also when the buffer is flushed in between."""
+
+    # Flush after every few IDs
+    monkeypatch.setattr(ItemsetCountTable, "PENDING_ID_LIMIT", 3)
+
+    apple = Itemset(frozenset({Item("Apple")}))
+    banana = Itemset(frozenset({Item("Banana")}))
+    cherry = Itemset(frozenset({Item("Cherry")}))
+    count_table = ItemsetCountTable([apple, banana, cherry])
+
+    count_table.add_occurrences([0, 1])
+    count_table.add_occurrences(iter([0, 0]))
+    count_table.add_occurrences([])
+    count_table.add_occurrences([1])
+
+    # Only the itemsets with at least the minimum count are converted
+    assert dict(count_table.to_itemsets_with_occurrence_counts()) == {apple: 3, banana: 2, cherry: 0}
+    assert dict(count_table.to_itemsets_with_occurrence_counts(min_count=3)) == {apple: 3}
+
+
+def test_prefix_trie_counts_the_empty_itemset(small_fruit_dataset):
+    """Test that the empty itemset is counted in every transaction of a prefix trie."""
+
+    empty = Itemset(frozenset())
+    apple = Itemset(frozenset({Item("Apple")}))
+    prefix_trie = CandidatePrefixTrie({empty, apple})
+
+    # The contained candidates of a single transaction
+    contained_itemsets = []
+    prefix_trie.add_transaction(
+        Itemset(frozenset({Item("Apple"), Item("Banana")})), contained_itemsets
+    )
+    assert set(contained_itemsets) == {empty, apple}
+
+    # The counts of the transaction above and of the dataset are added up
+    assert dict(prefix_trie.count_occurrences_in_dataset(small_fruit_dataset)) == {
+        empty: 6,
+        apple: 5,
+    }
@@ -0,0 +1,113 @@
+import pytest
+
+from apriori import Apriori
+
+from classes.dataset import Dataset
+from classes.item import Item
+from classes.itemset import Itemset
+
+#####
+# Test the level-by-level generator
+#####
+
+
+def test_levels_of_small_fruit_dataset(small_fruit_dataset):
+    """Test that every level is yielded with the occurrence counts of its frequent itemsets."""
+
+    apriori = Apriori(min_support=2)
+    levels = [dict(level_counts) for level_counts in apriori.iter_levels(small_fruit_dataset)]
+
+    assert levels == [
+        {
+            Itemset(frozenset({Item("Apple")})): 4,
+            Itemset(frozenset({Item("Banana")})): 2,
+            Itemset(frozenset({Item("Cherry")})): 4,
+            Itemset(frozenset({Item("Dragonfruit")})): 2,
+        },
+        {
+            Itemset(frozenset({Item("Apple"), Item("Cherry")})): 3,
+            Itemset(frozenset({Item("Apple"), Item("Dragonfruit")})): 2,
+            Itemset(frozenset({Item("Banana"), Item("Cherry")})): 2,
+        },
+    ]
+
+
+def test_stopping_early_skips_the_deeper_levels(random_grocery_dataset):
+    """Test that the deeper levels are not mined if the generator is closed."""
+
+    apriori = Apriori(min_support=2, pair_matrix_memory_limit=0)
+    levels = apriori.iter_levels(random_grocery_dataset)
+    next(levels)
+    next(levels)
+    levels.close()
+
+    # Only the 1- and 2-itemsets were counted
+    assert len(apriori.statistics.counting_methods) == 2
+
+
+@pytest.mark.parametrize(
+    "parameters",
+    [
+        {},
+        {"counting_method": "bitmap"},
+        {"trim_dataset": True},
+        {"candidate_memory_limit": 10 * Apriori.CANDIDATE_SIZE},
+        {"workers": 2},
+        {"workers": 2, "parallel_mode": "candidate_distribution"},
+    ],
+)
+def test_fit_stores_the_occurrence_counts(random_grocery_dataset, parameters):
+    """Test that fit keeps the exact occurrence counts of all frequent itemsets."""
+
+    apriori = Apriori(min_support=4, **parameters)
+    apriori.fit(random_grocery_dataset)
+
+    assert set(apriori.frequent_itemset_counts.keys()) == apriori.frequent_itemsets
+    for itemset, count in apriori.frequent_itemset_counts.items():
+        assert count == sum(
+            itemset.items <= transaction.items.items for transaction in random_grocery_dataset.transactions
+        )
+
+
+@pytest.mark.parametrize("mode", ["fit_partitioned", "fit_sampled", "fit_dynamic"])
+def test_out_of_core_modes_store_the_occurrence_counts(random_grocery_dataset, mode):
+    """Test that the out-of-core modes keep the same occurrence counts as fit."""
+
+    apriori = Apriori(min_support=4)
+    apriori.fit(random_grocery_dataset)
+
+    out_of_core_apriori = Apriori(min_support=4)
+    getattr(out_of_core_apriori, mode)(list(random_grocery_dataset.transactions), 30)
+
+    assert dict(out_of_core_apriori.frequent_itemset_counts) == dict(apriori.frequent_itemset_counts)
+
+
+def test_update_after_consuming_the_levels(random_grocery_dataset):
+    """Test that the levels of a consumed generator are saved, so they can be updated."""
+
+    # Fit on the whole dataset
+    apriori = Apriori(min_support=5)
+    apriori.fit(random_grocery_dataset)
+
+    # Mine the first 110 transactions level by level and append the rest
+    transactions = sorted(random_grocery_dataset.transactions, key=lambda transaction: transaction.id)
+    levels_apriori = Apriori(min_support=5, keep_negative_border=True)
+    for _ in levels_apriori.iter_levels(Dataset(frozenset(transactions[:110]))):
+        pass
+    levels_apriori.update(Dataset(frozenset(transactions[110:])))
+
+    assert dict(levels_apriori.frequent_itemset_counts) == dict(apriori.frequent_itemset_counts)
+
+
+def test_closed_generator_cannot_be_updated(small_fruit_dataset):
+    """Test that a generator that was closed early leaves nothing to update."""
+
+    apriori = Apriori(min_support=2)
+    apriori.fit(small_fruit_dataset)
+    levels = apriori.iter_levels(small_fruit_dataset)
+    next(levels)
+    levels.close()
+
+    assert not apriori.frequent_itemsets
+    with pytest.raises(ValueError):
+        apriori.update(small_fruit_dataset)
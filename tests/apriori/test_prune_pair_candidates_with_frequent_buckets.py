@@ -0,0 +1,82 @@
+import pytest
+
+from apriori import Apriori
+
+from classes.item import Item
+from classes.itemset import Itemset
+
+#####
+# Test the PCY filter of the pair candidates
+#####
+
+
+def test_single_bucket_keeps_all_pairs(small_fruit_dataset):
+    """Test that all pairs are kept if every pair is hashed into the same (frequent) bucket."""
+
+    # Create the Apriori object with a single bucket
+    apriori = Apriori(min_support=2, pcy_bucket_count=1)
+
+    # Generate the 1-itemsets and the bucket bitmap
+    one_itemsets, frequent_buckets = apriori._generate_one_itemsets_and_hash_pairs(
+        small_fruit_dataset
+    )
+    assert len(one_itemsets) == 4
+    assert frequent_buckets == bytearray([1])
+
+    # Prune the pair candidates
+    candidates = apriori._generate_candidate_itemsets(one_itemsets)
+    assert (
+        apriori._prune_pair_candidates_with_frequent_buckets(candidates, frequent_buckets)
+        == candidates
+    )
+    assert apriori.statistics.pruned_pair_candidates == 0
+
+
+def test_pruned_pairs_are_infrequent(small_fruit_dataset):
+    """Test that only infrequent pairs are pruned."""
+
+    # Create the Apriori object with many buckets
+    apriori = Apriori(min_support=2, pcy_bucket_count=10007)
+
+    # Generate the 1-itemsets and the bucket bitmap
+    one_itemsets, frequent_buckets = apriori._generate_one_itemsets_and_hash_pairs(
+        small_fruit_dataset
+    )
+
+    # Prune the pair candidates
+    candidates = apriori._generate_candidate_itemsets(one_itemsets)
+    remaining_candidates = apriori._prune_pair_candidates_with_frequent_buckets(
+        candidates, frequent_buckets
+    )
+
+    # The frequent pairs must never be pruned
+    frequent_pairs = {
+        Itemset(frozenset({Item("Apple"), Item("Cherry")})),
+        Itemset(frozenset({Item("Apple"), Item("Dragonfruit")})),
+        Itemset(frozenset({Item("Banana"), Item("Cherry")})),
+    }
+    assert frequent_pairs <= remaining_candidates
+    assert apriori.statistics.pruned_pair_candidates == len(candidates) - len(
+        remaining_candidates
+    )
+
+
+@pytest.mark.parametrize("min_support", [5, 10, 20])
+def test_fit_with_random_grocery_dataset(random_grocery_dataset, min_support):
+    """Test that the PCY filter does not change the frequent itemsets and reports the pruned pairs."""
+
+    # Fit both variants
+    apriori = Apriori(min_support=min_support)
+    apriori.fit(random_grocery_dataset)
+    pcy_apriori = Apriori(min_support=min_support, pcy_bucket_count=100003)
+    pcy_apriori.fit(random_grocery_dataset)
+
+    assert pcy_apriori.frequent_itemsets == apriori.frequent_itemsets
+    assert pcy_apriori.statistics.pruned_pair_candidates > 0
+
+
+def test_invalid_bucket_count():
+    """Test that a negative number of buckets is rejected."""
+
+    with pytest.raises(ValueError):
+        Apriori(pcy_bucket_count=-1)
@@ -0,0 +1,77 @@
+import pytest
+
+from apriori import Apriori
+
+#####
+# Test the refit with a different minimum support
+#####
+
+
+@pytest.mark.parametrize(
+    "parameters",
+    [
+        {},
+        {"keep_negative_border": True},
+        {"keep_negative_border": True, "pair_matrix_memory_limit": 0},
+        {"keep_negative_border": True, "pcy_bucket_count": 7},
+    ],
+)
+@pytest.mark.parametrize("min_supports", [[20, 10, 5, 2], [2, 8, 3]])
+def test_refit_with_random_grocery_dataset(random_grocery_dataset, parameters, min_supports):
+    """Test that a sweep of refits finds the same frequent itemsets as cold fits."""
+
+    sweeping_apriori = Apriori(min_support=min_supports[0], **parameters)
+    sweeping_apriori.fit(random_grocery_dataset)
+    for min_support in min_supports[1:]:
+        sweeping_apriori.refit(min_support)
+
+        # Compare with a cold fit
+        apriori = Apriori(min_support=min_support)
+        apriori.fit(random_grocery_dataset)
+        assert sweeping_apriori.min_support == min_support
+        assert sweeping_apriori.frequent_itemsets == apriori.frequent_itemsets
+        assert dict(sweeping_apriori.frequent_itemset_counts) == dict(apriori.frequent_itemset_counts)
+
+
+def test_refit_counts_only_the_newly_admitted_candidates(random_grocery_dataset):
+    """Test that the known counts are reused."""
+
+    apriori = Apriori(min_support=10, keep_negative_border=True)
+    apriori.fit(random_grocery_dataset)
+    known_itemset_count = len(apriori.frequent_itemset_counts) + len(apriori.infrequent_itemset_counts)
+
+    # A higher minimum support only needs the known counts
+    apriori.refit(12)
+    assert apriori.statistics.rescanned_itemset_count == 0
+    assert apriori.statistics.dataset_scans == 0
+
+    # A lower minimum support only counts candidates that were not counted before
+    apriori.refit(8)
+    cold_apriori = Apriori(min_support=8, pair_matrix_memory_limit=0)
+    cold_apriori.fit(random_grocery_dataset)
+    assert 0 < apriori.statistics.rescanned_itemset_count < known_itemset_count
+    assert apriori.frequent_itemsets == cold_apriori.frequent_itemsets
+
+
+def test_refit_with_invalid_parameters(small_fruit_dataset):
+    """Test that a refit needs a previous fit and a positive minimum support."""
+
+    apriori = Apriori()
+    with pytest.raises(ValueError):
+        apriori.refit(1)
+    apriori.fit(small_fruit_dataset)
+    with pytest.raises(ValueError):
+        apriori.refit(0)
+
+
+def test_refit_with_known_counts_does_not_build_the_fitted_dataset(random_grocery_dataset, monkeypatch):
+    """Test that the fitted transactions are not collected if every count is known."""
+
+    apriori = Apriori(min_support=3, keep_negative_border=True)
+    apriori.fit(random_grocery_dataset)
+    monkeypatch.setattr(
+        Apriori, "_get_fitted_dataset", lambda self: pytest.fail("The fitted dataset was built.")
+    )
+    apriori.refit(6)
+
+    assert apriori.statistics.rescanned_itemset_count == 0
@@ -0,0 +1,119 @@
+import pytest
+
+from apriori import Apriori
+
+from classes.dataset import Dataset
+from classes.dataset_profile import DatasetProfile
+from classes.item import Item
+from classes.itemset import Itemset
+from classes.transaction import Transaction
+
+#####
+# Test the per-level selection of the counting method
+#####
+
+
+def test_count_occurrences_by_enumerating_subsets(small_fruit_dataset):
+    """Test that the subsets of the transactions are counted correctly."""
+
+    # Create the Apriori object
+    apriori = Apriori(min_support=2, counting_method="subsets")
+
+    # Count itemsets of different lengths
+    itemsets = {
+        Itemset(frozenset({Item("Apple")})),
+        Itemset(frozenset({Item("Apple"), Item("Cherry")})),
+        Itemset(frozenset({Item("Banana"), Item("Dragonfruit")})),
+        Itemset(frozenset({Item("Apple"), Item("Banana"), Item("Cherry")})),
+    }
+    itemsets_with_occurrence_counts = apriori._count_occurrences_of_itemsets(
+        small_fruit_dataset, itemsets
+    )
+
+    # Check the occurrence counts
+    assert dict(itemsets_with_occurrence_counts) == {
+        Itemset(frozenset({Item("Apple")})): 4,
+        Itemset(frozenset({Item("Apple"), Item("Cherry")})): 3,
+        Itemset(frozenset({Item("Banana"), Item("Dragonfruit")})): 0,
+        Itemset(frozenset({Item("Apple"), Item("Banana"), Item("Cherry")})): 1,
+    }
+
+
+def test_few_candidates_are_scanned():
+    """Test that a few candidates in long transactions are counted with a scan."""
+
+    # Ten long transactions over the same 30 items
+    items = [Item(f"Item {i}") for i in range(30)]
+    dataset = Dataset(
+        frozenset(
+            Transaction(i, Itemset(frozenset(items[: 20 + i]))) for i in range(10)
+        )
+    )
+
+    # A single 3-itemset: the transactions have thousands of 3-subsets
+    apriori = Apriori(counting_method="auto")
+    itemsets = {Itemset(frozenset(items[:3]))}
+    assert apriori._select_counting_method(dataset, itemsets) == "scan"
+
+
+def test_many_candidates_enumerate_subsets():
+    """Test that many candidates in short transactions are counted by enumerating subsets."""
+
+    # Many short transactions over 30 items
+    items = [Item(f"Item {i}") for i in range(30)]
+    dataset = Dataset(
+        frozenset(
+            Transaction(i, Itemset(frozenset({items[i % 30], items[(i * 7 + 1) % 30], items[(i * 11 + 2) % 30]})))
+            for i in range(200)
+        )
+    )
+
+    # All 2-itemsets: a transaction has at most three 2-subsets
+    apriori = Apriori(counting_method="auto")
+    itemsets = {
+        Itemset(frozenset({items[i], items[j]}))
+        for i in range(len(items))
+        for j in range(i + 1, len(items))
+    }
+    assert apriori._select_counting_method(dataset, itemsets) == "subsets"
+
+
+@pytest.mark.parametrize("counting_method", ["subsets", "auto"])
+@pytest.mark.parametrize("min_support", [1, 5, 20])
+def test_fit_with_random_grocery_dataset(random_grocery_dataset, counting_method, min_support):
+    """Test that the subsets and auto counting methods find the same frequent itemsets as the scan counting method."""
+
+    # Fit both variants
+    scanning_apriori = Apriori(min_support=min_support)
+    scanning_apriori.fit(random_grocery_dataset)
+    apriori = Apriori(min_support=min_support, counting_method=counting_method)
+    apriori.fit(random_grocery_dataset)
+
+    assert apriori.frequent_itemsets == scanning_apriori.frequent_itemsets
+
+    # Every level reports the strategy it was counted with
+    assert set(apriori.statistics.counting_methods) <= {"scan", "subsets"}
+
+
+def test_trimmed_dataset_is_profiled_once(random_grocery_dataset, monkeypatch):
+    """Test that the auto counting method profiles a trimmed dataset only once per fit."""
+
+    # Count the profiling scans
+    profiled_datasets = []
+    from_dataset = DatasetProfile.from_dataset
+
+    def counting_from_dataset(dataset):
+        profiled_datasets.append(dataset)
+        return from_dataset(dataset)
+
+    monkeypatch.setattr(DatasetProfile, "from_dataset", staticmethod(counting_from_dataset))
+
+    # Fit with trimming
+    scanning_apriori = Apriori(min_support=2)
+    scanning_apriori.fit(random_grocery_dataset)
+    apriori = Apriori(min_support=2, counting_method="auto", trim_dataset=True)
+    apriori.fit(random_grocery_dataset)
+
+    assert apriori.frequent_itemsets == scanning_apriori.frequent_itemsets
+    assert len(apriori.statistics.counting_methods) > 2
+    assert profiled_datasets == [random_grocery_dataset]
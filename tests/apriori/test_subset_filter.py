@@ -0,0 +1,59 @@
+import pytest
+
+from apriori import Apriori
+
+from classes.bloom_filter import BloomFilter
+
+#####
+# Test the Bloom filter of the subset check
+#####
+
+
+def test_bloom_filter_has_no_false_negatives():
+    """Test that every added key is found and that few other keys pass."""
+
+    bloom_filter = BloomFilter(1000, bits_per_key=10)
+    added_keys = [(i, i + 1, i + 2) for i in range(0, 3000, 3)]
+    for key in added_keys:
+        bloom_filter.add(key)
+
+    assert all(key in bloom_filter for key in added_keys)
+    false_positives = sum((i, i + 2, i + 1) in bloom_filter for i in range(0, 3000, 3))
+    assert false_positives < 50
+    assert bloom_filter.get_size() == 1250
+
+
+def test_frequent_tuple_check_is_exact():
+    """Test that the survivors of the filter are confirmed exactly."""
+
+    frequent_tuples = sorted((i, j) for i in range(30) for j in range(i + 1, 30) if (i + j) % 3)
+
+    # A single bit per itemset lets many other tuples pass the filter
+    apriori = Apriori(subset_filter_bits=1)
+    is_frequent_tuple = apriori._get_frequent_tuple_check(frequent_tuples)
+    for i in range(30):
+        for j in range(i + 1, 30):
+            assert is_frequent_tuple((i, j)) == bool((i + j) % 3)
+
+
+@pytest.mark.parametrize("subset_filter_bits", [1, 4, 10])
+@pytest.mark.parametrize("min_support", [1, 3, 10])
+def test_fit_with_random_grocery_dataset(random_grocery_dataset, subset_filter_bits, min_support):
+    """Test that the subset filter does not change the frequent itemsets."""
+
+    # Fit with an exact set
+    apriori = Apriori(min_support=min_support)
+    apriori.fit(random_grocery_dataset)
+
+    # Fit with a Bloom filter
+    filtering_apriori = Apriori(min_support=min_support, subset_filter_bits=subset_filter_bits)
+    filtering_apriori.fit(random_grocery_dataset)
+
+    assert filtering_apriori.frequent_itemsets == apriori.frequent_itemsets
+
+
+def test_invalid_subset_filter_bits():
+    """Test that a negative number of bits is rejected."""
+
+    with pytest.raises(ValueError):
+        Apriori(subset_filter_bits=-1)
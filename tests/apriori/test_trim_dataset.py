@@ -0,0 +1,109 @@
+import pytest
+
+from apriori import Apriori
+
+from classes.item import Item
+from classes.itemset import Itemset
+from classes.dataset import Dataset
+from classes.transaction import Transaction
+
+#####
+# Test the trimming of the dataset between levels
+#####
+
+
+def test_trimming_for_the_third_level(small_fruit_dataset):
+    """Test that infrequent items and short transactions are dropped."""
+
+    # Create the Apriori object
+    apriori = Apriori(min_support=2)
+
+    # The frequent 2-itemsets
+    frequent_itemsets = {
+        Itemset(frozenset({Item("Apple"), Item("Cherry")})),
+        Itemset(frozenset({Item("Apple"), Item("Dragonfruit")})),
+        Itemset(frozenset({Item("Banana"), Item("Cherry")})),
+    }
+
+    # Trim the dataset for the 3-itemsets
+    trimmed_dataset = apriori._trim_dataset(small_fruit_dataset, frequent_itemsets, 3)
+
+    # Only the transactions with three items survive (no item is dropped from them)
+    expected_items = {
+        frozenset({Item("Apple"), Item("Banana"), Item("Cherry")}),
+        frozenset({Item("Apple"), Item("Cherry"), Item("Dragonfruit")}),
+    }
+    assert len(trimmed_dataset.transactions) == 2
+    assert {transaction.items.items for transaction in trimmed_dataset.transactions} == expected_items
+
+
+def test_infrequent_items_are_removed(small_fruit_dataset):
+    """Test that items which are not part of a frequent itemset are removed from the transactions."""
+
+    # Create the Apriori object
+    apriori = Apriori(min_support=2)
+
+    # Banana and Dragonfruit are not frequent
+    frequent_itemsets = {
+        Itemset(frozenset({Item("Apple")})),
+        Itemset(frozenset({Item("Cherry")})),
+    }
+
+    # Trim the dataset for the 2-itemsets
+    trimmed_dataset = apriori._trim_dataset(small_fruit_dataset, frequent_itemsets, 2)
+
+    # Three transactions contain both Apple and Cherry
+    assert len(trimmed_dataset.transactions) == 3
+    for transaction in trimmed_dataset.transactions:
+        assert transaction.items.items == frozenset({Item("Apple"), Item("Cherry")})
+
+
+def test_transactions_that_become_equal_are_kept():
+    """Test that transactions with equal ids that become equal by trimming are still counted separately."""
+
+    # Both transactions become {A, B, C} once X and Y are trimmed
+    dataset = Dataset(
+        frozenset(
+            {
+                Transaction(1, Itemset(frozenset({Item("A"), Item("B"), Item("C"), Item("X")}))),
+                Transaction(1, Itemset(frozenset({Item("A"), Item("B"), Item("C"), Item("Y")}))),
+            }
+        )
+    )
+
+    # Trim the dataset directly
+    frequent_itemsets = {Itemset(frozenset({Item(name)})) for name in ["A", "B", "C"]}
+    trimmed_dataset = Apriori(min_support=2)._trim_dataset(dataset, frequent_itemsets, 2)
+    assert len(trimmed_dataset.transactions) == 2
+
+    # Fit with and without trimming
+    apriori = Apriori(min_support=2)
+    apriori.fit(dataset)
+    trimming_apriori = Apriori(min_support=2, trim_dataset=True)
+    trimming_apriori.fit(dataset)
+
+    assert len(apriori.frequent_itemsets) == 7
+    assert trimming_apriori.frequent_itemsets == apriori.frequent_itemsets
+    assert trimming_apriori.statistics.dataset_sizes == [2, 2, 2]
+
+
+@pytest.mark.parametrize("counting_method", ["scan", "hash_tree", "prefix_trie"])
+@pytest.mark.parametrize("min_support", [1, 5, 20])
+def test_fit_with_random_grocery_dataset(random_grocery_dataset, counting_method, min_support):
+    """Test that trimming does not change the frequent itemsets and that the dataset shrinks."""
+
+    # Fit with and without trimming
+    apriori = Apriori(min_support=min_support, counting_method=counting_method)
+    apriori.fit(random_grocery_dataset)
+    trimming_apriori = Apriori(
+        min_support=min_support, counting_method=counting_method, trim_dataset=True
+    )
+    trimming_apriori.fit(random_grocery_dataset)
+
+    assert trimming_apriori.frequent_itemsets == apriori.frequent_itemsets
+
+    # The dataset never grows and shrinks after the first level
+    dataset_sizes = trimming_apriori.statistics.dataset_sizes
+    assert dataset_sizes[0] == len(random_grocery_dataset.transactions)
+    assert all(size <= previous_size for previous_size, size in zip(dataset_sizes, dataset_sizes[1:]))
+    assert dataset_sizes[-1] < dataset_sizes[0]
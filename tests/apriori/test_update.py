@@ -0,0 +1,130 @@
+import pytest
+
+from apriori import Apriori
+
+from classes.dataset import Dataset
+from classes.itemset import Itemset
+from classes.tid_set_index import TIDSetIndex
+
+#####
+# Test the incremental update (FUP)
+#####
+
+
+def split_dataset(dataset, sizes):
+    """Split the transactions of the dataset (ordered by their ID) into datasets of the given sizes."""
+
+    transactions = sorted(dataset.transactions, key=lambda transaction: transaction.id)
+    datasets = []
+    start = 0
+    for size in sizes:
+        datasets.append(Dataset(frozenset(transactions[start : start + size])))
+        start += size
+    return datasets
+
+
+@pytest.mark.parametrize(
+    "parameters",
+    [
+        {},
+        {"keep_negative_border": True},
+        {"keep_negative_border": True, "pair_matrix_memory_limit": 0},
+        {"keep_negative_border": True, "counting_method": "tid_set"},
+        {"keep_negative_border": True, "pcy_bucket_count": 7},
+    ],
+)
+@pytest.mark.parametrize("min_support", [2, 6, 15])
+def test_update_with_random_grocery_dataset(random_grocery_dataset, parameters, min_support):
+    """Test that updating with increments finds the same frequent itemsets as a fit on all transactions."""
+
+    # Fit on the whole dataset
+    apriori = Apriori(min_support=min_support)
+    apriori.fit(random_grocery_dataset)
+
+    # Fit on the first 100 transactions and append the rest in two increments
+    fitted_dataset, *increments = split_dataset(random_grocery_dataset, [100, 10, 10])
+    updating_apriori = Apriori(min_support=min_support, **parameters)
+    updating_apriori.fit(fitted_dataset)
+    for increment in increments:
+        updating_apriori.update(increment)
+
+    assert updating_apriori.frequent_itemsets == apriori.frequent_itemsets
+    assert dict(updating_apriori.frequent_itemset_counts) == dict(apriori.frequent_itemset_counts)
+
+
+@pytest.mark.parametrize("mode", ["fit_sampled", "fit_dynamic", "fit_partitioned"])
+def test_update_after_out_of_core_modes(random_grocery_dataset, mode):
+    """Test that the out-of-core modes can be updated as well."""
+
+    apriori = Apriori(min_support=5)
+    apriori.fit(random_grocery_dataset)
+
+    fitted_dataset, increment = split_dataset(random_grocery_dataset, [110, 10])
+    updating_apriori = Apriori(min_support=5, keep_negative_border=True)
+    getattr(updating_apriori, mode)(
+        sorted(fitted_dataset.transactions, key=lambda transaction: transaction.id), 30
+    )
+    updating_apriori.update(increment)
+
+    assert dict(updating_apriori.frequent_itemset_counts) == dict(apriori.frequent_itemset_counts)
+
+
+def test_negative_border_avoids_rescans(random_grocery_dataset):
+    """Test that keeping the negative border avoids counting in the fitted transactions."""
+
+    fitted_dataset, increment = split_dataset(random_grocery_dataset, [110, 10])
+    rescanned_itemset_counts = []
+    for keep_negative_border in [False, True]:
+        apriori = Apriori(min_support=5, keep_negative_border=keep_negative_border)
+        apriori.fit(fitted_dataset)
+        apriori.update(increment)
+        rescanned_itemset_counts.append(apriori.statistics.rescanned_itemset_count)
+
+    assert rescanned_itemset_counts[1] < rescanned_itemset_counts[0]
+
+
+def test_update_before_fit(small_fruit_dataset):
+    """Test that an update needs a previous fit."""
+
+    with pytest.raises(ValueError):
+        Apriori().update(small_fruit_dataset)
+
+
+def test_update_builds_every_index_once(random_grocery_dataset, monkeypatch):
+    """Test that the indexes of the increment and of the fitted transactions are not rebuilt on every level."""
+
+    # Record the sizes of the indexed datasets
+    indexed_dataset_sizes = []
+    initialize = TIDSetIndex.__init__
+
+    def recording_initialize(self, dataset, *args, **kwargs):
+        indexed_dataset_sizes.append(len(dataset.transactions))
+        initialize(self, dataset, *args, **kwargs)
+
+    fitted_dataset, increment = split_dataset(random_grocery_dataset, [110, 10])
+    apriori = Apriori(min_support=3, counting_method="tid_set")
+    apriori.fit(fitted_dataset)
+    monkeypatch.setattr(TIDSetIndex, "__init__", recording_initialize)
+    apriori.update(increment)
+
+    assert apriori.statistics.rescanned_itemset_count > 0
+    assert len(apriori.statistics.counting_methods) > 2
+    assert sorted(indexed_dataset_sizes) == [10, 110]
+
+
+def test_equal_transactions_of_different_batches_are_counted(small_fruit_dataset):
+    """Test that a transaction appended again is counted as another occurrence."""
+
+    transaction = min(small_fruit_dataset.transactions, key=lambda transaction: transaction.id)
+    batch = Dataset(frozenset({transaction}))
+
+    # The transaction occurs three times after the second update
+    apriori = Apriori(min_support=3, counting_method="tid_set")
+    apriori.fit(batch)
+    apriori.update(batch)
+    assert not apriori.frequent_itemsets
+    apriori.update(batch)
+
+    # All seven subsets of the three items are frequent
+    assert len(apriori.frequent_itemsets) == 7
+    assert Itemset(frozenset(transaction.items.items)) in apriori.frequent_itemsets
@@ -1,3 +1,5 @@
+import random
+
 import pytest
 
 from classes.item import Item
@@ -68,3 +70,26 @@ def large_book_dataset():
     ]
 
     return Dataset(set(transactions))
+
+
+@pytest.fixture
+def random_grocery_dataset():
+    """Create a random (but reproducible) dataset with groceries."""
+
+    # Use a fixed seed to get the same dataset in every test run
+    rng = random.Random(42)
+
+    # Create some items (groceries)
+    groceries = [Item(f"Grocery {index}") for index in range(12)]
+
+    # Create transactions with a skewed item distribution
+    transactions = []
+    for transaction_id in range(1, 121):
+        items = {
+            grocery
+            for index, grocery in enumerate(groceries)
+            if rng.random() < 0.6 / (1 + index / 3)
+        }
+        transactions.append(Transaction(transaction_id, Itemset(frozenset(items))))
+
+    return Dataset(frozenset(transactions))
@@ -0,0 +1,107 @@
+import pytest
+
+from fpgrowth import FPgrowth
+
+from classes.array_fp_tree import ArrayFPTree
+from classes.fp_tree import FPTree
+from classes.item import Item
+from classes.item_tuple import ItemTuple
+
+#####
+# Test the array-backed FP-tree against the node-based FP-tree
+#####
+
+
+def _add_fruit_transactions(fp_tree):
+    """Add a few fruit transactions (sorted according to the f-list) to the given FP-tree."""
+    fp_tree.add_items_to_tree(ItemTuple(tuple([Item("Apple"), Item("Cherry"), Item("Banana")])))
+    fp_tree.add_items_to_tree(ItemTuple(tuple([Item("Cherry")])))
+    fp_tree.add_items_to_tree(ItemTuple(tuple([Item("Apple"), Item("Cherry"), Item("Banana")])), 2)
+    fp_tree.add_items_to_tree(ItemTuple(tuple([Item("Apple"), Item("Cherry"), Item("Dragonfruit")])))
+    fp_tree.add_items_to_tree(ItemTuple(tuple([Item("Apple"), Item("Dragonfruit")])))
+
+
+def test_array_fp_tree_matches_fp_tree():
+    """Test that the array-backed FP-tree has the same nodes, header table and prefix paths as an FPTree."""
+
+    fp_tree = FPTree()
+    array_fp_tree = ArrayFPTree()
+    assert array_fp_tree.is_empty() and array_fp_tree.is_single_path()
+
+    _add_fruit_transactions(fp_tree)
+    _add_fruit_transactions(array_fp_tree)
+
+    assert not array_fp_tree.is_empty()
+    assert not array_fp_tree.is_single_path()
+    assert array_fp_tree.get_node_count() == len(fp_tree.get_all_item_nodes()) == 6
+    assert array_fp_tree.get_size() > 0
+
+    # The header tables have the same items, overall occurrence counts and numbers of linked nodes
+    header_table = fp_tree.get_header_table()
+    array_header_table = array_fp_tree.get_header_table()
+    assert [element.item for element in array_header_table.elements] == [
+        element.item for element in header_table.elements
+    ]
+    for element in header_table.elements:
+        array_element = array_header_table.get_element(element.item)
+        assert array_element.overall_occurrence_count == element.overall_occurrence_count
+        assert len(array_element.node_links) == len(element.node_links)
+
+    # The prefix paths are the same (in any order)
+    for item in [Item("Apple"), Item("Banana"), Item("Cherry"), Item("Dragonfruit"), Item("Elderberry")]:
+        assert sorted(array_fp_tree.get_prefix_paths(item), key=str) == sorted(
+            fp_tree.get_prefix_paths(item), key=str
+        )
+    assert set(array_fp_tree.get_prefix_paths(Item("Dragonfruit"))) == {
+        ((Item("Apple"), Item("Cherry")), 1),
+        ((Item("Apple"),), 1),
+    }
+
+
+def test_array_fp_tree_with_single_path_and_indexed_children(monkeypatch):
+    """Test the single path of an array-backed FP-tree and the lookup of indexed children."""
+
+    # Index the children of every node with more than one child
+    monkeypatch.setattr(ArrayFPTree, "CHILD_INDEX_THRESHOLD", 1)
+
+    array_fp_tree = ArrayFPTree()
+    array_fp_tree.add_items_to_tree(ItemTuple(tuple([Item("Apple"), Item("Banana")])), 3)
+    array_fp_tree.add_items_to_tree(ItemTuple(tuple([Item("Apple")])))
+    assert array_fp_tree.is_single_path()
+    assert array_fp_tree.get_single_path() == [(Item("Apple"), 4), (Item("Banana"), 3)]
+
+    # A second child of the root makes the tree branch, further insertions use the index of the root
+    array_fp_tree.add_items_to_tree(ItemTuple(tuple([Item("Banana")])))
+    array_fp_tree.add_items_to_tree(ItemTuple(tuple([Item("Cherry")])))
+    array_fp_tree.add_items_to_tree(ItemTuple(tuple([Item("Banana")])), 2)
+    array_fp_tree.add_items_to_tree(ItemTuple(tuple([Item("Apple"), Item("Banana")])))
+    assert not array_fp_tree.is_single_path()
+    assert 0 in array_fp_tree.child_indexes
+    assert array_fp_tree.get_node_count() == 4
+    assert array_fp_tree.get_header_table().get_element(Item("Banana")).overall_occurrence_count == 7
+    assert array_fp_tree.get_prefix_paths(Item("Banana")) == [((Item("Apple"),), 4)]
+
+
+#####
+# Test the fit with the array-backed FP-tree
+#####
+
+
+@pytest.mark.parametrize("min_support", [1, 2, 3])
+def test_fit_with_arrays_matches_fit_with_nodes(large_book_dataset, random_grocery_dataset, min_support):
+    """Test that both FP-tree backends find the same frequent itemsets."""
+
+    for dataset in [large_book_dataset, random_grocery_dataset]:
+        fpgrowth_with_nodes = FPgrowth(min_support=min_support)
+        fpgrowth_with_nodes.fit(dataset)
+        fpgrowth_with_arrays = FPgrowth(min_support=min_support, fp_tree_backend="arrays")
+        fpgrowth_with_arrays.fit(dataset)
+
+        assert fpgrowth_with_arrays.frequent_itemsets == fpgrowth_with_nodes.frequent_itemsets
+
+
+def test_unknown_fp_tree_backend_is_rejected():
+    """Test that an unknown FP-tree backend raises a ValueError."""
+
+    with pytest.raises(ValueError):
+        FPgrowth(min_support=2, fp_tree_backend="numpy")
@@ -381,3 +381,28 @@ def test_with_large_book_dataset_and_min_support_of_two(large_book_dataset):
     assert (
         fp_tree == expected_fp_tree
     ), f"The returned FP-tree is not as expected.\n Returned FP-tree:\n {fp_tree} \n\n Expected FP-tree:\n {expected_fp_tree}."
+
+
+#####
+# Test the item-keyed children of the FP-tree nodes
+#####
+
+
+def test_children_are_keyed_by_their_items():
+    """Test that a shared prefix is inserted once and that the children can be looked up by their items."""
+
+    fp_tree = FPTree()
+    fp_tree.add_items_to_tree(ItemTuple(tuple([Item("Apple"), Item("Cherry")])))
+    fp_tree.add_items_to_tree(ItemTuple(tuple([Item("Apple"), Item("Banana")])), 2)
+    fp_tree.add_items_to_tree(ItemTuple(tuple([Item("Banana")])))
+
+    # The root has one child per first item
+    assert list(fp_tree.root.children) == [Item("Apple"), Item("Banana")]
+    apple_node = fp_tree.root.children[Item("Apple")]
+    assert apple_node.occurrence_count == 3
+    assert apple_node.children[Item("Banana")].occurrence_count == 2
+    assert apple_node.children[Item("Banana")].parent is apple_node
+
+    # The list view contains the same children in insertion order
+    assert fp_tree.root.childs == [apple_node, fp_tree.root.children[Item("Banana")]]
+    assert [child.item for child in apple_node.childs] == [Item("Cherry"), Item("Banana")]
@@ -0,0 +1,77 @@
+import sys
+
+from fpgrowth import FPgrowth
+
+from classes.fp_tree import FPTree
+from classes.fp_tree_header_table import FPTreeHeaderTable
+from classes.item import Item
+from classes.item_tuple import ItemTuple
+
+#####
+# Test the traversals of FP-trees that are deeper than the recursion limit
+#####
+
+
+def _build_deep_fp_tree():
+    """Build an FP-tree with a path that is deeper than the recursion limit and a short second path."""
+    depth = sys.getrecursionlimit() + 100
+    items = tuple(Item(f"Item {index}") for index in range(depth))
+
+    fp_tree = FPTree()
+    fp_tree.add_items_to_tree(ItemTuple(items))
+    fp_tree.add_items_to_tree(ItemTuple(items), 2)
+    fp_tree.add_items_to_tree(ItemTuple(items[:2] + (Item("Leaf"),)))
+    return fp_tree, items
+
+
+def test_traversals_of_a_deep_fp_tree():
+    """Test that the traversals of a deep FP-tree do not exceed the recursion limit."""
+
+    fp_tree, items = _build_deep_fp_tree()
+    other_fp_tree, _ = _build_deep_fp_tree()
+
+    assert not fp_tree.is_single_path()
+    assert len(fp_tree.get_all_item_nodes()) == len(items) + 1
+    assert fp_tree == other_fp_tree
+    assert str(fp_tree).count("\n") == len(items) + 1
+
+    # The predecessors of the deepest node are all other nodes of the path (starting below the root)
+    deepest_node = fp_tree.get_header_table().get_element(items[-1]).node_links[0]
+    predecessors = deepest_node.get_predecessors()
+    assert isinstance(predecessors, tuple)
+    assert tuple(node.item for node in predecessors) == items[:-1]
+
+    # The conditional pattern base of the deepest item
+    conditional_pattern_base = FPgrowth(min_support=2)._get_conditional_pattern_base(items[-1], fp_tree)
+    assert [
+        (pattern.prefix_items.items, pattern.occurrence_count)
+        for pattern in conditional_pattern_base.conditional_patterns
+    ] == [(items[:-1], 3)]
+
+    # A header table rebuilt by walking the tree
+    rebuilt_header_table = FPTreeHeaderTable()
+    fp_tree.root.add_to_header_table(rebuilt_header_table)
+    assert [element.item for element in rebuilt_header_table.elements] == list(items) + [Item("Leaf")]
+    assert rebuilt_header_table.get_element(items[1]).overall_occurrence_count == 4
+
+
+def test_string_representation_and_equality_of_an_fp_tree():
+    """Test the string representation of an FP-tree and that unequal subtrees are detected."""
+
+    fp_tree = FPTree()
+    fp_tree.add_items_to_tree(ItemTuple(tuple([Item("Apple"), Item("Cherry"), Item("Banana")])))
+    fp_tree.add_items_to_tree(ItemTuple(tuple([Item("Apple"), Item("Dragonfruit")])), 2)
+    fp_tree.add_items_to_tree(ItemTuple(tuple([Item("Cherry")])))
+
+    assert str(fp_tree) == (
+        "Root\n├── Apple: 3\n  ├── Cherry: 1\n    ├── Banana: 1\n  ├── Dragonfruit: 2\n├── Cherry: 1"
+    )
+
+    # A tree that only differs in a leaf is not equal
+    other_fp_tree = FPTree()
+    other_fp_tree.add_items_to_tree(ItemTuple(tuple([Item("Apple"), Item("Cherry"), Item("Banana")])))
+    other_fp_tree.add_items_to_tree(ItemTuple(tuple([Item("Apple"), Item("Dragonfruit")])), 2)
+    other_fp_tree.add_items_to_tree(ItemTuple(tuple([Item("Cherry")])))
+    assert fp_tree == other_fp_tree
+    other_fp_tree.add_items_to_tree(ItemTuple(tuple([Item("Apple"), Item("Cherry"), Item("Elderberry")])))
+    assert fp_tree != other_fp_tree
@@ -0,0 +1,58 @@
+from fpgrowth import FPgrowth
+
+from classes.item import Item
+from classes.item_tuple import ItemTuple
+from classes.conditional_pattern_base import ConditionalPatternBase
+from classes.conditional_pattern import ConditionalPattern
+
+#####
+# Test the removal of infrequent items from a conditional pattern base
+#####
+
+
+def test_infrequent_items_are_removed_and_equal_patterns_are_merged():
+    """
+    Test that the items below the minimum support are removed, the remaining items are sorted according
+    to the f-list and patterns that become equal keep their summed occurrence count.
+    """
+
+    # Initialize the FP-growth algorithm with a minimum support of 2
+    fpgrowth = FPgrowth(min_support=2)
+
+    # Conditional pattern base
+    conditional_pattern_base = ConditionalPatternBase(
+        {
+            ConditionalPattern(
+                prefix_items=ItemTuple((Item("Apple"), Item("Cherry"), Item("Banana"))),
+                occurrence_count=1,
+            ),
+            ConditionalPattern(
+                prefix_items=ItemTuple((Item("Apple"), Item("Dragonfruit"), Item("Banana"))),
+                occurrence_count=1,
+            ),
+            ConditionalPattern(
+                prefix_items=ItemTuple((Item("Elderberry"),)),
+                occurrence_count=1,
+            ),
+        }
+    )
+    item_ranks = {
+        Item("Apple"): 0,
+        Item("Banana"): 1,
+        Item("Cherry"): 2,
+        Item("Dragonfruit"): 3,
+        Item("Elderberry"): 4,
+    }
+
+    # Filter the conditional pattern base
+    filtered_conditional_pattern_base = fpgrowth._filter_conditional_pattern_base(
+        conditional_pattern_base, item_ranks
+    )
+
+    # Only Apple and Banana are frequent, the first two patterns become equal
+    assert filtered_conditional_pattern_base.conditional_patterns == {
+        ConditionalPattern(
+            prefix_items=ItemTuple((Item("Apple"), Item("Banana"))),
+            occurrence_count=2,
+        ),
+    }
@@ -1,3 +1,6 @@
+import pytest
+
+from apriori import Apriori
 from fpgrowth import FPgrowth
 
 from classes.item import Item
@@ -357,3 +360,21 @@ def test_with_large_book_dataset_and_min_support_of_three(large_book_dataset):
 
     assert not extra_itemsets, f"Extra itemsets: {extra_itemsets_text}."
     assert not missing_itemsets, f"Missing itemsets: {missing_itemsets_text}."
+
+
+#####
+# Test against Apriori
+#####
+
+
+@pytest.mark.parametrize("min_support", [2, 5, 10, 20])
+def test_with_random_grocery_dataset_matches_apriori(random_grocery_dataset, min_support):
+    """Test that FP-growth finds the same frequent itemsets as Apriori on the random grocery dataset."""
+
+    fpgrowth = FPgrowth(min_support=min_support)
+    fpgrowth.fit(random_grocery_dataset)
+
+    apriori = Apriori(min_support=min_support)
+    apriori.fit(random_grocery_dataset)
+
+    assert fpgrowth.frequent_itemsets == set(apriori.frequent_itemsets)
@@ -3,6 +3,7 @@ from fpgrowth import FPgrowth
 from classes.item import Item
 from classes.item_tuple import ItemTuple
 from classes.fp_tree import FPTree
+from classes.fp_tree_header_table import FPTreeHeaderTable
 from classes.conditional_pattern_base import ConditionalPatternBase
 from classes.conditional_pattern import ConditionalPattern
 
@@ -214,3 +215,42 @@ def test_with_multiple_correct_conditional_patterns():
             conditional_pattern
             in expected_conditional_pattern_base.conditional_patterns
         ), f"The conditional pattern {conditional_pattern_text}:{conditional_pattern.occurrence_count} should not be in the conditional pattern base. {fp_tree}"
+
+
+#####
+# Test the header table that is maintained while items are added
+#####
+
+
+def test_header_table_is_maintained_while_items_are_added():
+    """Test that the header table of an FP-tree is up to date after every insertion and matches a rebuilt one."""
+
+    fp_tree = FPTree()
+    fp_tree.add_items_to_tree(ItemTuple(tuple([Item("Apple"), Item("Cherry")])))
+    assert fp_tree.get_header_table().get_element(Item("Banana")) is None
+
+    fp_tree.add_items_to_tree(ItemTuple(tuple([Item("Apple"), Item("Banana")])), 2)
+    fp_tree.add_items_to_tree(ItemTuple(tuple([Item("Banana")])))
+
+    # The overall occurrence counts and the node links are up to date
+    header_table = fp_tree.get_header_table()
+    banana_element = header_table.get_element(Item("Banana"))
+    assert banana_element.overall_occurrence_count == 3
+    assert {node.parent.item if node.parent.parent else None for node in banana_element.node_links} == {
+        Item("Apple"),
+        None,
+    }
+    assert header_table.get_element(Item("Apple")).overall_occurrence_count == 3
+    assert [element.item for element in header_table.elements] == [
+        Item("Apple"),
+        Item("Cherry"),
+        Item("Banana"),
+    ]
+
+    # A header table rebuilt by walking the tree has the same counts and node links
+    rebuilt_header_table = FPTreeHeaderTable()
+    fp_tree.root.add_to_header_table(rebuilt_header_table)
+    for element in header_table.elements:
+        rebuilt_element = rebuilt_header_table.get_element(element.item)
+        assert rebuilt_element.overall_occurrence_count == element.overall_occurrence_count
+        assert set(map(id, rebuilt_element.node_links)) == set(map(id, element.node_links))